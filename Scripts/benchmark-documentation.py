@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the documentation scripts.
+
+Times the stages every documentation build goes through:
+
+    read    XMLFileReader.read_xml_file on every class file
+    write   XMLFileWriter.write_xml_file of every parsed class file
+    merge   build_combined_xml from build-documentation.py
+    format  format_xml_file from format-xml.py on a copy of every class file
+    wiki    create_class_wiki_page from xml-to-wiki.py for every class
+
+on the real Classes/ corpus and on scaled corpora, reporting the best time of several
+runs, throughput in members/s and MB/s of class XML, and the peak memory Python
+allocated during the stage (measured with tracemalloc in a separate, untimed run).
+
+Scaled corpora are copies of every class file under new class names by default, so
+their content matches Classes/ exactly; with --synthetic they are generated by
+generate-corpus.py instead, adding huge classes, long remarks and heavy overloads.
+
+Results can be saved as JSON and compared against an earlier run: a stage that got
+slower, or needed more memory, by more than the threshold is reported as a regression
+and the script exits with status 1.
+
+merge and format stream the class files, so their peak memory should not grow with
+the corpus. When they run on more than one corpus size, the peak on the largest corpus
+is checked against the smallest; growing by more than --memory-growth also exits with
+status 1.
+
+Usage:
+    python3 Scripts/benchmark-documentation.py --output baseline.json
+    python3 Scripts/benchmark-documentation.py --baseline baseline.json [--threshold 0.10]
+    python3 Scripts/benchmark-documentation.py --synthetic --scale 1 10 100 --stages read merge
+    python3 Scripts/benchmark-documentation.py --scale 1 10 100 --stages merge format --repeat 1
+"""
+
+import argparse
+import contextlib
+import gc
+import glob
+import json
+import os
+import platform
+import re
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.append(str(SCRIPTS_DIR))
+from xml_utils import XMLFileReader, XMLFileWriter, get_class_name_from_path, load_script, quiet_print as qprint
+import csharp_parser
+
+build_documentation = load_script('build-documentation.py')
+format_xml = load_script('format-xml.py')
+xml_to_wiki = load_script('xml-to-wiki.py')
+generate_corpus = load_script('generate-corpus.py')
+
+# Version of the results file format
+RESULTS_VERSION = 1
+
+STAGES = ('read', 'write', 'merge', 'format', 'wiki')
+
+# Stages that stream the class files, whose peak memory should not depend on corpus size
+STREAMING_STAGES = ('merge', 'format')
+
+# Default slowdown (or memory growth) that counts as a regression, as a fraction
+DEFAULT_THRESHOLD = 0.10
+
+# Default growth of a streaming stage's peak memory from the smallest to the largest
+# corpus that still counts as flat, as a fraction
+DEFAULT_MEMORY_GROWTH = 0.5
+
+
+def replicate_corpus(classes_dir, dest_dir, factor):
+    """
+    Create a corpus factor times the size of classes_dir by copying every class file
+    under new class names (Unit, Unit_2, Unit_3, ...), renaming its members to match.
+
+    Returns:
+        List of the class files written
+    """
+    os.makedirs(dest_dir, exist_ok=True)
+    written = []
+    for path in sorted(glob.glob(os.path.join(classes_dir, '*-Documentation.xml'))):
+        class_name = get_class_name_from_path(path)
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            content = f.read()
+        member_prefix = re.compile(r'(<member name="[A-Z]:)' + re.escape(class_name) + r'(?=[.("])')
+        for copy in range(1, factor + 1):
+            copy_name = class_name if copy == 1 else f"{class_name}_{copy}"
+            copy_path = os.path.join(dest_dir, f"{copy_name}-Documentation.xml")
+            with open(copy_path, 'w', encoding='utf-8', newline='') as f:
+                f.write(content if copy == 1 else member_prefix.sub(lambda m: m.group(1) + copy_name, content))
+            written.append(copy_path)
+    return written
+
+
+class Corpus:
+    """
+    A directory of class files.
+
+    The files are parsed the first time a stage needs parsed input (write and wiki) and
+    kept for later runs, so corpora that only run the streaming stages are never held
+    in memory.
+    """
+
+    def __init__(self, name, classes_dir):
+        self.name = name
+        self.classes_dir = os.path.abspath(classes_dir)
+        self.files = sorted(glob.glob(os.path.join(self.classes_dir, '*-Documentation.xml')))
+        self.bytes = sum(os.path.getsize(path) for path in self.files)
+        self.members = sum(1 for path in self.files
+                           for event in XMLFileReader.iter_xml_events(path) if event.kind == 'member')
+        self._parsed = None
+
+    @property
+    def parsed(self):
+        """Dict of class file path -> XMLFileReader.read_xml_file() result"""
+        if self._parsed is None:
+            self._parsed = {path: XMLFileReader.read_xml_file(path) for path in self.files}
+        return self._parsed
+
+    def wiki_members(self):
+        """
+        Group the corpus's members by class the way xml-to-wiki.py does.
+
+        Returns:
+            Dict of class name -> list of wiki member info dicts
+        """
+        classes = defaultdict(list)
+        for data in self.parsed.values():
+            for section in data['sections'].values():
+                for subsection in section['subsections'].values():
+                    for record in subsection['members']:
+                        if record.name and not record.name.startswith('T:'):
+                            classes[xml_to_wiki.extract_class_name(record.name)].append(
+                                xml_to_wiki.member_info_from_record(record))
+        return classes
+
+
+def _no_log(*args, **kwargs):
+    pass
+
+
+def _fresh_dir(path):
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path)
+
+
+def prepare_stage(stage, corpus, work_dir):
+    """
+    Set up one run of a stage: everything that isn't part of the stage itself (clean
+    output directory, parsed input) is done here, outside the timed region.
+
+    Returns:
+        Function that runs the stage once
+    """
+    output_dir = os.path.join(work_dir, stage)
+    _fresh_dir(output_dir)
+
+    if stage == 'read':
+        def run():
+            for path in corpus.files:
+                XMLFileReader.read_xml_file(path)
+    elif stage == 'write':
+        parsed = corpus.parsed
+
+        def run():
+            for path, data in parsed.items():
+                XMLFileWriter.write_xml_file(os.path.join(output_dir, os.path.basename(path)), data)
+    elif stage == 'merge':
+        def run():
+            build_documentation.build_combined_xml(corpus.classes_dir, output_dir, use_cache=False)
+    elif stage == 'format':
+        paths = []
+        for path in corpus.files:
+            paths.append(os.path.join(output_dir, os.path.basename(path)))
+            shutil.copyfile(path, paths[-1])
+
+        def run():
+            for path in paths:
+                format_xml.format_xml_file(path, log=_no_log)
+    elif stage == 'wiki':
+        classes = corpus.wiki_members()
+        for class_name in classes:
+            xml_to_wiki.load_source_signatures(class_name, _no_log)
+        wiki_dir = Path(output_dir)
+
+        def run():
+            for class_name, members in classes.items():
+                xml_to_wiki.create_class_wiki_page(class_name, members, wiki_dir, _no_log)
+    else:
+        raise ValueError(f"Unknown stage: {stage}")
+    return run
+
+
+def measure_stage(stage, corpus, work_dir, repeat=3, measure_memory=True):
+    """
+    Time a stage repeat times and optionally measure its peak memory.
+
+    Returns:
+        Result dict for the results file
+    """
+    times = []
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(repeat):
+            run = prepare_stage(stage, corpus, work_dir)
+            gc.collect()
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+
+        peak = None
+        if measure_memory:
+            run = prepare_stage(stage, corpus, work_dir)
+            gc.collect()
+            tracemalloc.start()
+            try:
+                run()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+    seconds = min(times)
+    return {
+        'corpus': corpus.name,
+        'stage': stage,
+        'files': len(corpus.files),
+        'members': corpus.members,
+        'bytes': corpus.bytes,
+        'seconds': seconds,
+        'times': times,
+        'members_per_second': corpus.members / seconds if seconds else None,
+        'mb_per_second': corpus.bytes / 1e6 / seconds if seconds else None,
+        'peak_memory_mb': peak / 1e6 if peak is not None else None
+    }
+
+
+def run_benchmarks(corpora, stages, work_dir, repeat=3, measure_memory=True):
+    """
+    Measure every stage on every corpus, printing each result as it completes.
+
+    Returns:
+        Dict of "corpus/stage" -> result dict
+    """
+    results = {}
+    qprint(f"{'Corpus':<15} {'Stage':<6} {'Files':>7} {'Members':>9} {'Best (ms)':>10} "
+           f"{'Members/s':>11} {'MB/s':>7} {'Peak MB':>8}")
+    for corpus in corpora:
+        for stage in stages:
+            result = measure_stage(stage, corpus, work_dir, repeat, measure_memory)
+            results[f"{corpus.name}/{stage}"] = result
+            peak = '-' if result['peak_memory_mb'] is None else f"{result['peak_memory_mb']:.1f}"
+            qprint(f"{corpus.name:<15} {stage:<6} {result['files']:>7,} {result['members']:>9,} "
+                   f"{result['seconds'] * 1000:>10.1f} {result['members_per_second']:>11,.0f} "
+                   f"{result['mb_per_second']:>7.1f} {peak:>8}")
+    return results
+
+
+def compare_results(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare results against a baseline results dict and print the differences.
+
+    Time and peak memory both count: a stage is a regression if either grew by more
+    than threshold (a fraction, e.g. 0.10 for 10%).
+
+    Returns:
+        List of "corpus/stage" keys that regressed
+    """
+    regressions = []
+    previous_results = baseline.get('results', {})
+    qprint(f"\nComparison with baseline (threshold {threshold:.0%}):")
+    for key, result in results.items():
+        previous = previous_results.get(key)
+        if previous is None:
+            qprint(f"  {key:<24} no baseline")
+            continue
+
+        changes = []
+        regressed = False
+        for metric, label, unit, scale in (('seconds', 'time', 'ms', 1000), ('peak_memory_mb', 'memory', 'MB', 1)):
+            current, before = result.get(metric), previous.get(metric)
+            if current is None or not before:
+                continue
+            change = current / before - 1
+            changes.append(f"{label} {current * scale:.1f} {unit} vs {before * scale:.1f} {unit} ({change:+.1%})")
+            regressed = regressed or change > threshold
+        if regressed:
+            regressions.append(key)
+        qprint(f"  {key:<24} {'   '.join(changes)}{'   REGRESSION' if regressed else ''}")
+
+    if regressions:
+        qprint(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+    else:
+        qprint("\nNo regressions")
+    return regressions
+
+
+def check_memory_scaling(results, corpora, max_growth=DEFAULT_MEMORY_GROWTH):
+    """
+    Check that the streaming stages' peak memory stays flat as the corpus grows.
+
+    For each streaming stage measured on at least two corpora, the peak memory on the
+    largest corpus is compared with the smallest; growth by more than max_growth (a
+    fraction) while the corpus grew counts as a failure.
+
+    Returns:
+        List of the stages whose memory grew with the corpus
+    """
+    by_size = sorted(corpora, key=lambda corpus: corpus.bytes)
+    smallest, largest = by_size[0], by_size[-1]
+    stages = [stage for stage in STREAMING_STAGES
+              if results.get(f"{smallest.name}/{stage}", {}).get('peak_memory_mb')
+              and results.get(f"{largest.name}/{stage}", {}).get('peak_memory_mb')]
+    if smallest is largest or not stages:
+        return []
+
+    failures = []
+    qprint(f"\nPeak memory of the streaming stages, {smallest.name} ({smallest.bytes / 1e6:.1f} MB) to "
+           f"{largest.name} ({largest.bytes / 1e6:.1f} MB), limit {max_growth:+.0%}:")
+    for stage in stages:
+        before = results[f"{smallest.name}/{stage}"]['peak_memory_mb']
+        after = results[f"{largest.name}/{stage}"]['peak_memory_mb']
+        growth = after / before - 1
+        flat = growth <= max_growth
+        if not flat:
+            failures.append(stage)
+        qprint(f"  {stage:<8} {before:.1f} MB -> {after:.1f} MB ({growth:+.1%})   {'flat' if flat else 'GROWS WITH CORPUS'}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark reading, writing, merging and wiki generation on real and scaled corpora'
+    )
+    parser.add_argument('--classes-dir', default=str(SCRIPTS_DIR.parent / 'Classes'),
+                        help='Directory with the class XML files (default: Classes/ in the repository)')
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10], metavar='N',
+                        help='Corpus sizes to benchmark, as multiples of the class files (default: 1 10)')
+    parser.add_argument('--synthetic', action='store_true',
+                        help='Generate the scaled corpora with generate-corpus.py instead of copying Classes/')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=list(STAGES),
+                        help='Stages to benchmark (default: all)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per stage; the best is reported (default: 3)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the peak memory measurement')
+    parser.add_argument('--output', help='Save the results to this JSON file')
+    parser.add_argument('--baseline', help='Compare against results saved earlier with --output')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, metavar='FRACTION',
+                        help=f'Slowdown or memory growth that counts as a regression (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--memory-growth', type=float, default=DEFAULT_MEMORY_GROWTH, metavar='FRACTION',
+                        help=f'Growth of the streaming stages\' peak memory from the smallest to the largest '
+                             f'corpus that still counts as flat (default: {DEFAULT_MEMORY_GROWTH})')
+    parser.add_argument(
+        '--source-dir',
+        help=f'Decompiled Assembly-CSharp source directory to read declarations from '
+             f'(default: ${csharp_parser.SOURCE_DIR_ENV} or {csharp_parser.DEFAULT_SOURCE_DIR})'
+    )
+    args = parser.parse_args()
+
+    if args.source_dir:
+        csharp_parser.set_source_dir(os.path.abspath(args.source_dir))
+    if args.repeat < 1 or any(scale < 1 for scale in args.scale):
+        parser.error('--repeat and --scale must be at least 1')
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    with tempfile.TemporaryDirectory(prefix='documentation-benchmark-') as work_dir:
+        corpora = []
+        for scale in dict.fromkeys(args.scale):
+            if scale == 1:
+                corpora.append(Corpus('real', args.classes_dir))
+            else:
+                name = f"synthetic-x{scale}" if args.synthetic else f"x{scale}"
+                qprint(f"Creating the {name} corpus...")
+                corpus_dir = os.path.join(work_dir, f"corpus-{name}")
+                if args.synthetic:
+                    generate_corpus.generate_corpus(corpus_dir, generate_corpus.BASE_CLASS_COUNT * scale,
+                                                    huge_classes=scale // 10)
+                else:
+                    replicate_corpus(args.classes_dir, corpus_dir, scale)
+                corpora.append(Corpus(name, corpus_dir))
+
+        results = run_benchmarks(corpora, args.stages, work_dir, args.repeat, not args.no_memory)
+        memory_failures = check_memory_scaling(results, corpora, args.memory_growth)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': RESULTS_VERSION,
+                'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'environment': {
+                    'python': platform.python_version(),
+                    'implementation': platform.python_implementation(),
+                    'platform': platform.platform(),
+                    'cpu_count': os.cpu_count()
+                },
+                'repeat': args.repeat,
+                'results': results
+            }, f, indent=2)
+            f.write('\n')
+        qprint(f"\nSaved results to {args.output}")
+
+    regressions = compare_results(results, baseline, args.threshold) if baseline is not None else []
+    if regressions or memory_failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
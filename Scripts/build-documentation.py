@@ -4,19 +4,40 @@ Broforce Documentation Build Script
 
 Combines individual class XML documentation files into a single Assembly-CSharp.xml
 file that's compatible with .NET tooling (Visual Studio, IntelliSense, etc.).
+Also writes Assembly-CSharp.index.json, a member offset index used by MemberIndex
+to look up single members without parsing the whole file.
 
 This is the refactored version using xml_utils.
 
-Usage: python build-documentation.py
+Parsed class files are cached in Scripts/.cache/xml-parse, so unchanged files are not
+re-parsed on the next build. Pass --no-cache to parse everything from scratch, and --jobs N to parse class files
+in N worker processes (the output is identical to a serial build).
+
+Usage: python build-documentation.py [classes_dir] [output_dir] [--no-cache] [--jobs N]
 """
 
+import argparse
 import os
 import glob
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 # Import from xml_utils
-from xml_utils import XMLFileReader, XMLFileWriter, XMLFormatter, XMLPatterns, quiet_print as qprint
+from xml_utils import XMLFileReader, XMLFileWriter, XMLFormatter, XMLPatterns, MemberIndex, MemberIndexBuilder, XMLParseCache, quiet_print as qprint
+
+# Lines before and after the members of the combined XML file
+COMBINED_HEADER_LINES = [
+    '<?xml version="1.0" encoding="utf-8"?>',
+    '<doc>',
+    '    <assembly>',
+    '        <name>Assembly-CSharp</name>',
+    '    </assembly>',
+    '    <members>'
+]
+COMBINED_FOOTER_LINES = ['    </members>', '</doc>']
 
 
 def find_class_xml_files(classes_dir=None):
@@ -28,112 +49,254 @@ def find_class_xml_files(classes_dir=None):
     files.sort()  # Ensure consistent ordering
     return files
 
-def extract_sections_from_file(filepath):
-    """Returns the sections dict from XMLFileReader.read_xml_file()"""
+def extract_sections_from_file(filepath, cache=None):
+    """Returns the sections dict from XMLFileReader.read_xml_file(), using the parse cache if given"""
     try:
-        xml_data = XMLFileReader.read_xml_file(filepath)
+        if cache is not None:
+            xml_data = cache.read_xml_file(filepath)
+        else:
+            xml_data = XMLFileReader.read_xml_file(filepath)
         return xml_data['sections']
     except Exception as e:
         qprint(f"Error reading {filepath}: {e}")
         raise  # Re-raise the exception to make it fatal
 
-def build_combined_xml(classes_dir=None, output_dir=None):
-    """Main function to build the combined XML file."""
-    qprint("Building Assembly-CSharp.xml from individual class documentation files...")
+def prefix_comment(comment, class_name):
+    """Add the class name to a section comment: <!-- Foo Methods --> becomes <!-- Class - Foo Methods -->"""
+    if '<!--' in comment and '-->' in comment:
+        # Find the comment content between <!-- and -->
+        start = comment.find('<!--') + 4
+        end = comment.find('-->')
+        comment_content = comment[start:end].strip()
+        # Reconstruct comment with class prefix
+        return f"<!-- {class_name} - {comment_content} -->"
+    return comment
+
+def prefix_section(section_data, class_name):
+    """Returns a copy of section_data with its comments prefixed with the class name"""
+    prefixed_section_data = {
+        'comments': [prefix_comment(comment, class_name) for comment in section_data['comments']],
+        'subsections': {}
+    }
     
-    # Find all class documentation files
-    class_files = find_class_xml_files(classes_dir)
+    # Handle subsections if they exist
+    if section_data.get('subsections'):
+        for subsec_type, subsec_data in section_data['subsections'].items():
+            prefixed_section_data['subsections'][subsec_type] = {
+                'comment': prefix_comment(subsec_data['comment'], class_name),
+                'members': subsec_data['members'][:]  # Copy members list
+            }
     
-    if not class_files:
-        qprint(f"No class documentation files found ({os.path.join(classes_dir or '../Classes', '*-Documentation.xml')})")
-        return False
+    return prefixed_section_data
+
+def count_section_members(section_data):
+    """Count the members of a section (from subsections only - direct members no longer supported)"""
+    return sum(len(subsec_data['members']) for subsec_data in section_data.get('subsections', {}).values())
+
+def prefix_class_sections(filepath, cache=None):
+    """
+    Parse a class file and prefix its section comments with the class name.
     
-    qprint(f"Found {len(class_files)} class documentation files:")
+    Returns:
+        Tuple of (class_name, prefixed_sections, member_count). prefixed_sections is
+        an empty dict if the file has no sections.
+    """
+    class_name = os.path.basename(filepath).replace('-Documentation.xml', '')
     
-    # Build the proper data structure for XMLFileWriter
-    output_data = {
-        'header_lines': [
-            '<?xml version="1.0" encoding="utf-8"?>',
-            '<doc>',
-            '    <assembly>',
-            '        <name>Assembly-CSharp</name>',
-            '    </assembly>',
-            '    <members>'
-        ],
-        'footer_lines': ['    </members>', '</doc>'],
-        'sections': {}
-    }
+    # Extract sections from this file
+    file_sections = extract_sections_from_file(filepath, cache)
+    
+    prefixed_sections = {}
+    member_count = 0
+    
+    # Add sections from this file with class name prefix to avoid merging
+    for section_name, section_data in file_sections.items():
+        prefixed_sections[f"{class_name} - {section_name}"] = prefix_section(section_data, class_name)
+        member_count += count_section_members(section_data)
+    
+    return class_name, prefixed_sections, member_count
+
+def iter_class_sections(filepath, cache=None, stats=None):
+    """
+    Yield a class file's (section_name, section_data) pairs one section at a time.
+    
+    With a parse cache the whole file comes from the cache; without one the file is
+    streamed with XMLFileReader.iter_sections(). If reading fails, stats['read_error']
+    is set to the exception before it is re-raised.
+    """
+    try:
+        if cache is not None:
+            yield from cache.read_xml_file(filepath)['sections'].items()
+        else:
+            yield from XMLFileReader.iter_sections(filepath)
+    except Exception as e:
+        qprint(f"Error reading {filepath}: {e}")
+        if stats is not None:
+            stats['read_error'] = e
+        raise  # Re-raise the exception to make it fatal
+
+def iter_class_lines(filepath, cache=None, stats=None):
+    """
+    Generate a class file's lines of the combined XML file, one section at a time.
+    
+    stats is a dict whose 'sections' and 'members' counts are increased as the
+    sections are read.
+    """
+    if stats is None:
+        stats = {}
+    class_name = os.path.basename(filepath).replace('-Documentation.xml', '')
+    
+    for section_name, section_data in iter_class_sections(filepath, cache, stats):
+        # Prefix section names with the class name to avoid merging
+        prefixed_section_data = prefix_section(section_data, class_name)
+        XMLFileWriter.check_section(f"{class_name} - {section_name}", prefixed_section_data)
+        stats['sections'] = stats.get('sections', 0) + 1
+        stats['members'] = stats.get('members', 0) + count_section_members(section_data)
+        yield from XMLFileWriter.iter_section_lines(prefixed_section_data)
+
+def render_class_block(filepath, cache=None, stats=None):
+    """
+    Render a class file's part of the combined XML file.
+    
+    Returns:
+        Tuple of (block, members): the encoded lines and the [offset, length] of each
+        member element within the block. stats is updated as in iter_class_lines().
+    """
+    members = {}
+    
+    def add_member(name, offset, length):
+        # Keep the first occurrence if a name is duplicated
+        members.setdefault(name, [offset, length])
+    
+    lines = MemberIndex.iter_indexed_lines(iter_class_lines(filepath, cache, stats), add_member)
+    block = b''.join(XMLFileWriter.iter_line_chunks(lines))
+    return block, members
+
+def _render_class_block_worker(filepath, use_cache):
+    """
+    Process pool entry point for render_class_block().
+    
+    Each worker uses its own XMLParseCache, so the hit/miss counts are returned
+    alongside the result for the parent to aggregate. Errors are returned rather
+    than raised, with the stats that tell reading errors apart.
+    
+    Returns:
+        Tuple of (result, error, stats, hits, misses) where result is None on error
+    """
+    cache = XMLParseCache() if use_cache else None
+    stats = {'sections': 0, 'members': 0}
+    try:
+        result, error = render_class_block(filepath, cache, stats), None
+    except Exception as e:
+        result, error = None, e
+    hits, misses = (cache.hits, cache.misses) if cache is not None else (0, 0)
+    return result, error, stats, hits, misses
+
+def report_class_file(filepath, file_stats, stats):
+    """Report a merged class file and add its members to the build's stats"""
+    class_name = os.path.basename(filepath).replace('-Documentation.xml', '')
+    if file_stats['sections']:
+        stats['members'] += file_stats['members']
+        qprint(f"    Added {file_stats['members']} members from {class_name}")
+    else:
+        qprint(f"    Warning: No sections found in {filepath}")
+
+def iter_combined_lines(class_files, cache=None, stats=None):
+    """
+    Generate the lines of the combined XML file, holding one section of one class
+    file in memory at a time.
+    
+    stats is a dict whose 'members' count is increased as the class files are read;
+    'read_error' is set if a class file can't be read.
+    """
+    if stats is None:
+        stats = {'members': 0}
     
-    total_members = 0
+    yield from XMLFileWriter.iter_xml_lines({'header_lines': COMBINED_HEADER_LINES, 'footer_lines': [], 'sections': {}})
     
-    # Process each class file
     for filepath in class_files:
         qprint(f"  Processing {filepath}...")
-        
-        # Extract sections from this file
-        file_sections = extract_sections_from_file(filepath)
-        
-        if file_sections:
-            # Count members in this file
-            member_count = 0
-            for section_data in file_sections.values():
-                # Count from subsections only - direct members no longer supported
-                if section_data.get('subsections'):
-                    for subsec_data in section_data['subsections'].values():
-                        member_count += len(subsec_data['members'])
-            
-            class_name = os.path.basename(filepath).replace('-Documentation.xml', '')
+        file_stats = {'sections': 0, 'members': 0}
+        try:
+            yield from iter_class_lines(filepath, cache, file_stats)
+        finally:
+            if 'read_error' in file_stats:
+                stats['read_error'] = file_stats['read_error']
+        report_class_file(filepath, file_stats, stats)
+    
+    yield from XMLFileWriter.iter_xml_lines({'header_lines': [], 'footer_lines': COMBINED_FOOTER_LINES, 'sections': {}})
+
+def iter_combined_chunks(class_files, index_builder, cache=None, jobs=2, stats=None):
+    """
+    Generate the encoded combined XML file from class blocks rendered in a process pool.
+    
+    At most 2 * jobs class files are in flight at a time, and the blocks are yielded
+    in the order of class_files, so the output is identical to a serial build. The
+    member offsets of each block are added to index_builder (a MemberIndexBuilder)
+    as it is yielded; stats is updated as in iter_combined_lines().
+    """
+    if stats is None:
+        stats = {'members': 0}
+    
+    header = b''.join(XMLFileWriter.iter_xml_bytes({'header_lines': COMBINED_HEADER_LINES, 'footer_lines': [], 'sections': {}}))
+    footer = b''.join(XMLFileWriter.iter_xml_bytes({'header_lines': [], 'footer_lines': COMBINED_FOOTER_LINES, 'sections': {}}))
+    separator = b'\r\n'
+    
+    yield header
+    offset = len(header)
+    
+    use_cache = cache is not None
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        files = iter(class_files)
+        pending = deque((filepath, executor.submit(_render_class_block_worker, filepath, use_cache))
+                        for filepath in islice(files, 2 * jobs))
+        while pending:
+            filepath, future = pending.popleft()
+            for next_file in islice(files, 1):
+                pending.append((next_file, executor.submit(_render_class_block_worker, next_file, use_cache)))
             
-            # Add sections from this file with class name prefix to avoid merging
-            for section_name, section_data in file_sections.items():
-                # Create unique section name with class prefix
-                prefixed_section_name = f"{class_name} - {section_name}"
-                
-                # Create a copy of section_data to avoid modifying the original
-                prefixed_section_data = {
-                    'comments': [],
-                    'subsections': {}
-                }
-                
-                # Update comments to include class name
-                for comment in section_data['comments']:
-                    # Extract comment content and add class prefix
-                    if '<!--' in comment and '-->' in comment:
-                        # Find the comment content between <!-- and -->
-                        start = comment.find('<!--') + 4
-                        end = comment.find('-->')
-                        comment_content = comment[start:end].strip()
-                        # Reconstruct comment with class prefix
-                        prefixed_comment = f"<!-- {class_name} - {comment_content} -->"
-                        prefixed_section_data['comments'].append(prefixed_comment)
-                    else:
-                        prefixed_section_data['comments'].append(comment)
-                
-                # Handle subsections if they exist
-                if section_data.get('subsections'):
-                    for subsec_type, subsec_data in section_data['subsections'].items():
-                        # Update subsection comment to include class name
-                        subsec_comment = subsec_data['comment']
-                        if '<!--' in subsec_comment and '-->' in subsec_comment:
-                            start = subsec_comment.find('<!--') + 4
-                            end = subsec_comment.find('-->')
-                            comment_content = subsec_comment[start:end].strip()
-                            prefixed_comment = f"<!-- {class_name} - {comment_content} -->"
-                        else:
-                            prefixed_comment = subsec_comment
-                        
-                        prefixed_section_data['subsections'][subsec_type] = {
-                            'comment': prefixed_comment,
-                            'members': subsec_data['members'][:]  # Copy members list
-                        }
-                
-                # Add to output data
-                output_data['sections'][prefixed_section_name] = prefixed_section_data
+            result, error, file_stats, hits, misses = future.result()
+            if use_cache:
+                cache.hits += hits
+                cache.misses += misses
+            qprint(f"  Processing {filepath}...")
+            if error is not None:
+                if 'read_error' in file_stats:
+                    stats['read_error'] = error
+                raise error
             
-            total_members += member_count
-            qprint(f"    Added {member_count} members from {class_name}")
-        else:
-            qprint(f"    Warning: No sections found in {filepath}")
+            block, block_members = result
+            if block:
+                yield separator + block
+                offset += len(separator)
+                for name, (start, length) in block_members.items():
+                    index_builder.add(name, offset + start, length)
+                offset += len(block)
+            report_class_file(filepath, file_stats, stats)
+    
+    yield separator + footer
+
+def build_combined_xml(classes_dir=None, output_dir=None, use_cache=True, jobs=1):
+    """
+    Main function to build the combined XML file.
+    
+    The class files are streamed straight into the output in sorted file order and
+    the member index is collected from the byte offsets as it is written. Without
+    the parse cache, memory use is bounded by the largest section rather than the
+    size of the corpus; with it, by the largest class file.
+    """
+    qprint("Building Assembly-CSharp.xml from individual class documentation files...")
+    
+    cache = XMLParseCache() if use_cache else None
+    
+    # Find all class documentation files
+    class_files = find_class_xml_files(classes_dir)
+    
+    if not class_files:
+        qprint(f"No class documentation files found ({os.path.join(classes_dir or '../Classes', '*-Documentation.xml')})")
+        return False
+    
+    qprint(f"Found {len(class_files)} class documentation files:")
     
     # Write the combined XML file
     if output_dir is None:
@@ -141,45 +304,146 @@ def build_combined_xml(classes_dir=None, output_dir=None):
     else:
         output_file = os.path.join(output_dir, "Assembly-CSharp.xml")
     
+    stats = {'members': 0}
+    
     try:
-        # Use XMLFileWriter to write the file with proper subsection handling
-        XMLFileWriter.write_xml_file(output_file, output_data)
+        with MemberIndexBuilder() as index_builder:
+            # Process each class file, merging in sorted file order
+            if jobs <= 1 or len(class_files) <= 1:
+                lines = MemberIndex.iter_indexed_lines(iter_combined_lines(class_files, cache, stats),
+                                                       index_builder.add)
+                chunks = XMLFileWriter.iter_line_chunks(lines)
+            else:
+                chunks = iter_combined_chunks(class_files, index_builder, cache, jobs, stats)
+            written = XMLFileWriter.write_chunks(output_file, chunks, skip_unchanged=True)
+            
+            # Write the member offset index used for single-member lookups
+            index_file = index_builder.write(output_file)
         
-        qprint(f"\nSuccessfully built {output_file}")
-        qprint(f"Total members documented: {total_members}")
+        qprint(f"\nSuccessfully built {output_file}" + ("" if written else " (unchanged)"))
+        qprint(f"Member index written to {index_file}")
+        qprint(f"Total members documented: {stats['members']}")
         qprint(f"Classes processed: {len(class_files)}")
+        if cache is not None:
+            qprint(f"Parse cache: {cache.hits} hits, {cache.misses} misses")
         
         return True
         
     except Exception as e:
+        if 'read_error' in stats:
+            raise  # Class files that can't be read are fatal
         qprint(f"Error writing {output_file}: {e}")
         return False
 
+class CombinedXML:
+    """
+    The combined XML file kept in memory as one rendered block per class file.
+    
+    Rendering the whole file is a concatenation of the class blocks in sorted file
+    order, so when one class file changes only that file is re-parsed and re-rendered
+    and its block is spliced in. The written file is identical to build_combined_xml()'s.
+    
+    Usage:
+        combined = CombinedXML('../Assembly-CSharp.xml', XMLParseCache())
+        for filepath in find_class_xml_files():
+            combined.update(filepath)
+        combined.write()
+    """
+    
+    def __init__(self, output_file, cache=None):
+        self.output_file = output_file
+        self.cache = cache
+        self.blocks = {}
+        self.header = CombinedXML._render({'header_lines': COMBINED_HEADER_LINES, 'footer_lines': [], 'sections': {}})
+        self.footer = CombinedXML._render({'header_lines': [], 'footer_lines': COMBINED_FOOTER_LINES, 'sections': {}})
+    
+    @staticmethod
+    def _render(data):
+        return b''.join(XMLFileWriter.iter_xml_bytes(data))
+    
+    def update(self, filepath):
+        """
+        Re-parse a class file and replace its block.
+        
+        Raises ValueError or OSError if the file can't be parsed; the previous block
+        is kept in that case.
+        
+        Returns:
+            Tuple of (class_name, member_count)
+        """
+        class_name, prefixed_sections, member_count = prefix_class_sections(filepath, self.cache)
+        for section_name, section_data in prefixed_sections.items():
+            XMLFileWriter.check_section(section_name, section_data)
+        block = CombinedXML._render({'header_lines': [], 'footer_lines': [], 'sections': prefixed_sections})
+        self.blocks[filepath] = (class_name, block, member_count)
+        return class_name, member_count
+    
+    def remove(self, filepath):
+        """Drop a class file's block."""
+        self.blocks.pop(filepath, None)
+    
+    @property
+    def member_count(self):
+        return sum(member_count for _, _, member_count in self.blocks.values())
+    
+    def write(self):
+        """
+        Write the combined file and its member index.
+        
+        Returns:
+            True if the combined file changed and was written
+        """
+        blocks = [self.header] + [self.blocks[path][1] for path in sorted(self.blocks)] + [self.footer]
+        content = b'\r\n'.join(block for block in blocks if block)
+        written = XMLFileWriter.write_chunks(self.output_file, [content], skip_unchanged=True)
+        if written or not MemberIndex.is_current(self.output_file):
+            MemberIndex.write_index(self.output_file)
+        return written
+
 def main():
     """Main entry point."""
     qprint("Broforce Documentation Build Script")
     qprint("=" * 40)
     
     # Parse command line arguments
+    parser = argparse.ArgumentParser(
+        description='Combine Classes/*-Documentation.xml into Assembly-CSharp.xml'
+    )
+    parser.add_argument('classes_dir', nargs='?', help='Directory containing the class XML files')
+    parser.add_argument('output_dir', nargs='?', help='Directory to write Assembly-CSharp.xml to')
+    parser.add_argument('--test', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-parse every class file instead of using the on-disk parse cache'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Parse class files in N worker processes (0 = one per CPU core, default: 1)'
+    )
+    args = parser.parse_args()
+    
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    
     classes_dir = None
     output_dir = None
     
-    if len(sys.argv) > 1:
-        # Check for environment variable or argument for test mode
-        if sys.argv[1] == '--test' or os.environ.get('BUILD_DOC_TEST_MODE'):
-            # Don't change directory in test mode
-            classes_dir = os.environ.get('BUILD_DOC_CLASSES_DIR', '../Classes')
-            output_dir = os.environ.get('BUILD_DOC_OUTPUT_DIR', '..')
-        else:
-            classes_dir = sys.argv[1]
-            if len(sys.argv) > 2:
-                output_dir = sys.argv[2]
+    if args.test or (args.classes_dir and os.environ.get('BUILD_DOC_TEST_MODE')):
+        # Don't change directory in test mode
+        classes_dir = os.environ.get('BUILD_DOC_CLASSES_DIR', '../Classes')
+        output_dir = os.environ.get('BUILD_DOC_OUTPUT_DIR', '..')
+    elif args.classes_dir:
+        classes_dir = args.classes_dir
+        output_dir = args.output_dir
     else:
         # Change to script directory for normal operation
         script_dir = os.path.dirname(os.path.abspath(__file__))
         os.chdir(script_dir)
     
-    success = build_combined_xml(classes_dir, output_dir)
+    success = build_combined_xml(classes_dir, output_dir, use_cache=not args.no_cache, jobs=jobs)
     
     if success:
         qprint("\nBuild completed successfully!")
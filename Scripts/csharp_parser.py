@@ -0,0 +1,785 @@
+#!/usr/bin/env python3
+"""
+C# declaration scanner for Broforce's decompiled Assembly-CSharp source.
+
+Extracts the member declarations of a class (fields, properties, methods and nested types,
+with their access, modifiers and default parameter values) from its decompiled source file,
+so xml-to-wiki.py can show the real signatures instead of inferring them from the XML.
+
+Each file is tokenized in a single pass. Method and accessor bodies, field initializers and
+attributes are skipped with a brace-matching scan instead of being tokenized, since they make
+up most of the source text. Scan results are cached per file for the lifetime of the process.
+
+Source files are looked up in the directory named by the BROFORCE_SOURCE_DIR environment
+variable, or ../Assembly-CSharp next to this repository (e.g. a dnSpy/ILSpy project export),
+either as <ClassName>.cs directly in that directory or anywhere below it.
+
+Usage: python3 Scripts/csharp_parser.py [--source-dir DIR] [--benchmark] [class_name ...]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent))
+from xml_utils import quiet_print as qprint
+
+# Version of the scanner output. Bump this whenever the extracted signatures change
+# so cached signature tables are rebuilt.
+PARSER_VERSION = 1
+
+# Environment variable naming the decompiled source directory
+SOURCE_DIR_ENV = 'BROFORCE_SOURCE_DIR'
+
+# Default source directory, next to the repository like the GitHub.wiki checkout
+DEFAULT_SOURCE_DIR = Path(__file__).resolve().parent.parent.parent / 'Assembly-CSharp'
+
+ACCESS_MODIFIERS = {'public', 'private', 'protected', 'internal'}
+
+MEMBER_MODIFIERS = {
+    'static', 'virtual', 'override', 'abstract', 'sealed', 'readonly', 'const', 'extern',
+    'new', 'unsafe', 'volatile', 'async', 'partial', 'implicit', 'explicit', 'fixed'
+}
+
+TYPE_KEYWORDS = {'class', 'struct', 'interface', 'enum', 'record'}
+
+PARAMETER_MODIFIERS = {'ref', 'out', 'in', 'params', 'this'}
+
+# Metadata names of overloadable operators, as used in XML documentation member names
+OPERATOR_NAMES = {
+    '+': 'op_Addition', '-': 'op_Subtraction', '*': 'op_Multiply', '/': 'op_Division',
+    '%': 'op_Modulus', '&': 'op_BitwiseAnd', '|': 'op_BitwiseOr', '^': 'op_ExclusiveOr',
+    '<<': 'op_LeftShift', '>>': 'op_RightShift', '==': 'op_Equality', '!=': 'op_Inequality',
+    '<': 'op_LessThan', '>': 'op_GreaterThan', '<=': 'op_LessThanOrEqual',
+    '>=': 'op_GreaterThanOrEqual', '!': 'op_LogicalNot', '~': 'op_OnesComplement',
+    '++': 'op_Increment', '--': 'op_Decrement', 'true': 'op_True', 'false': 'op_False'
+}
+
+UNARY_OPERATOR_NAMES = {'+': 'op_UnaryPlus', '-': 'op_UnaryNegation'}
+
+# Declaration-level tokens. Each match consumes the whitespace, comments and preprocessor
+# lines in front of a token along with it. '>>' is deliberately not a token so nested
+# generics close one level at a time.
+_TOKEN = re.compile(r'''
+    \s*(?:(?://[^\n]*|/\*.*?\*/|\#[^\n]*)\s*)*
+    (?:
+        (?P<string>\$?@"(?:[^"]|"")*"|@\$"(?:[^"]|"")*"|\$?"(?:[^"\\\n]|\\.)*")
+      | (?P<char>'(?:[^'\\\n]|\\.)+')
+      | (?P<ident>@?(?!\d)\w+)
+      | (?P<number>\d\w*(?:\.\d\w*)?)
+      | (?P<op>=>|::|\?\?=?|\+\+|--|&&|\|\||<<=?|[<>=!+\-*/%&|^]=|\S)
+    )
+''', re.S | re.X)
+
+
+def _block_pattern(brackets):
+    """
+    Build a bracket-matching scan pattern for one kind of bracket. Long runs of other
+    characters are consumed at once, and strings, chars and comments are skipped so
+    brackets inside them don't count.
+    """
+    return re.compile(rf'''
+        [^{brackets}"'@$/]+
+      | //[^\n]* | /\*.*?\*/
+      | \$?@"(?:[^"]|"")*" | @\$"(?:[^"]|"")*" | \$?"(?:[^"\\\n]|\\.)*"
+      | '(?:[^'\\\n]|\\.)+'
+      | .
+    ''', re.S | re.X)
+
+
+# Scans over method/accessor bodies, attributes and parameter lists
+_BLOCK_TOKENS = {
+    '{': _block_pattern(r'{}'),
+    '[': _block_pattern(r'\[\]'),
+    '(': _block_pattern(r'()')
+}
+
+# Scan over initializer and expression-body text. A '<' only opens a nesting level if it
+# looks like the start of a generic argument list, so commas in new Dictionary<int, int>()
+# don't end a field declarator.
+_EXPRESSION_TOKEN = re.compile(r'''
+    [^{}()\[\]<>,;"'@$/]+
+  | //[^\n]* | /\*.*?\*/
+  | \$?@"(?:[^"]|"")*" | @\$"(?:[^"]|"")*" | \$?"(?:[^"\\\n]|\\.)*"
+  | '(?:[^'\\\n]|\\.)+'
+  | (?P<generic><)(?=[\w\s.,\[\]?<]*>)
+  | .
+''', re.S | re.X)
+
+_OPENERS = {'(': ')', '[': ']', '{': '}'}
+_CLOSERS = {')', ']', '}'}
+
+
+def get_source_dir():
+    """Return the decompiled source directory as a Path."""
+    return Path(os.environ.get(SOURCE_DIR_ENV) or DEFAULT_SOURCE_DIR)
+
+
+def set_source_dir(source_dir):
+    """
+    Set the decompiled source directory.
+
+    The directory is stored in the environment so worker processes started
+    afterwards look in the same place.
+    """
+    os.environ[SOURCE_DIR_ENV] = str(source_dir)
+
+
+@lru_cache(maxsize=8)
+def _source_file_index(source_dir):
+    """Map file names to paths for every .cs file below source_dir (first in sorted order wins)."""
+    index = {}
+    for root, dirs, files in os.walk(source_dir):
+        dirs.sort()
+        for filename in sorted(files):
+            if filename.endswith('.cs'):
+                index.setdefault(filename, os.path.join(root, filename))
+    return index
+
+
+def find_source_file(class_name):
+    """
+    Locate the source file declaring a class.
+
+    Args:
+        class_name: Class name like "TestVanDammeAnim" (nested classes like "Map.Block"
+                    are looked up in the file of the outermost class)
+
+    Returns:
+        Path of the .cs file as a string, or None if it can't be found
+    """
+    source_dir = get_source_dir()
+    filename = class_name.split('.')[0] + '.cs'
+
+    candidate = source_dir / filename
+    if candidate.is_file():
+        return str(candidate)
+
+    if not source_dir.is_dir():
+        return None
+    return _source_file_index(str(source_dir)).get(filename)
+
+
+def iter_tokens(text, pos=0):
+    """
+    Yield (kind, token, start, end) for each token in C# source, skipping whitespace,
+    comments and preprocessor lines. kind is one of 'string', 'char', 'ident', 'number', 'op'.
+    """
+    match = _TOKEN.match
+    while True:
+        m = match(text, pos)
+        if m is None:
+            return
+        kind = m.lastgroup
+        pos = m.end()
+        yield kind, m.group(kind), m.start(kind), pos
+
+
+def _next_token(text, pos):
+    """Return (token, start, end) of the next token at or after pos, or (None, pos, pos) at the end."""
+    for _, token, start, end in iter_tokens(text, pos):
+        return token, start, end
+    return None, pos, pos
+
+
+def _skip_block(text, pos, opener='{', closer='}'):
+    """Return the position just past the closer matching an opener that ends at pos."""
+    depth = 1
+    for m in _BLOCK_TOKENS[opener].finditer(text, pos):
+        char = m.group()
+        if char == opener:
+            depth += 1
+        elif char == closer:
+            depth -= 1
+            if depth == 0:
+                return m.end()
+    return len(text)
+
+
+def _skip_expression(text, pos, stops):
+    """
+    Skip an expression starting at pos up to the first top-level character in stops.
+
+    Returns:
+        Tuple of (position after the stop character, stop character). The stop character
+        is None if the text ended first.
+    """
+    depth = 0
+    angle_depth = 0
+    for m in _EXPRESSION_TOKEN.finditer(text, pos):
+        char = m.group()
+        if depth == 0 and angle_depth == 0 and char in stops:
+            return m.end(), char
+        if char in _OPENERS:
+            depth += 1
+        elif char in _CLOSERS:
+            if depth > 0:
+                depth -= 1
+        elif m.lastgroup == 'generic':
+            angle_depth += 1
+        elif char == '>' and angle_depth > 0:
+            angle_depth -= 1
+    return len(text), None
+
+
+def _collapse(text):
+    """Collapse runs of whitespace in declaration text to single spaces."""
+    return ' '.join(text.split())
+
+
+def _strip_verbatim(name):
+    """Remove the @ prefix C# uses to escape identifiers that are keywords."""
+    return name[1:] if name.startswith('@') else name
+
+
+def _split_modifiers(tokens):
+    """Return (access, modifiers, index of the first token after them)."""
+    access = []
+    modifiers = []
+    i = 0
+    while i < len(tokens):
+        token = tokens[i][0]
+        if token in ACCESS_MODIFIERS:
+            access.append(token)
+        elif token in MEMBER_MODIFIERS:
+            modifiers.append(token)
+        else:
+            break
+        i += 1
+    return access, modifiers, i
+
+
+def _split_top_level(tokens, separator=','):
+    """Split field declaration tokens on a separator outside of array ranks and generic argument lists."""
+    parts = [[]]
+    depth = 0
+    for token in tokens:
+        text = token[0]
+        if text == '[' or text == '<':
+            depth += 1
+        elif text == ']' or text == '>':
+            depth -= 1
+        elif text == separator and depth == 0:
+            parts.append([])
+            continue
+        parts[-1].append(token)
+    return parts
+
+
+def _type_declaration(tokens):
+    """Return (keyword, name) if the declaration tokens declare a type, otherwise None."""
+    for i, (token, _, _) in enumerate(tokens):
+        if token == '(':
+            return None
+        if token in TYPE_KEYWORDS:
+            for following, _, _ in tokens[i + 1:]:
+                if following not in TYPE_KEYWORDS:
+                    return token, _strip_verbatim(following)
+            return None
+    return None
+
+
+def _method_name(tokens, text, paren, first, type_name, modifiers):
+    """Return the metadata name of a method whose parameter list is tokens[paren]."""
+    names = [token for token, _, _ in tokens[:paren]]
+
+    if 'operator' in names:
+        operator_index = names.index('operator')
+        if 'implicit' in modifiers:
+            return 'op_Implicit'
+        if 'explicit' in modifiers:
+            return 'op_Explicit'
+        symbol = ''.join(names[operator_index + 1:])
+        if symbol in UNARY_OPERATOR_NAMES and ',' not in text[tokens[paren][1]:tokens[paren][2]]:
+            return UNARY_OPERATOR_NAMES[symbol]
+        return OPERATOR_NAMES.get(symbol, f"op_{symbol}")
+
+    # Step back over a generic parameter list (Foo<T>)
+    j = paren - 1
+    if names[j] == '>':
+        depth = 0
+        while j >= first:
+            if names[j] == '>':
+                depth += 1
+            elif names[j] == '<':
+                depth -= 1
+                if depth == 0:
+                    break
+            j -= 1
+        j -= 1
+
+    name = _strip_verbatim(names[j])
+    if j > first and names[j - 1] == '~':
+        return 'Finalize'
+    if j == first and name == type_name.split('.')[-1]:
+        return '#cctor' if 'static' in modifiers else '#ctor'
+    return name
+
+
+def _make_member(name, member_type, signature, access, modifiers, type_kind):
+    """Build the member dict returned by parse_csharp_file()."""
+    if access:
+        access_text = ' '.join(access)
+    else:
+        access_text = 'public' if type_kind == 'interface' else 'private'
+    return {
+        'name': name,
+        'type': member_type,
+        'signature': signature,
+        'access': access_text,
+        'modifiers': modifiers
+    }
+
+
+def _field_members(tokens, text, type_kind):
+    """
+    Build field members from a field declaration, which may declare several names.
+
+    Returns:
+        Tuple of (members, prefix tokens) - the prefix (modifiers and type) is reused for
+        declarators that follow an initializer.
+    """
+    access, modifiers, first = _split_modifiers(tokens)
+    if 'event' in (token for token, _, _ in tokens):
+        return [], []
+
+    members = []
+    prefix = []
+    prefix_text = ''
+    for part in _split_top_level(tokens[first:]):
+        if not part:
+            continue
+        if not prefix:
+            if len(part) < 2:
+                return [], []
+            prefix = tokens[:first] + part[:-1]
+            prefix_text = _collapse(text[prefix[0][1]:prefix[-1][2]])
+        name_token = part[-1][0]
+        if not (name_token[0].isalpha() or name_token[0] in '_@'):
+            continue
+        name = _strip_verbatim(name_token)
+        members.append(_make_member(name, 'field', f"{prefix_text} {name_token}", access, modifiers, type_kind))
+
+    return members, prefix
+
+
+def _declaration_member(tokens, text, type_name, type_kind):
+    """Build the method or property member for a declaration followed by a body or =>."""
+    access, modifiers, first = _split_modifiers(tokens)
+    names = [token for token, _, _ in tokens]
+    if first >= len(tokens) or 'event' in names:
+        return None
+
+    signature = _collapse(text[tokens[0][1]:tokens[-1][2]])
+
+    if '(' in names:
+        paren = names.index('(')
+        if paren <= first:
+            return None
+        name = _method_name(tokens, text, paren, first, type_name, modifiers)
+        return _make_member(name, 'method', signature, access, modifiers, type_kind)
+
+    if 'this' in names and '[' in names:
+        return _make_member('Item', 'property', signature, access, modifiers, type_kind)
+
+    return _make_member(_strip_verbatim(names[-1]), 'property', signature, access, modifiers, type_kind)
+
+
+def _scan_enum_body(text, pos):
+    """
+    Read the values of an enum whose body starts at pos.
+
+    Returns:
+        Tuple of (field members, position after the closing brace)
+    """
+    members = []
+    while True:
+        token, start, end = _next_token(text, pos)
+        if token is None:
+            return members, end
+        if token == '}':
+            return members, end
+        if token == ',':
+            pos = end
+            continue
+        if token == '[':
+            pos = _skip_block(text, end, '[', ']')
+            continue
+
+        name = _strip_verbatim(token)
+        signature = token
+        following, _, following_end = _next_token(text, end)
+        pos = end
+        if following == '=':
+            pos, stop = _skip_expression(text, following_end, ',}')
+            value_end = pos - 1 if stop else pos
+            signature = _collapse(text[start:value_end])
+            if stop == '}':
+                members.append(_make_member(name, 'field', signature, ['public'], [], 'enum'))
+                return members, pos
+        members.append(_make_member(name, 'field', signature, ['public'], [], 'enum'))
+
+
+def scan_declarations(text):
+    """
+    Scan C# source for type and member declarations.
+
+    Args:
+        text: C# source code
+
+    Returns:
+        Dict mapping type paths ("Outer", "Outer.Inner", without namespaces) to dicts with
+        'kind' (class/struct/interface/enum/record), 'members' (list of member dicts with
+        name, type, signature, access and modifiers) and 'nested' (names of nested types)
+    """
+    types = {}
+    scopes = []          # (kind, type path) - kind is 'namespace' or 'type'
+    pending = []         # (token, start, end) of the declaration being read
+    nesting = 0          # [ depth within pending
+    match = _TOKEN.match
+    pos = 0
+
+    while True:
+        m = match(text, pos)
+        if m is None:
+            break
+        kind = m.lastgroup
+        start = m.start(kind)
+        pos = m.end()
+        token = m.group(kind)
+
+        if token == '(':
+            # A parameter list is kept as a single '(' token spanning up to the closing ')'
+            pos = _skip_block(text, pos, '(', ')')
+            pending.append((token, start, pos))
+            continue
+
+        if nesting > 0:
+            if token == '[':
+                nesting += 1
+            elif token == ']':
+                nesting -= 1
+            pending.append((token, start, pos))
+            continue
+
+        scope_path = scopes[-1][1] if scopes and scopes[-1][0] == 'type' else None
+        type_info = types[scope_path] if scope_path is not None else None
+
+        if token == '[' and not pending:
+            # Attribute - nothing in it is part of a declaration
+            pos = _skip_block(text, pos, '[', ']')
+
+        elif token == '{':
+            type_declaration = _type_declaration(pending)
+            if type_declaration:
+                keyword, name = type_declaration
+                path = f"{scope_path}.{name}" if scope_path else name
+                if type_info is not None:
+                    type_info['nested'].append(name)
+                info = types.setdefault(path, {'kind': keyword, 'members': [], 'nested': []})
+                if keyword == 'enum':
+                    members, pos = _scan_enum_body(text, pos)
+                    info['members'].extend(members)
+                else:
+                    scopes.append(('type', path))
+            elif pending and pending[0][0] == 'namespace':
+                scopes.append(('namespace', None))
+            else:
+                if type_info is not None and pending:
+                    member = _declaration_member(pending, text, scope_path, type_info['kind'])
+                    if member:
+                        type_info['members'].append(member)
+                pos = _skip_block(text, pos)
+                # Auto-property initializer: int Foo { get; set; } = 5;
+                following, _, following_end = _next_token(text, pos)
+                if following == '=':
+                    pos, _ = _skip_expression(text, following_end, ';')
+            pending = []
+
+        elif token == '}':
+            if scopes:
+                scopes.pop()
+            pending = []
+
+        elif token == ';':
+            if type_info is not None and pending:
+                names = [t for t, _, _ in pending]
+                if 'delegate' in names:
+                    if '(' in names:
+                        type_info['nested'].append(_strip_verbatim(names[names.index('(') - 1]))
+                elif '(' in names:
+                    # Abstract, extern, partial or interface method
+                    member = _declaration_member(pending, text, scope_path, type_info['kind'])
+                    if member:
+                        type_info['members'].append(member)
+                else:
+                    members, _ = _field_members(pending, text, type_info['kind'])
+                    type_info['members'].extend(members)
+            pending = []
+
+        elif token == '=>':
+            if type_info is not None and pending:
+                member = _declaration_member(pending, text, scope_path, type_info['kind'])
+                if member:
+                    type_info['members'].append(member)
+            pos, _ = _skip_expression(text, pos, ';')
+            pending = []
+
+        elif token == '=' and type_info is not None and pending:
+            # Field initializer, possibly followed by more declarators
+            members, prefix = _field_members(pending, text, type_info['kind'])
+            type_info['members'].extend(members)
+            pos, stop = _skip_expression(text, pos, ',;')
+            pending = list(prefix) if stop == ',' else []
+
+        else:
+            if token == '[':
+                nesting += 1
+            pending.append((token, start, pos))
+
+    return types
+
+
+@lru_cache(maxsize=256)
+def _scan_source_file(source_path, size, mtime_ns):
+    """Read and scan a source file. size and mtime_ns are part of the cache key."""
+    with open(source_path, 'rb') as f:
+        text = f.read().decode('utf-8-sig', errors='replace')
+    return scan_declarations(text)
+
+
+def parse_csharp_file(class_name):
+    """
+    Extract the member declarations of a class from its source file.
+
+    Args:
+        class_name: Class name like "TestVanDammeAnim"
+
+    Returns:
+        Tuple of (members, nested_classes, error). members is a list of dicts with
+        'name', 'type' (method/property/field), 'signature', 'access' and 'modifiers';
+        nested_classes lists the names of the class's nested types. On failure members
+        and nested_classes are None and error describes the problem.
+    """
+    source_path = find_source_file(class_name)
+    if not source_path:
+        return None, None, f"No source file for {class_name} in {get_source_dir()}"
+
+    try:
+        stat = os.stat(source_path)
+        types = _scan_source_file(source_path, stat.st_size, stat.st_mtime_ns)
+    except OSError as e:
+        return None, None, str(e)
+
+    type_info = types.get(class_name)
+    if type_info is None:
+        return None, None, f"No declaration of {class_name} in {source_path}"
+
+    members = [dict(member, modifiers=list(member['modifiers'])) for member in type_info['members']]
+    return members, list(type_info['nested']), None
+
+
+@lru_cache(maxsize=8192)
+def _parse_parameter_list(signature):
+    """Parse a declaration's parameter list into a tuple of (type, name, modifier, default)."""
+    tokens = [(token, start, end) for _, token, start, end in iter_tokens(signature)]
+    names = [token for token, _, _ in tokens]
+    if '(' not in names:
+        return None
+
+    # Collect the tokens between the first '(' and its matching ')'
+    open_index = names.index('(')
+    depth = 0
+    close_index = None
+    for i in range(open_index, len(tokens)):
+        if names[i] in _OPENERS:
+            depth += 1
+        elif names[i] in _CLOSERS:
+            depth -= 1
+            if depth == 0:
+                close_index = i
+                break
+    if close_index is None:
+        return None
+
+    parameters = []
+    for part in _split_parameter_tokens(tokens[open_index + 1:close_index]):
+        # Skip parameter attributes like [Optional]
+        while part and part[0][0] == '[':
+            depth = 0
+            for i, (token, _, _) in enumerate(part):
+                if token == '[':
+                    depth += 1
+                elif token == ']':
+                    depth -= 1
+                    if depth == 0:
+                        part = part[i + 1:]
+                        break
+            else:
+                part = []
+        if not part:
+            continue
+
+        modifiers = []
+        while part and part[0][0] in PARAMETER_MODIFIERS:
+            modifiers.append(part[0][0])
+            part = part[1:]
+
+        default = None
+        part_names = [token for token, _, _ in part]
+        if '=' in part_names:
+            equals = part_names.index('=')
+            if equals + 1 < len(part):
+                default = _collapse(signature[part[equals + 1][1]:part[-1][2]])
+            part = part[:equals]
+
+        if not part:
+            continue
+        name = _strip_verbatim(part[-1][0])
+        param_type = _collapse(signature[part[0][1]:part[-2][2]]) if len(part) > 1 else None
+        parameters.append((param_type, name, ' '.join(modifiers) or None, default))
+
+    return tuple(parameters)
+
+
+def _split_parameter_tokens(tokens):
+    """Split parameter list tokens on top-level commas. Generic brackets only count before a default value."""
+    parts = [[]]
+    depth = 0
+    in_default = False
+    for token in tokens:
+        text = token[0]
+        if text in _OPENERS or (text == '<' and not in_default):
+            depth += 1
+        elif text in _CLOSERS or (text == '>' and not in_default):
+            depth -= 1
+        elif text == '=' and depth == 0:
+            in_default = True
+        elif text == ',' and depth == 0:
+            parts.append([])
+            in_default = False
+            continue
+        parts[-1].append(token)
+    return [part for part in parts if part]
+
+
+def parse_method_parameters(signature):
+    """
+    Parse the parameters of a method declaration.
+
+    Args:
+        signature: Declaration like "public void Damage(int damage, ref float x, bool knock = true)"
+
+    Returns:
+        List of dicts with 'type', 'name', 'modifier' (ref/out/in/params/this or None)
+        and 'default' (default value text or None), or None if the signature has no
+        parameter list
+    """
+    parameters = _parse_parameter_list(signature)
+    if parameters is None:
+        return None
+    return [
+        {'type': param_type, 'name': name, 'modifier': modifier, 'default': default}
+        for param_type, name, modifier, default in parameters
+    ]
+
+
+def benchmark_scanner(source_dir=None, repeat=3):
+    """
+    Measure scanner throughput over every .cs file in the source directory.
+
+    Files are read into memory first, so the timing covers scanning only. The
+    fastest of repeat passes is reported.
+
+    Returns:
+        Dict with 'files', 'bytes', 'types', 'members', 'seconds' and 'mb_per_second'
+    """
+    source_dir = str(source_dir or get_source_dir())
+    texts = []
+    total_bytes = 0
+    for source_path in _source_file_index(source_dir).values():
+        with open(source_path, 'rb') as f:
+            data = f.read()
+        total_bytes += len(data)
+        texts.append(data.decode('utf-8-sig', errors='replace'))
+
+    best = None
+    type_count = member_count = 0
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        results = [scan_declarations(text) for text in texts]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        type_count = sum(len(types) for types in results)
+        member_count = sum(len(info['members']) for types in results for info in types.values())
+
+    return {
+        'files': len(texts),
+        'bytes': total_bytes,
+        'types': type_count,
+        'members': member_count,
+        'seconds': best,
+        'mb_per_second': (total_bytes / (1024 * 1024)) / best if best else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Scan decompiled C# source for member declarations'
+    )
+    parser.add_argument('class_names', nargs='*', metavar='class_name', help='Classes to print the declarations of')
+    parser.add_argument(
+        '--source-dir',
+        help=f'Decompiled source directory (default: ${SOURCE_DIR_ENV} or {DEFAULT_SOURCE_DIR})'
+    )
+    parser.add_argument(
+        '--benchmark',
+        action='store_true',
+        help='Measure scanner throughput over every .cs file in the source directory'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        metavar='N',
+        help='Number of benchmark passes, the fastest is reported (default: 3)'
+    )
+    args = parser.parse_args()
+
+    if args.source_dir:
+        set_source_dir(args.source_dir)
+
+    source_dir = get_source_dir()
+    if not source_dir.is_dir():
+        qprint(f"Error: Source directory not found: {source_dir}")
+        sys.exit(1)
+
+    if args.benchmark:
+        result = benchmark_scanner(source_dir, args.repeat)
+        qprint(f"Scanned {result['files']} files ({result['bytes'] / (1024 * 1024):.2f} MB) "
+               f"in {result['seconds'] * 1000:.1f} ms: {result['mb_per_second']:.1f} MB/s")
+        qprint(f"Found {result['types']} types with {result['members']} members")
+
+    failed = False
+    for class_name in args.class_names:
+        members, nested_classes, error = parse_csharp_file(class_name)
+        if error:
+            qprint(f"Error: {error}")
+            failed = True
+            continue
+        qprint(f"{class_name}: {len(members)} members")
+        for member in members:
+            qprint(f"  [{member['type']}] {member['name']}: {member['signature']}")
+        if nested_classes:
+            qprint(f"  Nested types: {', '.join(nested_classes)}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,526 @@
+#!/usr/bin/env python3
+"""
+Resident documentation server for editor plugins.
+
+Loads Classes/*-Documentation.xml into an in-memory index once and answers JSON-RPC 2.0
+requests over stdio, so hover docs and completions don't pay for loading the XML on every
+request. While the server runs, class files are polled for changes and reloaded one file
+at a time.
+
+Messages are either one JSON object per line or framed with a Content-Length header as in
+the Language Server Protocol; each response uses the same framing as its request. Logging
+goes to stderr.
+
+Methods:
+    hover     {"name": "Unit.Damage"}               Docs for a member, name prefix or class
+    complete  {"prefix": "Unit.Dam", "limit": 50}   Members (or classes) starting with a prefix
+    members   {"class": "Unit", "kind": "method"}   Members of a class in document order
+    reload    {}                                    Reload changed class files now
+    stats     {}                                    Index size and request latency
+    shutdown  {}                                    Stop the server
+
+Names are resolved like lookup-member.py resolves them (see DocsStore.lookup()).
+
+Usage:
+    python3 Scripts/docs-server.py [--classes-dir DIR] [--poll-interval SECONDS]
+    python3 Scripts/docs-server.py --benchmark N
+"""
+
+import argparse
+import bisect
+import json
+import os
+import sys
+import threading
+import time
+from typing import NamedTuple
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from docs_store import (DEFAULT_CLASSES_DIR, first_sentence, format_lookup_results,
+                        normalize_lookup_query, read_class_members)
+from xml_utils import FileWatcher, get_class_name_from_path, quiet_print as qprint
+
+CLASS_FILE_SUFFIX = '-Documentation.xml'
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+# Appended to a prefix to get the end of its range in a sorted key list
+MAX_CHAR = '\U0010ffff'
+
+MEMBER_KINDS = ('method', 'property', 'field')
+
+
+def log(message):
+    """Log to stderr, since stdout carries the protocol."""
+    print(message, file=sys.stderr, flush=True)
+
+
+class InvalidParams(ValueError):
+    """Raised by request handlers when a request's params are missing or have the wrong type."""
+
+
+class InvalidHeader(ValueError):
+    """Raised by read_message() when a Content-Length header has no valid length."""
+
+
+class IndexState(NamedTuple):
+    """An immutable snapshot of the index, replaced as a whole on reload."""
+    classes: dict        # class name -> member dicts in document order
+    by_key: dict         # lookup_key -> member
+    by_name: dict        # lookup_name -> member dicts (all overloads)
+    keys: list           # sorted lookup keys, for prefix ranges
+    folded_keys: list    # sorted lowercase lookup keys, for case-insensitive prefixes
+    folded_originals: list  # lookup key for each entry of folded_keys
+    class_names: list    # sorted class names
+
+
+class DocsIndex:
+    """
+    In-memory index of the class documentation.
+
+    Lookups follow the same rules and MemberParser-based keys as DocsStore.lookup().
+    A reload builds a new IndexState and swaps it in with a single assignment, so
+    requests served while a reload runs see either the old or the new index.
+    """
+
+    def __init__(self, classes_dir=None):
+        self.classes_dir = classes_dir if classes_dir is not None else DEFAULT_CLASSES_DIR
+        self.watcher = FileWatcher(self.classes_dir, CLASS_FILE_SUFFIX)
+        self._reload_lock = threading.Lock()
+        self._classes = {}
+        for path in sorted(self.watcher.snapshot):
+            self._load_file(path)
+        self.state = self._build_state()
+
+    def _load_file(self, path):
+        """Load one class file, keeping the class's previous members if the file can't be read."""
+        class_name = get_class_name_from_path(path)
+        try:
+            self._classes[class_name] = read_class_members(class_name, path)
+        except (OSError, ValueError) as e:
+            log(f"Error loading {os.path.basename(path)}: {e}")
+            return False
+        return True
+
+    def _build_state(self):
+        by_key = {}
+        by_name = {}
+        for members in self._classes.values():
+            for member in members:
+                by_key.setdefault(member['lookup_key'], member)
+                by_name.setdefault(member['lookup_name'], []).append(member)
+
+        keys = sorted(by_key)
+        folded = sorted((key.lower(), key) for key in keys)
+        return IndexState(
+            classes=dict(self._classes),
+            by_key=by_key,
+            by_name=by_name,
+            keys=keys,
+            folded_keys=[folded_key for folded_key, _ in folded],
+            folded_originals=[key for _, key in folded],
+            class_names=sorted(self._classes),
+        )
+
+    def reload(self):
+        """
+        Reload the class files that changed on disk since the last check.
+
+        Returns:
+            Tuple of (reloaded class names, removed class names)
+        """
+        with self._reload_lock:
+            changed, removed = self.watcher.poll()
+            if not changed and not removed:
+                return [], []
+
+            reloaded = [get_class_name_from_path(path) for path in changed if self._load_file(path)]
+            removed = [get_class_name_from_path(path) for path in removed]
+            for class_name in removed:
+                self._classes.pop(class_name, None)
+            self.state = self._build_state()
+            return reloaded, removed
+
+    @staticmethod
+    def _prefix_range(keys, prefix):
+        return bisect.bisect_left(keys, prefix), bisect.bisect_left(keys, prefix + MAX_CHAR)
+
+    def _prefix_keys(self, state, prefix):
+        """Get the lookup keys starting with prefix, falling back to a case-insensitive match."""
+        start, end = self._prefix_range(state.keys, prefix)
+        if start < end:
+            return state.keys[start:end]
+        start, end = self._prefix_range(state.folded_keys, prefix.lower())
+        return state.folded_originals[start:end]
+
+    @staticmethod
+    def _filter(members, kind, limit):
+        matches = [member for member in members if kind is None or member['kind'] == kind]
+        return matches[:limit] if limit is not None else matches
+
+    def lookup(self, query, limit=50):
+        """
+        Find members by name, prefix or class.
+
+        Same arguments and results as DocsStore.lookup().
+        """
+        state = self.state
+        kind, class_name, key = normalize_lookup_query(query)
+
+        if not key:
+            members = self._filter(state.classes.get(class_name, ()), kind, limit)
+            if members:
+                return 'class', members
+            key = class_name
+        else:
+            member = state.by_key.get(key)
+            if member is not None and kind in (None, member['kind']):
+                return 'member', [member]
+            members = self._filter(state.by_name.get(key, ()), kind, limit)
+            if members:
+                return 'member', members
+
+        members = [state.by_key[match] for match in self._prefix_keys(state, key)]
+        members.sort(key=lambda member: (member['class'], member['position']))
+        members = self._filter(members, kind, limit)
+        return ('prefix', members) if members else (None, [])
+
+    def complete(self, prefix, limit=50):
+        """
+        Complete a member or class name.
+
+        Args:
+            prefix: "Unit.Dam", "Unit." for every member of Unit, or "Un" for class names.
+                    An M:, P: or F: prefix limits the results to that kind of member.
+            limit: Maximum number of completions
+
+        Returns:
+            List of completion dicts with 'label', 'name', 'kind' and 'summary', members in
+            alphabetical order of their keys
+        """
+        state = self.state
+        kind, class_name, key = normalize_lookup_query(prefix)
+        if not key and prefix.endswith('.'):
+            key = f"{class_name}."
+
+        if not key:
+            start, end = self._prefix_range(state.class_names, class_name)
+            return [{'label': name, 'name': name, 'kind': 'class', 'summary': ''}
+                    for name in state.class_names[start:min(end, start + limit)]]
+
+        completions = []
+        for match in self._prefix_keys(state, key):
+            member = state.by_key[match]
+            if kind is not None and member['kind'] != kind:
+                continue
+            completions.append({
+                'label': member['signature'],
+                'name': member['lookup_name'],
+                'kind': member['kind'],
+                'summary': first_sentence(member['summary']),
+            })
+            if len(completions) >= limit:
+                break
+        return completions
+
+    def class_members(self, class_name, kind=None):
+        """
+        List the members of a class in document order.
+
+        Returns:
+            List of dicts with 'name', 'signature', 'kind', 'section', 'subsection' and
+            'summary', or None if the class isn't documented
+        """
+        members = self.state.classes.get(class_name)
+        if members is None:
+            return None
+        return [{'name': member['name'], 'signature': member['signature'], 'kind': member['kind'],
+                 'section': member['section'], 'subsection': member['subsection'],
+                 'summary': first_sentence(member['summary'])}
+                for member in self._filter(members, kind, None)]
+
+
+def _get_param(params, name, expected_type, default=None, required=False):
+    """Get a request parameter, raising InvalidParams if it is missing or has the wrong type."""
+    if name not in params:
+        if required:
+            raise InvalidParams(f"missing parameter '{name}'")
+        return default
+    value = params[name]
+    if not isinstance(value, expected_type) or isinstance(value, bool) and expected_type is int:
+        raise InvalidParams(f"parameter '{name}' must be {expected_type.__name__}")
+    return value
+
+
+def _get_kind(params):
+    kind = _get_param(params, 'kind', str)
+    if kind is not None and kind not in MEMBER_KINDS:
+        raise InvalidParams(f"parameter 'kind' must be one of {', '.join(MEMBER_KINDS)}")
+    return kind
+
+
+class DocsServer:
+    """
+    JSON-RPC 2.0 request handling for a DocsIndex.
+
+    process() takes the text of one message and returns the text of its response,
+    so the same code serves stdio and the benchmark.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.methods = {
+            'hover': self.hover,
+            'complete': self.complete,
+            'members': self.members,
+            'reload': self.reload,
+            'stats': self.stats,
+            'shutdown': self.shutdown,
+        }
+        self.running = True
+        self.request_count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def hover(self, params):
+        name = _get_param(params, 'name', str, required=True)
+        limit = _get_param(params, 'limit', int, 50)
+        match, members = self.index.lookup(name, limit)
+        if match is None:
+            return None
+        return {'match': match, 'contents': '\n'.join(format_lookup_results(match, members)), 'members': members}
+
+    def complete(self, params):
+        prefix = _get_param(params, 'prefix', str, required=True)
+        return self.index.complete(prefix, _get_param(params, 'limit', int, 50))
+
+    def members(self, params):
+        class_name = _get_param(params, 'class', str, required=True)
+        return self.index.class_members(class_name, _get_kind(params))
+
+    def reload(self, params):
+        reloaded, removed = self.index.reload()
+        return {'reloaded': reloaded, 'removed': removed}
+
+    def stats(self, params):
+        state = self.index.state
+        return {
+            'classes': len(state.classes),
+            'members': sum(len(members) for members in state.classes.values()),
+            'requests': self.request_count,
+            'mean_ms': self.total_seconds * 1000 / self.request_count if self.request_count else 0.0,
+            'max_ms': self.max_seconds * 1000,
+        }
+
+    def shutdown(self, params):
+        self.running = False
+        return None
+
+    @staticmethod
+    def _error(request_id, code, message):
+        return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}}
+
+    def handle(self, request):
+        """
+        Handle one decoded request.
+
+        Returns:
+            The response object, or None for notifications (requests without an id)
+        """
+        if not isinstance(request, dict) or request.get('jsonrpc') != '2.0' \
+                or not isinstance(request.get('method'), str):
+            request_id = request.get('id') if isinstance(request, dict) else None
+            return self._error(request_id, INVALID_REQUEST, 'Invalid request')
+
+        request_id = request.get('id')
+        method = self.methods.get(request['method'])
+        if method is None:
+            response = self._error(request_id, METHOD_NOT_FOUND, f"Method not found: {request['method']}")
+        else:
+            params = request.get('params', {})
+            start = time.perf_counter()
+            try:
+                if not isinstance(params, dict):
+                    raise InvalidParams('params must be an object')
+                response = {'jsonrpc': '2.0', 'id': request_id, 'result': method(params)}
+            except InvalidParams as e:
+                response = self._error(request_id, INVALID_PARAMS, str(e))
+            except Exception as e:
+                # Keep serving: one failing request must not take down the resident server
+                log(f"Error handling {request['method']}: {e!r}")
+                response = self._error(request_id, INTERNAL_ERROR, f"Internal error: {e}")
+            elapsed = time.perf_counter() - start
+            self.request_count += 1
+            self.total_seconds += elapsed
+            self.max_seconds = max(self.max_seconds, elapsed)
+
+        return response if 'id' in request else None
+
+    def process(self, text):
+        """
+        Process the text of one message, which may be a single request or a batch.
+
+        Returns:
+            The response text, or None if nothing should be sent back
+        """
+        try:
+            message = json.loads(text)
+        except ValueError:
+            return json.dumps(self._error(None, PARSE_ERROR, 'Parse error'))
+
+        if isinstance(message, list):
+            if not message:
+                return json.dumps(self._error(None, INVALID_REQUEST, 'Invalid request'))
+            responses = [response for response in map(self.handle, message) if response is not None]
+            return json.dumps(responses, separators=(',', ':')) if responses else None
+
+        response = self.handle(message)
+        return json.dumps(response, separators=(',', ':')) if response is not None else None
+
+
+def read_message(stream):
+    """
+    Read one message from a binary stream.
+
+    Returns:
+        Tuple of (message bytes, framed), where framed says whether the message had a
+        Content-Length header; (None, False) at end of input
+
+    Raises:
+        InvalidHeader: If a Content-Length header has no valid length; the rest of the
+                       headers are consumed, so reading can continue with the next message
+    """
+    while True:
+        line = stream.readline()
+        if not line:
+            return None, False
+        if not line.strip():
+            continue
+        if not line.lower().startswith(b'content-length:'):
+            return line, False
+
+        value = line.split(b':', 1)[1].strip()
+        while True:
+            header = stream.readline()
+            if not header or not header.strip():
+                break
+        if not value.isdigit():
+            raise InvalidHeader(f"invalid Content-Length: {value.decode('utf-8', 'replace')!r}")
+        return stream.read(int(value)), True
+
+
+def write_message(stream, text, framed):
+    """Write one message to a binary stream, with the same framing as its request."""
+    body = text.encode('utf-8')
+    if framed:
+        stream.write(b'Content-Length: %d\r\n\r\n' % len(body) + body)
+    else:
+        stream.write(body + b'\n')
+    stream.flush()
+
+
+def watch_class_files(index, interval, stop_event):
+    """Reload changed class files every interval seconds until stop_event is set."""
+    while not stop_event.wait(interval):
+        start = time.perf_counter()
+        reloaded, removed = index.reload()
+        if reloaded or removed:
+            elapsed = (time.perf_counter() - start) * 1000
+            changes = [f"reloaded {name}" for name in reloaded] + [f"removed {name}" for name in removed]
+            log(f"{', '.join(changes)} ({elapsed:.1f} ms)")
+
+
+def serve(server, poll_interval, stdin, stdout):
+    """Answer requests from stdin until shutdown or end of input, reloading class files in the background."""
+    stop_event = threading.Event()
+    if poll_interval > 0:
+        watcher = threading.Thread(target=watch_class_files, args=(server.index, poll_interval, stop_event),
+                                   daemon=True)
+        watcher.start()
+
+    try:
+        while server.running:
+            try:
+                text, framed = read_message(stdin)
+            except InvalidHeader as e:
+                log(f"Bad message header: {e}")
+                write_message(stdout, json.dumps(server._error(None, PARSE_ERROR, f"Parse error: {e}")), True)
+                continue
+            if text is None:
+                break
+            response = server.process(text)
+            if response is not None:
+                write_message(stdout, response, framed)
+    finally:
+        stop_event.set()
+
+
+def benchmark_server(server, repeat=1000):
+    """
+    Time requests against a loaded index, including JSON decoding and encoding.
+
+    Args:
+        server: DocsServer to query
+        repeat: Number of requests per method
+
+    Returns:
+        Dict mapping each method to (mean, max) latency in milliseconds
+    """
+    state = server.index.state
+    names = sorted(state.by_name)
+    step = max(1, len(names) // repeat)
+    samples = [names[i * step % len(names)] for i in range(repeat)]
+    class_names = state.class_names
+
+    requests = {
+        'hover': [{'name': name} for name in samples],
+        'complete': [{'prefix': name[:name.index('.') + 4]} for name in samples],
+        'members': [{'class': class_names[i % len(class_names)]} for i in range(repeat)],
+    }
+
+    results = {}
+    for method, params_list in requests.items():
+        times = []
+        for request_id, params in enumerate(params_list):
+            text = json.dumps({'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params})
+            start = time.perf_counter()
+            server.process(text)
+            times.append(time.perf_counter() - start)
+        results[method] = (sum(times) * 1000 / len(times), max(times) * 1000)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Serve hover docs and completions for the class documentation as JSON-RPC over stdio'
+    )
+    parser.add_argument('--classes-dir', help=f'Directory with the class XML files (default: {DEFAULT_CLASSES_DIR})')
+    parser.add_argument('--poll-interval', type=float, default=1.0, metavar='SECONDS',
+                        help='How often to check class files for changes, 0 to disable (default: 1.0)')
+    parser.add_argument('--benchmark', type=int, metavar='N',
+                        help='Load the index, time N requests per method and exit')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = DocsIndex(args.classes_dir)
+    state = index.state
+    member_count = sum(len(members) for members in state.classes.values())
+    log(f"Loaded {member_count} members from {len(state.classes)} classes "
+        f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    server = DocsServer(index)
+    if args.benchmark:
+        for method, (mean, maximum) in benchmark_server(server, args.benchmark).items():
+            qprint(f"{method:10} mean {mean:.3f} ms, max {maximum:.3f} ms over {args.benchmark} requests")
+        return
+
+    serve(server, args.poll_interval, sys.stdin.buffer, sys.stdout.buffer)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,720 @@
+#!/usr/bin/env python3
+"""
+SQLite documentation store built from Classes/*-Documentation.xml.
+
+Loads every documented member into a local SQLite database with normalized tables
+(class, section, subsection, member, param) and an FTS5 full-text index over member
+names, summaries, remarks and parameter descriptions, so searches like "every member
+mentioning gib" or "all methods in the Combat & Damage section" are index lookups
+instead of a scan over the XML or the wiki.
+
+The database is updated incrementally: classes whose XML file is unchanged are kept,
+changed files are reloaded and classes whose file was removed are dropped.
+
+Members can also be looked up by name, prefix or class (DocsStore.lookup(), used by
+lookup-member.py). Lookup keys are normalized with MemberParser (queries with its
+split_member_name() from member_names), so M:, P: and F: names resolve the same way they
+do everywhere else in the scripts.
+
+Usage:
+    python3 Scripts/docs_store.py build [--classes-dir DIR] [--db PATH] [--force]
+    python3 Scripts/docs_store.py search [QUERY] [--class NAME] [--section NAME] [--kind KIND] [--limit N]
+"""
+
+import os
+import sqlite3
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from member_names import split_member_name
+
+# Modules only needed to build or search the store, run benchmarks or parse arguments
+# (xml_utils, re, html, hashlib, subprocess, type_resolver, argparse) are imported where
+# they are used so lookups start as fast as possible; see LOOKUP_TARGET_MS
+
+# Bump this whenever the schema or the stored text changes; older databases are rebuilt
+SCHEMA_VERSION = 3
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CLASSES_DIR = os.path.join(os.path.dirname(SCRIPTS_DIR), 'Classes')
+DEFAULT_DB_PATH = os.path.join(SCRIPTS_DIR, '.cache', 'documentation.db')
+
+# Cold-start budget for lookup-member.py, in milliseconds (checked by its --benchmark option)
+LOOKUP_TARGET_MS = 50
+
+MEMBER_KINDS = {'M': 'method', 'P': 'property', 'F': 'field'}
+
+TABLES = ('param', 'member', 'subsection', 'section', 'class', 'member_fts', 'meta')
+
+SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE class (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    file TEXT NOT NULL,
+    file_hash TEXT NOT NULL
+);
+CREATE TABLE section (
+    id INTEGER PRIMARY KEY,
+    class_id INTEGER NOT NULL REFERENCES class(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    UNIQUE (class_id, name)
+);
+CREATE TABLE subsection (
+    id INTEGER PRIMARY KEY,
+    section_id INTEGER NOT NULL REFERENCES section(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    UNIQUE (section_id, name)
+);
+CREATE TABLE member (
+    id INTEGER PRIMARY KEY,
+    class_id INTEGER NOT NULL REFERENCES class(id) ON DELETE CASCADE,
+    subsection_id INTEGER REFERENCES subsection(id) ON DELETE CASCADE,
+    xml_name TEXT NOT NULL,
+    name TEXT NOT NULL,
+    lookup_name TEXT NOT NULL,
+    lookup_key TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    summary TEXT,
+    returns TEXT,
+    remarks TEXT,
+    value TEXT,
+    position INTEGER NOT NULL
+);
+CREATE INDEX member_xml_name ON member(xml_name);
+CREATE INDEX member_name ON member(name COLLATE NOCASE);
+CREATE INDEX member_lookup_name ON member(lookup_name);
+CREATE INDEX member_lookup_key ON member(lookup_key);
+CREATE INDEX member_class ON member(class_id);
+CREATE INDEX member_subsection ON member(subsection_id);
+CREATE INDEX section_name ON section(name);
+CREATE TABLE param (
+    id INTEGER PRIMARY KEY,
+    member_id INTEGER NOT NULL REFERENCES member(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT
+);
+CREATE INDEX param_member ON param(member_id);
+CREATE VIRTUAL TABLE member_fts USING fts5(
+    name, summary, remarks, params,
+    tokenize = 'porter unicode61'
+);
+"""
+
+# Columns selected for member rows, in the order of MEMBER_FIELDS
+MEMBER_COLUMNS = """
+    c.name, s.name, ss.name, m.name, m.xml_name, m.signature, m.kind,
+    m.summary, m.returns, m.remarks, m.value
+"""
+MEMBER_FIELDS = ('class', 'section', 'subsection', 'name', 'xml_name', 'signature', 'kind',
+                 'summary', 'returns', 'remarks', 'value')
+
+MEMBER_JOINS = """
+    JOIN class c ON c.id = m.class_id
+    LEFT JOIN subsection ss ON ss.id = m.subsection_id
+    LEFT JOIN section s ON s.id = ss.section_id
+"""
+
+def clean_text(text):
+    """Decode entities and collapse whitespace in a member's raw inner XML text."""
+    import html
+
+    if text is None:
+        return None
+    return ' '.join(html.unescape(text).split())
+
+
+def nested_class_names(xml_names):
+    """Find the nested types of a class from its members' names (M:Class.Nested.Member)."""
+    nested = set()
+    for xml_name in xml_names:
+        parts = xml_name[2:].split('(', 1)[0].split('.')
+        if len(parts) >= 3:
+            nested.add(parts[1])
+    return nested
+
+
+def member_lookup_keys(xml_name, nested_classes=None):
+    """
+    Normalize an XML member name into the keys it can be looked up by.
+
+    Args:
+        xml_name: Member name like "M:Unit.Damage(System.Int32,DamageType)"
+        nested_classes: Nested type names of the member's class
+
+    Returns:
+        Tuple of (name, lookup_name, lookup_key) like ("Damage", "Unit.Damage",
+        "Unit.Damage(System.Int32,DamageType)"), or None if the name can't be parsed
+    """
+    from xml_utils import MemberParser
+
+    _, class_name, signature = split_member_name(xml_name)
+    info = MemberParser.parse_member_name_from_xml(xml_name, class_name, nested_classes)
+    if not info or not info.get('name') or not signature:
+        return None
+    return info['name'], f"{class_name}.{signature.split('(', 1)[0]}", f"{class_name}.{signature}"
+
+
+def normalize_lookup_query(query):
+    """
+    Normalize a lookup query the same way member names are normalized.
+
+    Args:
+        query: "Unit", "Unit.Dam", "Unit.Damage(System.Int32,DamageType)" or a full
+               XML member name like "M:Unit.Damage(...)"; the type prefix is optional
+
+    Returns:
+        Tuple of (kind, class_name, key). kind is None unless an M:, P: or F: prefix was
+        given, and key is empty when the query names only a class.
+    """
+    query = query.strip()
+    kind = None
+    if len(query) > 2 and query[1] == ':':
+        kind = MEMBER_KINDS.get(query[0])
+    else:
+        query = 'M:' + query
+    _, class_name, signature = split_member_name(query)
+    return kind, class_name, f"{class_name}.{signature}" if signature else ''
+
+
+def format_signature(name, kind, xml_name, param_names):
+    """Render a readable member signature like "Damage(int damage, DamageType damageType)"."""
+    from type_resolver import normalize_type_name, parse_method_signature
+
+    if kind != 'method':
+        return name
+    _, _, types = parse_method_signature(xml_name)
+    params = []
+    for position, type_name in enumerate(types):
+        param = normalize_type_name(type_name)
+        if position < len(param_names):
+            param = f"{param} {param_names[position]}"
+        params.append(param)
+    return f"{name}({', '.join(params)})"
+
+
+def read_class_members(class_name, xml_file):
+    """
+    Read the documented members of a class file.
+
+    Args:
+        class_name: Name of the class the file documents
+        xml_file: Path to the class's -Documentation.xml file
+
+    Returns:
+        List of member dicts in document order, with the fields of MEMBER_FIELDS plus
+        'params' (list of (name, description) tuples), 'lookup_name', 'lookup_key' and
+        'position'. Text fields are cleaned with clean_text().
+    """
+    from xml_utils import XMLFileReader
+
+    records = [record for record in XMLFileReader.iter_member_records(xml_file)
+               if record.name and not record.name.startswith('T:')]
+    nested_classes = nested_class_names(record.name for record in records)
+
+    members = []
+    for record in records:
+        keys = member_lookup_keys(record.name, nested_classes)
+        if keys is None:
+            continue
+        name, lookup_name, lookup_key = keys
+        members.append({
+            'class': class_name,
+            'section': record.section,
+            'subsection': record.subsection,
+            'name': name,
+            'xml_name': record.name,
+            'signature': format_signature(name, record.kind, record.name,
+                                          [param_name for param_name, _ in record.params]),
+            'kind': record.kind,
+            'summary': clean_text(record.summary),
+            'returns': clean_text(record.returns),
+            'remarks': clean_text(record.remarks),
+            'value': clean_text(record.value),
+            'params': [(param_name, clean_text(description)) for param_name, description in record.params],
+            'lookup_name': lookup_name,
+            'lookup_key': lookup_key,
+            'position': record.position,
+        })
+    return members
+
+
+class DocsStore:
+    """
+    SQLite store of the class documentation.
+
+    Usage:
+        with DocsStore() as store:
+            store.build()
+            for row in store.search('gib', kind='method'):
+                print(row['class'], row['name'])
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path if db_path is not None else DEFAULT_DB_PATH
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self.connection = sqlite3.connect(self.db_path)
+        self.connection.execute('PRAGMA foreign_keys = ON')
+        self._ensure_schema()
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _ensure_schema(self):
+        """Create the schema, dropping any existing tables first if they have another version."""
+        try:
+            row = self.connection.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        except sqlite3.OperationalError:
+            row = None
+        if row is not None and row[0] == str(SCHEMA_VERSION):
+            return
+
+        with self.connection:
+            for table in TABLES:
+                self.connection.execute(f'DROP TABLE IF EXISTS {table}')
+            try:
+                self.connection.executescript(SCHEMA)
+            except sqlite3.OperationalError as e:
+                raise RuntimeError(f"SQLite {sqlite3.sqlite_version} can't create the documentation store "
+                                   f"(FTS5 is required): {e}")
+            self.connection.execute("INSERT INTO meta (key, value) VALUES ('schema_version', ?)",
+                                    (str(SCHEMA_VERSION),))
+
+    def build(self, classes_dir=None, force=False, log=None):
+        """
+        Load Classes/*-Documentation.xml into the store.
+
+        Args:
+            classes_dir: Directory with the class XML files (default: Classes/ in the repository)
+            force: Reload every class even if its file is unchanged
+            log: Function used to report progress (defaults to quiet_print)
+
+        Returns:
+            Tuple of (classes loaded, classes unchanged, classes removed)
+        """
+        import hashlib
+        from xml_utils import quiet_print
+
+        log = log or quiet_print
+
+        classes_dir = classes_dir if classes_dir is not None else DEFAULT_CLASSES_DIR
+        class_files = sorted(os.path.join(classes_dir, name) for name in os.listdir(classes_dir)
+                             if name.endswith('-Documentation.xml'))
+
+        known = {name: (class_id, file_hash) for class_id, name, file_hash
+                 in self.connection.execute('SELECT id, name, file_hash FROM class')}
+
+        loaded = unchanged = 0
+        seen = set()
+        with self.connection:
+            for xml_file in class_files:
+                class_name = os.path.basename(xml_file)[:-len('-Documentation.xml')]
+                seen.add(class_name)
+                with open(xml_file, 'rb') as f:
+                    file_hash = hashlib.sha256(f.read()).hexdigest()
+
+                if class_name in known:
+                    class_id, known_hash = known[class_name]
+                    if known_hash == file_hash and not force:
+                        unchanged += 1
+                        continue
+                    self._delete_class(class_id)
+
+                member_count = self._load_class(class_name, xml_file, file_hash)
+                log(f"  Loaded {member_count} members from {os.path.basename(xml_file)}")
+                loaded += 1
+
+            removed = [name for name in known if name not in seen]
+            for class_name in removed:
+                self._delete_class(known[class_name][0])
+                log(f"  Removed {class_name}")
+
+        return loaded, unchanged, len(removed)
+
+    def _delete_class(self, class_id):
+        """Delete a class with its sections, members and parameters."""
+        self.connection.execute('DELETE FROM member_fts WHERE rowid IN (SELECT id FROM member WHERE class_id = ?)',
+                                (class_id,))
+        self.connection.execute('DELETE FROM class WHERE id = ?', (class_id,))
+
+    def _load_class(self, class_name, xml_file, file_hash):
+        """Insert a class and all of its members from its XML file. Returns the member count."""
+        execute = self.connection.execute
+        class_id = execute('INSERT INTO class (name, file, file_hash) VALUES (?, ?, ?)',
+                           (class_name, xml_file, file_hash)).lastrowid
+
+        section_ids = {}
+        subsection_ids = {}
+        members = read_class_members(class_name, xml_file)
+
+        for member in members:
+            subsection_id = None
+            if member['section'] is not None:
+                section_id = section_ids.get(member['section'])
+                if section_id is None:
+                    section_id = execute('INSERT INTO section (class_id, name, position) VALUES (?, ?, ?)',
+                                         (class_id, member['section'], len(section_ids))).lastrowid
+                    section_ids[member['section']] = section_id
+                if member['subsection'] is not None:
+                    key = (member['section'], member['subsection'])
+                    subsection_id = subsection_ids.get(key)
+                    if subsection_id is None:
+                        subsection_id = execute(
+                            'INSERT INTO subsection (section_id, name, position) VALUES (?, ?, ?)',
+                            (section_id, member['subsection'], len(subsection_ids))).lastrowid
+                        subsection_ids[key] = subsection_id
+
+            member_id = execute(
+                'INSERT INTO member (class_id, subsection_id, xml_name, name, lookup_name, lookup_key, '
+                'signature, kind, summary, returns, remarks, value, position) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (class_id, subsection_id, member['xml_name'], member['name'], member['lookup_name'],
+                 member['lookup_key'], member['signature'], member['kind'], member['summary'],
+                 member['returns'], member['remarks'], member['value'], member['position'])).lastrowid
+
+            if member['params']:
+                self.connection.executemany(
+                    'INSERT INTO param (member_id, position, name, description) VALUES (?, ?, ?, ?)',
+                    [(member_id, position, param_name, description)
+                     for position, (param_name, description) in enumerate(member['params'])])
+
+            param_text = ' '.join(f"{param_name} {description or ''}" for param_name, description in member['params'])
+            execute('INSERT INTO member_fts (rowid, name, summary, remarks, params) VALUES (?, ?, ?, ?, ?)',
+                    (member_id, member['name'], member['summary'] or '', member['remarks'] or '', param_text))
+
+        return len(members)
+
+    @staticmethod
+    def _row_to_member(row):
+        return dict(zip(MEMBER_FIELDS, row))
+
+    def search(self, query=None, class_name=None, section=None, kind=None, limit=50):
+        """
+        Search members by full text and/or filters.
+
+        Args:
+            query: FTS5 query over member names, summaries, remarks and parameters
+                   (e.g. "gib", "explo*", "fire NOT damage"). Queries that aren't valid FTS5
+                   syntax are retried as a plain list of words. None lists members by filter only.
+            class_name: Only members of this class
+            section: Only members in this section (e.g. "Combat & Damage")
+            kind: Only members of this kind (method, property or field)
+            limit: Maximum number of results (None for no limit)
+
+        Returns:
+            List of member dicts with class, section, subsection, name, xml_name, kind, summary,
+            returns, remarks and value. Full-text results are ranked by relevance and also
+            have a 'snippet' of the matching text.
+        """
+        filters = []
+        params = []
+        if class_name is not None:
+            filters.append('c.name = ?')
+            params.append(class_name)
+        if section is not None:
+            filters.append('s.name = ?')
+            params.append(section)
+        if kind is not None:
+            filters.append('m.kind = ?')
+            params.append(kind)
+        limit_clause = ' LIMIT ?' if limit is not None else ''
+        limit_params = [limit] if limit is not None else []
+
+        if not query:
+            where = f" WHERE {' AND '.join(filters)}" if filters else ''
+            rows = self.connection.execute(
+                f'SELECT {MEMBER_COLUMNS} FROM member m {MEMBER_JOINS}{where} '
+                f'ORDER BY c.name, m.position{limit_clause}', params + limit_params)
+            return [self._row_to_member(row) for row in rows]
+
+        where = ' AND '.join(['member_fts MATCH ?'] + filters)
+        sql = (f"SELECT {MEMBER_COLUMNS}, snippet(member_fts, -1, '[', ']', '...', 12) "
+               f"FROM member_fts JOIN member m ON m.id = member_fts.rowid {MEMBER_JOINS} "
+               f"WHERE {where} ORDER BY member_fts.rank{limit_clause}")
+        try:
+            rows = self.connection.execute(sql, [query] + params + limit_params).fetchall()
+        except sqlite3.OperationalError:
+            # Not valid FTS5 syntax (e.g. "Combat & Damage") - search for the words instead
+            import re
+            words = ' '.join(f'"{word}"' for word in re.findall(r'\w+', query))
+            if not words:
+                return []
+            rows = self.connection.execute(sql, [words] + params + limit_params).fetchall()
+
+        results = []
+        for row in rows:
+            member = self._row_to_member(row[:-1])
+            member['snippet'] = row[-1]
+            results.append(member)
+        return results
+
+    def get_member(self, xml_name):
+        """
+        Look up a member by its XML name.
+
+        Returns:
+            Member dict (see search()) with a 'params' list of (name, description) tuples,
+            or None if there is no such member
+        """
+        row = self.connection.execute(
+            f'SELECT m.id, {MEMBER_COLUMNS} FROM member m {MEMBER_JOINS} WHERE m.xml_name = ?',
+            (xml_name,)).fetchone()
+        if row is None:
+            return None
+        member = self._row_to_member(row[1:])
+        member['params'] = self.connection.execute(
+            'SELECT name, description FROM param WHERE member_id = ? ORDER BY position', (row[0],)).fetchall()
+        return member
+
+    def _find_members(self, condition, params, kind=None, limit=None):
+        """Fetch members matching an SQL condition, with their parameters, in document order."""
+        if kind is not None:
+            condition += ' AND m.kind = ?'
+            params = params + [kind]
+        limit_clause = ' LIMIT ?' if limit is not None else ''
+        rows = self.connection.execute(
+            f'SELECT m.id, {MEMBER_COLUMNS} FROM member m {MEMBER_JOINS} WHERE {condition} '
+            f'ORDER BY c.name, m.position{limit_clause}',
+            params + ([limit] if limit is not None else [])).fetchall()
+
+        members = {}
+        for row in rows:
+            member = self._row_to_member(row[1:])
+            member['params'] = []
+            members[row[0]] = member
+        if members:
+            placeholders = ','.join('?' * len(members))
+            for member_id, name, description in self.connection.execute(
+                    f'SELECT member_id, name, description FROM param WHERE member_id IN ({placeholders}) '
+                    'ORDER BY member_id, position', list(members)):
+                members[member_id]['params'].append((name, description))
+        return list(members.values())
+
+    def lookup(self, query, limit=50):
+        """
+        Find members by name, prefix or class.
+
+        Args:
+            query: Member name ("Unit.Damage"), XML member name ("M:Unit.Damage(System.Int32)"),
+                   prefix ("Unit.Dam") or class name ("Unit"). An M:, P: or F: prefix limits
+                   the results to that kind of member.
+            limit: Maximum number of members returned (None for no limit)
+
+        Returns:
+            Tuple of (match, members). match is 'class' when the query named a class,
+            'member' for an exact member name (every overload is returned), 'prefix' for a
+            prefix match, or None if nothing matched. members are member dicts as returned
+            by get_member().
+        """
+        kind, class_name, key = normalize_lookup_query(query)
+
+        if not key:
+            members = self._find_members('c.name = ?', [class_name], kind, limit)
+            if members:
+                return 'class', members
+            key = class_name
+        else:
+            for column in ('m.lookup_key', 'm.lookup_name'):
+                members = self._find_members(f'{column} = ?', [key], kind, limit)
+                if members:
+                    return 'member', members
+
+        # Keys are compared as UTF-8 bytes, so this range covers every key starting with key
+        members = self._find_members('m.lookup_key >= ? AND m.lookup_key < ?',
+                                     [key, key + '\U0010ffff'], kind, limit)
+        if not members:
+            pattern = key.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            members = self._find_members("m.lookup_key LIKE ? ESCAPE '\\'", [pattern], kind, limit)
+        return ('prefix', members) if members else (None, [])
+
+    def is_empty(self):
+        """Check whether nothing has been loaded into the store yet."""
+        return self.connection.execute('SELECT 1 FROM class LIMIT 1').fetchone() is None
+
+    def sections(self, class_name=None):
+        """Return (class, section, member count) for every section, in document order."""
+        where = ' WHERE c.name = ?' if class_name is not None else ''
+        return self.connection.execute(
+            'SELECT c.name, s.name, COUNT(m.id) FROM section s JOIN class c ON c.id = s.class_id '
+            'LEFT JOIN subsection ss ON ss.section_id = s.id LEFT JOIN member m ON m.subsection_id = ss.id'
+            f'{where} GROUP BY s.id ORDER BY c.name, s.position',
+            (class_name,) if class_name is not None else ()).fetchall()
+
+
+def first_sentence(text):
+    """Shorten a summary to its first sentence for one-line listings."""
+    if not text:
+        return ''
+    return text.split('. ', 1)[0].rstrip('.')
+
+
+def format_member_docs(member):
+    """
+    Format a member's documentation for the terminal.
+
+    Args:
+        member: Member dict as returned by DocsStore.get_member() or DocsStore.lookup()
+
+    Returns:
+        List of lines
+    """
+    location = ' > '.join(part for part in (member['section'], member['subsection']) if part)
+    lines = [f"{member['class']}.{member['signature']}",
+             f"  {member['kind']}" + (f" in {location}" if location else '')]
+    if member['summary']:
+        lines += ['', f"  {member['summary']}"]
+    if member['params']:
+        lines += ['', '  Parameters:']
+        lines += [f"    {name}: {description}" if description else f"    {name}"
+                  for name, description in member['params']]
+    for label, field in (('Returns', 'returns'), ('Value', 'value'), ('Remarks', 'remarks')):
+        if member[field]:
+            lines += ['', f"  {label}: {member[field]}"]
+    return lines
+
+
+def format_class_listing(members):
+    """
+    Format one line per member, grouped by class, section and subsection.
+
+    Args:
+        members: Member dicts in document order
+
+    Returns:
+        List of lines
+    """
+    lines = []
+    heading = None
+    for member in members:
+        group = (member['class'], member['section'], member['subsection'])
+        if group != heading:
+            if group[0] != (heading or (None,))[0]:
+                lines.append(member['class'])
+            location = ' > '.join(part for part in group[1:] if part) or 'Other'
+            lines.append(f"  {location}")
+            heading = group
+        summary = first_sentence(member['summary'])
+        lines.append(f"    {member['signature']}" + (f" - {summary}" if summary else ''))
+    return lines
+
+
+def format_lookup_results(match, members):
+    """
+    Format the result of DocsStore.lookup(): full docs for a member and its overloads or
+    a single prefix match, and a one-line-per-member listing for classes and prefixes.
+
+    Returns:
+        List of lines
+    """
+    if match == 'class' or (match == 'prefix' and len(members) > 1):
+        return format_class_listing(members)
+    lines = []
+    for member in members:
+        if lines:
+            lines.append('')
+        lines += format_member_docs(member)
+    return lines
+
+
+def benchmark_lookup(query, db_path=None, repeat=20):
+    """
+    Time cold-start runs of lookup-member.py, each in a fresh Python interpreter.
+
+    Args:
+        query: Lookup query to run
+        db_path: Database path (default: DEFAULT_DB_PATH)
+        repeat: Number of runs
+
+    Returns:
+        Tuple of (lookup times, interpreter startup times), each a sorted list of
+        wall-clock times in milliseconds. Startup times are for an empty script and
+        show how much of a lookup is the interpreter itself.
+    """
+    import subprocess
+
+    command = [sys.executable, os.path.join(SCRIPTS_DIR, 'lookup-member.py'), query]
+    if db_path:
+        command += ['--db', db_path]
+
+    results = []
+    for run_command in (command, [sys.executable, '-c', 'pass']):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run(run_command, stdout=subprocess.DEVNULL, check=True)
+            times.append((time.perf_counter() - start) * 1000)
+        results.append(sorted(times))
+    return tuple(results)
+
+
+def main():
+    import argparse
+    from xml_utils import quiet_print as qprint
+
+    parser = argparse.ArgumentParser(
+        description='Build and search a SQLite full-text store of the class documentation'
+    )
+    parser.add_argument('--db', help=f'Database path (default: {DEFAULT_DB_PATH})')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='Load Classes/*-Documentation.xml into the store')
+    build_parser.add_argument('--classes-dir', help=f'Directory with the class XML files (default: {DEFAULT_CLASSES_DIR})')
+    build_parser.add_argument('--force', action='store_true', help='Reload every class, even unchanged ones')
+
+    search_parser = subparsers.add_parser('search', help='Search members by full text and/or filters')
+    search_parser.add_argument('query', nargs='?', help='FTS5 query, e.g. gib, "explo*", "fire NOT damage"')
+    search_parser.add_argument('--class', dest='class_name', help='Only members of this class')
+    search_parser.add_argument('--section', help='Only members in this section, e.g. "Combat & Damage"')
+    search_parser.add_argument('--kind', choices=['method', 'property', 'field'], help='Only members of this kind')
+    search_parser.add_argument('--limit', type=int, default=50, metavar='N', help='Maximum number of results (default: 50)')
+
+    args = parser.parse_args()
+
+    try:
+        store = DocsStore(args.db)
+    except RuntimeError as e:
+        qprint(f"Error: {e}")
+        sys.exit(1)
+
+    with store:
+        if args.command == 'build':
+            start = time.perf_counter()
+            qprint(f"Building documentation store {store.db_path}...")
+            loaded, unchanged, removed = store.build(args.classes_dir, force=args.force)
+            elapsed = (time.perf_counter() - start) * 1000
+            qprint(f"Loaded {loaded} classes, {unchanged} unchanged, {removed} removed ({elapsed:.0f} ms)")
+            return
+
+        if not args.query and not (args.class_name or args.section or args.kind):
+            qprint("Error: give a query or at least one of --class, --section, --kind")
+            sys.exit(1)
+
+        start = time.perf_counter()
+        results = store.search(args.query, args.class_name, args.section, args.kind, args.limit)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        for member in results:
+            location = ' > '.join(part for part in (member['section'], member['subsection']) if part)
+            qprint(f"{member['class']}.{member['name']} [{member['kind']}]" + (f" ({location})" if location else ''))
+            text = member.get('snippet') or member['summary']
+            if text:
+                qprint(f"    {text}")
+        qprint(f"\n{len(results)} result(s) in {elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ XML formatter for Broforce documentation.
 This is now a simple wrapper around xml_utils which handles all formatting.
 
 Usage as script:
-    python3 format-xml.py [file_or_directory]
+    python3 format-xml.py [file_or_directory] [--jobs N]
     
 Usage in other scripts:
     from format_xml import format_xml_file
@@ -14,74 +14,149 @@ Usage in other scripts:
 import argparse
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # Import from xml_utils
 from xml_utils import XMLFileReader, XMLFileWriter, quiet_print as qprint
 
-def format_xml_file(file_path: str, remove_duplicates: bool = False) -> None:
+def remove_duplicate_members(sections: Iterable[Tuple[str, Dict]], log: Callable = qprint,
+                             counts: Optional[Dict] = None) -> Iterator[Tuple[str, Dict]]:
+    """
+    Drop members whose name already appeared earlier in the file from streamed sections.
+    
+    Args:
+        sections: (section_name, section_data) pairs from XMLFileReader.iter_sections()
+        log: Function used to report each removed duplicate
+        counts: Optional dict whose 'duplicates' count is increased for each removed member
+        
+    Yields:
+        The sections with duplicate members removed
+    """
+    # Track seen members and remove duplicates
+    seen_members = set()
+    
+    for section_name, section_data in sections:
+        for subsec_name, subsec_data in section_data.get('subsections', {}).items():
+            unique_members = []
+            
+            for member in subsec_data.get('members', []):
+                # Members are MemberRecords with the name already parsed
+                member_name = member.name
+                
+                if member_name:
+                    if member_name not in seen_members:
+                        seen_members.add(member_name)
+                        unique_members.append(member)
+                    else:
+                        if counts is not None:
+                            counts['duplicates'] = counts.get('duplicates', 0) + 1
+                        log(f"  Removing duplicate: {member_name}")
+                else:
+                    # Keep members we can't identify
+                    unique_members.append(member)
+            
+            subsec_data['members'] = unique_members
+        
+        yield section_name, section_data
+
+
+def format_xml_file(file_path: str, remove_duplicates: bool = False, log: Callable = qprint) -> None:
     """
     Format an XML file using Broforce documentation standards.
     
+    The file is read and written one section at a time, so memory use is bounded by
+    the largest section rather than the size of the file.
+    
     Args:
         file_path: Path to the XML file
         remove_duplicates: If True, remove duplicate member entries
+        log: Function used to report progress (defaults to quiet_print)
     """
     file_path = str(file_path)  # Handle Path objects
     
     try:
-        # Read the XML file
-        xml_data = XMLFileReader.read_xml_file(file_path)
+        # Stream the XML file section by section
+        frame = {}
+        sections = XMLFileReader.iter_sections(file_path, frame)
         
+        counts = {'duplicates': 0}
         if remove_duplicates:
-            # Track seen members and remove duplicates
-            seen_members = set()
-            duplicates_removed = 0
-            
-            for section_name, section_data in xml_data.get('sections', {}).items():
-                # Only process subsections if present
-                if 'subsections' in section_data:
-                    for subsec_name, subsec_data in section_data.get('subsections', {}).items():
-                        unique_members = []
-                        
-                        for member_lines in subsec_data.get('members', []):
-                            # Get the member name from the first line
-                            member_name = None
-                            for line in member_lines:
-                                if '<member name="' in line:
-                                    start = line.find('<member name="') + 14
-                                    end = line.find('"', start)
-                                    if end > start:
-                                        member_name = line[start:end]
-                                        break
-                            
-                            if member_name:
-                                if member_name not in seen_members:
-                                    seen_members.add(member_name)
-                                    unique_members.append(member_lines)
-                                else:
-                                    duplicates_removed += 1
-                                    qprint(f"  Removing duplicate: {member_name}")
-                            else:
-                                # Keep members we can't identify
-                                unique_members.append(member_lines)
-                        
-                        subsec_data['members'] = unique_members
-            
-            if duplicates_removed > 0:
-                qprint(f"✓ Removed {duplicates_removed} duplicate entries from {file_path}")
+            sections = remove_duplicate_members(sections, log, counts)
+        
+        # Write it back with full formatting, leaving already formatted files untouched
+        written = XMLFileWriter.write_xml_sections(file_path, sections, frame, format_content=True,
+                                                   skip_unchanged=True)
         
-        # Write it back with full formatting
-        XMLFileWriter.write_xml_file(file_path, xml_data, format_content=True)
+        if counts['duplicates'] > 0:
+            log(f"✓ Removed {counts['duplicates']} duplicate entries from {file_path}")
         
-        qprint(f"✓ Formatted: {file_path}")
+        if written:
+            log(f"✓ Formatted: {file_path}")
+        else:
+            log(f"✓ Formatted: {file_path} (unchanged)")
         
     except Exception as e:
-        qprint(f"✗ Error formatting {file_path}: {e}")
+        log(f"✗ Error formatting {file_path}: {e}")
         raise
 
 
+def _format_xml_file_worker(file_path: str, remove_duplicates: bool) -> Tuple[List[str], Optional[BaseException]]:
+    """
+    Process pool entry point for format_xml_file().
+    
+    Progress messages are collected instead of printed so the parent process can
+    report them in file order.
+    
+    Returns:
+        Tuple of (messages, error) where error is None on success
+    """
+    messages = []
+    try:
+        format_xml_file(file_path, remove_duplicates=remove_duplicates, log=messages.append)
+    except Exception as e:
+        return messages, e
+    return messages, None
+
+
+def format_xml_files(file_paths: List[str], remove_duplicates: bool = False, jobs: int = 1) -> int:
+    """
+    Format several XML files, optionally across a process pool.
+    
+    Progress is reported in the order of file_paths. The first file that fails to
+    format aborts the run: files that have not started yet are cancelled and the
+    error is re-raised.
+    
+    Args:
+        file_paths: Paths to the XML files
+        remove_duplicates: If True, remove duplicate member entries
+        jobs: Number of worker processes (1 formats serially in this process)
+        
+    Returns:
+        Number of files formatted
+    """
+    if jobs <= 1 or len(file_paths) <= 1:
+        for file_path in file_paths:
+            format_xml_file(file_path, remove_duplicates=remove_duplicates)
+        return len(file_paths)
+    
+    executor = ProcessPoolExecutor(max_workers=jobs)
+    try:
+        futures = [executor.submit(_format_xml_file_worker, file_path, remove_duplicates)
+                   for file_path in file_paths]
+        for future in futures:
+            messages, error = future.result()
+            for message in messages:
+                qprint(message)
+            if error is not None:
+                raise error
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    
+    return len(file_paths)
+
+
 def main():
     """Main entry point for command-line usage."""
     parser = argparse.ArgumentParser(
@@ -97,22 +172,30 @@ def main():
         action='store_true',
         help='Remove duplicate member entries from the XML files'
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Format files in N worker processes (0 = one per CPU core, default: 1)'
+    )
     args = parser.parse_args()
     
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    
     # If no paths provided, use current directory
     if not args.paths:
         args.paths = ['.']
     
-    # Process each path
-    files_formatted = 0
+    # Collect the files to format from each path
+    files_to_format = []
     
     for path_str in args.paths:
         path = Path(path_str)
         
         if path.is_file() and path.suffix.lower() == '.xml':
             # Format single file
-            format_xml_file(str(path), remove_duplicates=args.remove_duplicates)
-            files_formatted += 1
+            files_to_format.append(str(path))
         elif path.is_dir():
             # Format all XML files in directory
             xml_files = sorted(path.glob('*.xml'))
@@ -126,13 +209,13 @@ def main():
             
             qprint(f"Found {len(xml_files)} XML documentation files in {path}")
             
-            for xml_file in xml_files:
-                format_xml_file(str(xml_file), remove_duplicates=args.remove_duplicates)
-                files_formatted += 1
+            files_to_format.extend(str(xml_file) for xml_file in xml_files)
         else:
             qprint(f"Error: {path} is not a valid file or directory")
             continue
     
+    files_formatted = format_xml_files(files_to_format, remove_duplicates=args.remove_duplicates, jobs=jobs)
+    
     if files_formatted == 0:
         qprint("No files were formatted")
         sys.exit(1)
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Synthetic corpus generator for scaling tests.
+
+Writes *-Documentation.xml class files that look like the ones in Classes/ but at
+any scale: thousands of classes, classes with 10,000 members, long remarks, heavily
+overloaded methods and nested classes (members named Class.Nested.Member in
+"Inner Class Nested" sections, like HeroController.HeroDefinition). The member mix,
+parameter counts and text lengths follow the real corpus.
+
+Every file follows the rules XMLFileReader enforces: each member is inside a
+"<Section> Methods/Properties/Fields" subsection, no section appears twice, and
+members are sorted by name within their subsection. Files are written with
+XMLFileWriter, so they are already formatted and format-xml.py leaves them unchanged.
+
+Output is deterministic for a given seed, whatever the number of jobs.
+
+Usage:
+    python3 Scripts/generate-corpus.py OUTPUT_DIR [--scale N] [--huge-classes N] [--jobs N]
+"""
+
+import argparse
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from xml_utils import XMLFileWriter, quiet_print as qprint
+
+# Roughly the size of Classes/ today; --scale multiplies the number of classes
+BASE_CLASS_COUNT = 40
+BASE_MEMBERS_PER_CLASS = 128
+
+# Members in each of the --huge-classes classes
+DEFAULT_HUGE_MEMBERS = 10000
+
+HEADER_LINES = [
+    '<?xml version="1.0" encoding="utf-8"?>',
+    '<doc>',
+    '    <assembly>',
+    '        <name>Assembly-CSharp</name>',
+    '    </assembly>',
+    '    <members>'
+]
+FOOTER_LINES = ['    </members>', '</doc>']
+
+# Share of methods, properties and fields among members, and how often each optional
+# tag appears, as measured on Classes/
+MEMBER_KIND_WEIGHTS = {'M': 54, 'F': 43, 'P': 3}
+RETURNS_PROBABILITY = 0.28
+REMARKS_PROBABILITY = 0.045
+LONG_REMARKS_PROBABILITY = 0.005
+VALUE_PROBABILITY = 0.2
+PARAM_COUNT_WEIGHTS = (30, 25, 18, 11, 7, 4, 2, 1, 1, 1)
+
+# Chance that a method is overloaded, and the chance that an overloaded method has
+# many overloads (like Map.HitUnits)
+OVERLOAD_PROBABILITY = 0.08
+HEAVY_OVERLOAD_PROBABILITY = 0.15
+
+# Chance that a class has nested classes, and the share of its members they get
+NESTED_CLASS_PROBABILITY = 0.25
+NESTED_MEMBER_SHARE = 0.15
+
+SECTION_NAMES = (
+    'Unity Lifecycle & Setup', 'Combat & Damage', 'Position & Physics', 'Helper & Utility',
+    'Environmental Interaction', 'Character State & Effects', 'Audio System',
+    'Animation & Sprite Systems', 'Special Abilities', 'Input & Control', 'Status Effects',
+    'Unit Management', 'AI Awareness', 'Networking & Synchronization', 'Camera & Screen Effects',
+    'Spawning & Lifecycle', 'Level Loading', 'Menu Navigation', 'Player Management',
+    'Projectile Management', 'Explosion Effects', 'Destruction & Collapse', 'Trigger Handling',
+    'Save Data & Persistence', 'Score & Statistics', 'Vehicle Control', 'Weapon Systems',
+    'Particle Effects', 'Map Queries', 'Debug & Testing'
+)
+
+CLASS_PREFIXES = (
+    'Alien', 'Armored', 'Big', 'Boss', 'Bro', 'Burning', 'Dog', 'Elite', 'Explosive', 'Flying',
+    'Giant', 'Hell', 'Jungle', 'Mech', 'Mook', 'Network', 'Player', 'Rocket', 'Satan', 'Skeleton',
+    'Small', 'Suicide', 'Super', 'Tank', 'Terror', 'Test', 'Truck', 'Undead', 'Villager', 'Zipline'
+)
+CLASS_NOUNS = (
+    'Ammo', 'Barrel', 'Block', 'Boulder', 'Bridge', 'Cage', 'Camera', 'Crate', 'Door', 'Drone',
+    'Elevator', 'Flag', 'Flame', 'Gib', 'Grenade', 'Helicopter', 'Hud', 'Ladder', 'Level', 'Mine',
+    'Missile', 'Parachute', 'Pickup', 'Prisoner', 'Rope', 'Sandbag', 'Shield', 'Spike', 'Sprite',
+    'Switch', 'Tower', 'Turret', 'Wall', 'Weapon'
+)
+CLASS_ROLES = (
+    '', 'AI', 'Animator', 'Behaviour', 'Controller', 'Data', 'Effect', 'Factory', 'Handler',
+    'Manager', 'Projectile', 'Spawner', 'System', 'Trigger'
+)
+NESTED_SUFFIXES = ('Definition', 'Data', 'Info', 'Settings', 'State', 'KeyPair', 'Entry')
+
+VERBS = (
+    'Activate', 'Add', 'Animate', 'Apply', 'Attach', 'Calculate', 'Check', 'Clear', 'Create',
+    'Damage', 'Deactivate', 'Destroy', 'Detach', 'Disable', 'Enable', 'Fire', 'Get', 'Handle',
+    'Hit', 'Initialize', 'Is', 'Knock', 'Launch', 'Load', 'Play', 'Process', 'Register', 'Remove',
+    'Reset', 'Run', 'Set', 'Setup', 'Spawn', 'Start', 'Stop', 'Sync', 'Throw', 'Update', 'Use'
+)
+NOUNS = (
+    'Air', 'Ammo', 'Animation', 'Attack', 'Blood', 'Bounds', 'Bullet', 'Camera', 'Collision',
+    'Counter', 'Damage', 'Dash', 'Death', 'Direction', 'Effect', 'Enemy', 'Explosion', 'Fall',
+    'Fire', 'Flex', 'Force', 'Frame', 'Gib', 'Grenade', 'Ground', 'Health', 'Hero', 'Impact',
+    'Input', 'Jetpack', 'Jump', 'Knife', 'Ladder', 'Ledge', 'Melee', 'Mook', 'Network', 'Offset',
+    'Parachute', 'Path', 'Player', 'Position', 'Projectile', 'Range', 'Recoil', 'Rope', 'Shield',
+    'Sound', 'Special', 'Speed', 'Sprite', 'State', 'Target', 'Timer', 'Unit', 'Velocity', 'Wall',
+    'Weapon', 'Zipline'
+)
+ADJECTIVES = (
+    'active', 'base', 'current', 'default', 'last', 'local', 'max', 'min', 'next', 'original',
+    'pending', 'previous', 'remaining', 'target', 'total'
+)
+PARAM_NAMES = (
+    'x', 'y', 'xI', 'yI', 'playerNum', 'force', 'count', 'z', 'damage', 'range', 'xRange',
+    'yRange', 'damageType', 'direction', 'unit', 'target', 'position', 'delay', 'radius',
+    'index', 'immediate', 'source', 'value', 'enabled', 'offset', 'speed'
+)
+PARAM_TYPES = (
+    'System.Int32', 'System.Single', 'System.Boolean', 'System.String', 'DamageType',
+    'UnityEngine.Vector3', 'UnityEngine.Vector2', 'UnityEngine.MonoBehaviour',
+    'UnityEngine.GameObject', 'UnityEngine.Transform', 'BloodColor@', 'System.Single@',
+    'System.Collections.Generic.List{Unit}', 'System.Collections.Generic.List{System.Int32}',
+    'Unit', 'Projectile', 'Grenade', 'DirectionEnum'
+)
+TEXT_WORDS = (
+    'the', 'the', 'the', 'a', 'to', 'of', 'and', 'and', 'for', 'when', 'is', 'with', 'on', 'if',
+    'this', 'by', 'from', 'before', 'after', 'each', 'frame', 'unit', 'player', 'hero', 'enemy',
+    'damage', 'health', 'position', 'velocity', 'sprite', 'animation', 'network', 'state',
+    'effect', 'timer', 'applies', 'checks', 'updates', 'returns', 'handles', 'sets', 'resets',
+    'triggers', 'spawns', 'plays', 'sound', 'collision', 'ground', 'wall', 'ladder', 'explosion',
+    'projectile', 'grenade', 'camera', 'input', 'direction', 'current', 'target', 'range',
+    'speed', 'force', 'value', 'flag', 'called', 'override', 'base', 'method', 'used', 'during',
+    'until', 'while', 'only', 'also', 'otherwise', 'immediately', 'synchronized', 'clients',
+    'offset', 'bounds', 'layer', 'mask', 'blocks', 'map', 'grid', 'row', 'column', 'tile'
+)
+
+
+def make_class_names(count, rng):
+    """
+    Pick count distinct class names like "AlienBarrelController".
+
+    Returns:
+        List of class names
+    """
+    names = []
+    used = set()
+    while len(names) < count:
+        name = rng.choice(CLASS_PREFIXES) + rng.choice(CLASS_NOUNS) + rng.choice(CLASS_ROLES)
+        if name in used:
+            name = f"{name}{len(names)}"
+        used.add(name)
+        names.append(name)
+    return names
+
+
+def make_member_counts(count, members_per_class, huge_classes, huge_members, rng):
+    """
+    Pick the number of members of each class.
+
+    Sizes follow a log-normal distribution around members_per_class, like the real
+    classes (a few dozen members for most, several hundred for the largest). The
+    huge classes are spread evenly through the corpus.
+
+    Returns:
+        List of member counts
+    """
+    sigma = 0.9
+    mu = math.log(members_per_class) - sigma * sigma / 2
+    counts = [max(3, min(int(rng.lognormvariate(mu, sigma)), members_per_class * 20)) for _ in range(count)]
+    huge_classes = min(huge_classes, count)
+    for i in range(huge_classes):
+        counts[i * count // huge_classes] = huge_members
+    return counts
+
+
+class ClassGenerator:
+    """Generates the members of one class from its own random stream."""
+
+    def __init__(self, class_name, seed, related_classes=()):
+        self.class_name = class_name
+        self.rng = random.Random(f"{seed}:{class_name}")
+        self.related_classes = related_classes
+        self.used_names = set()
+
+    def sentence(self, min_words=6, max_words=18):
+        rng = self.rng
+        words = rng.choices(TEXT_WORDS, k=rng.randint(min_words, max_words))
+        if rng.random() < 0.2:
+            words.insert(rng.randrange(len(words)), rng.choice(ADJECTIVES) + rng.choice(NOUNS))
+        if rng.random() < 0.05:
+            words.append(f"(x &lt; {rng.randint(1, 400)}f)")
+        text = ' '.join(words)
+        return text[0].upper() + text[1:] + '.'
+
+    def paragraph(self, min_sentences, max_sentences):
+        return ' '.join(self.sentence() for _ in range(self.rng.randint(min_sentences, max_sentences)))
+
+    def unique_name(self, make_name):
+        """Call make_name() until it returns a name not used in this class yet."""
+        for _ in range(10):
+            name = make_name()
+            if name not in self.used_names:
+                break
+        else:
+            name = f"{make_name()}{len(self.used_names)}"
+        self.used_names.add(name)
+        return name
+
+    def method_name(self):
+        rng = self.rng
+        return self.unique_name(lambda: rng.choice(VERBS) + rng.choice(NOUNS)
+                                + (rng.choice(NOUNS) if rng.random() < 0.4 else ''))
+
+    def field_name(self):
+        rng = self.rng
+        return self.unique_name(lambda: rng.choice(ADJECTIVES) + rng.choice(NOUNS)
+                                + (rng.choice(NOUNS) if rng.random() < 0.5 else ''))
+
+    def property_name(self):
+        rng = self.rng
+        return self.unique_name(lambda: rng.choice(('Is', 'Has', 'Can', 'Current', 'Total', ''))
+                                + rng.choice(NOUNS) + rng.choice(NOUNS))
+
+    def parameter_list(self):
+        rng = self.rng
+        count = rng.choices(range(len(PARAM_COUNT_WEIGHTS)), PARAM_COUNT_WEIGHTS)[0]
+        types = PARAM_TYPES + tuple(self.related_classes)
+        params = []
+        names = set()
+        for _ in range(count):
+            name = rng.choice(PARAM_NAMES)
+            if name in names:
+                name = f"{name}{len(names)}"
+            names.add(name)
+            params.append((name, rng.choice(types)))
+        return params
+
+    def member_lines(self, xml_name, params=(), kind='M'):
+        """The unformatted lines of a member element; XMLFileWriter formats them."""
+        rng = self.rng
+        lines = [f'<member name="{xml_name}">', '<summary>', self.paragraph(1, 4), '</summary>']
+        for name, _ in params:
+            description = self.sentence(3, 10)
+            lines.append(f'<param name="{name}">The {name} {description[0].lower()}{description[1:]}</param>')
+        if kind == 'M' and rng.random() < RETURNS_PROBABILITY:
+            lines.append(f'<returns>{self.sentence()}</returns>')
+        if kind == 'P' and rng.random() < VALUE_PROBABILITY:
+            lines.append(f'<value>{self.sentence()}</value>')
+        if rng.random() < LONG_REMARKS_PROBABILITY:
+            lines.extend(('<remarks>', self.paragraph(40, 150), '</remarks>'))
+        elif rng.random() < REMARKS_PROBABILITY:
+            lines.extend(('<remarks>', self.paragraph(3, 10), '</remarks>'))
+        lines.append('</member>')
+        return lines
+
+    def members(self, owner, count):
+        """
+        Generate count members of owner (the class or Class.Nested).
+
+        Returns:
+            List of (kind, xml name, lines) tuples
+        """
+        rng = self.rng
+        members = []
+        while len(members) < count:
+            kind = rng.choices(list(MEMBER_KIND_WEIGHTS), list(MEMBER_KIND_WEIGHTS.values()))[0]
+            if kind == 'F':
+                xml_name = f"F:{owner}.{self.field_name()}"
+                members.append((kind, xml_name, self.member_lines(xml_name, kind=kind)))
+            elif kind == 'P':
+                xml_name = f"P:{owner}.{self.property_name()}"
+                members.append((kind, xml_name, self.member_lines(xml_name, kind=kind)))
+            else:
+                name = self.method_name()
+                overloads = 1
+                if rng.random() < OVERLOAD_PROBABILITY:
+                    overloads = rng.randint(8, 24) if rng.random() < HEAVY_OVERLOAD_PROBABILITY else rng.randint(2, 4)
+                signatures = set()
+                for _ in range(min(overloads, count - len(members))):
+                    params = self.parameter_list()
+                    signature = ','.join(param_type for _, param_type in params)
+                    if signature in signatures:
+                        continue
+                    signatures.add(signature)
+                    xml_name = f"M:{owner}.{name}" + (f"({signature})" if params else '')
+                    members.append((kind, xml_name, self.member_lines(xml_name, params)))
+        return members
+
+    def generate(self, member_count):
+        """
+        Generate the class file content.
+
+        Returns:
+            Dict with 'header_lines', 'footer_lines' and 'sections' for XMLFileWriter
+        """
+        rng = self.rng
+        nested = []
+        if member_count >= 20 and rng.random() < NESTED_CLASS_PROBABILITY:
+            for _ in range(rng.randint(1, 3)):
+                name = self.unique_name(lambda: rng.choice(CLASS_NOUNS) + rng.choice(NESTED_SUFFIXES))
+                nested.append(name)
+        nested_count = int(member_count * NESTED_MEMBER_SHARE) if nested else 0
+
+        # Spread the class's own members over its sections, then give each nested
+        # class an "Inner Class" section of its own
+        section_count = max(2, min(len(SECTION_NAMES), member_count // 15))
+        section_names = rng.sample(SECTION_NAMES, section_count)
+        groups = {name: [] for name in section_names}
+        for member in self.members(self.class_name, member_count - nested_count):
+            groups[rng.choice(section_names)].append(member)
+        for i, name in enumerate(nested):
+            count = nested_count // len(nested) + (1 if i < nested_count % len(nested) else 0)
+            groups[f"Inner Class {name}"] = self.members(f"{self.class_name}.{name}", count)
+
+        sections = {}
+        for section_name, members in groups.items():
+            subsections = {}
+            for subsection, kind in (('Methods', 'M'), ('Properties', 'P'), ('Fields', 'F')):
+                subsection_members = sorted((m for m in members if m[0] == kind), key=lambda m: m[1])
+                if subsection_members:
+                    subsections[subsection] = {
+                        'comment': f"<!-- {section_name} {subsection} -->",
+                        'members': [lines for _, _, lines in subsection_members]
+                    }
+            if subsections:
+                sections[section_name] = {
+                    'comments': [subsection['comment'] for subsection in subsections.values()],
+                    'subsections': subsections
+                }
+
+        return {
+            'header_lines': HEADER_LINES,
+            'footer_lines': FOOTER_LINES,
+            'sections': sections
+        }
+
+
+def write_class_file(output_dir, class_name, member_count, seed, related_classes=()):
+    """
+    Generate one class file.
+
+    Returns:
+        Tuple of (path, member count)
+    """
+    data = ClassGenerator(class_name, seed, related_classes).generate(member_count)
+    path = os.path.join(output_dir, f"{class_name}-Documentation.xml")
+    XMLFileWriter.write_xml_file(path, data)
+    return path, sum(len(subsection['members'])
+                     for section in data['sections'].values()
+                     for subsection in section['subsections'].values())
+
+
+def _write_class_file_worker(args):
+    return write_class_file(*args)
+
+
+def generate_corpus(output_dir, classes=BASE_CLASS_COUNT, members_per_class=BASE_MEMBERS_PER_CLASS,
+                    huge_classes=0, huge_members=DEFAULT_HUGE_MEMBERS, seed=0, jobs=1):
+    """
+    Write a synthetic corpus of class files to output_dir.
+
+    Args:
+        output_dir: Directory to write the *-Documentation.xml files to (created if needed)
+        classes: Number of class files
+        members_per_class: Typical number of members per class
+        huge_classes: Number of classes with huge_members members each
+        huge_members: Members in each huge class
+        seed: Random seed; the same seed always produces the same corpus
+        jobs: Number of worker processes
+
+    Returns:
+        Tuple of (list of files written, total member count)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    rng = random.Random(seed)
+    names = make_class_names(classes, rng)
+    counts = make_member_counts(classes, members_per_class, huge_classes, huge_members, rng)
+    # Parameters refer to a handful of the generated classes, like the real ones do
+    related = tuple(names[:20])
+    tasks = [(output_dir, name, count, seed, related) for name, count in zip(names, counts)]
+
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(_write_class_file_worker, tasks, chunksize=max(1, len(tasks) // (jobs * 8))))
+    else:
+        results = [write_class_file(*task) for task in tasks]
+
+    return [path for path, _ in results], sum(count for _, count in results)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Generate a synthetic corpus of class documentation files for scaling tests'
+    )
+    parser.add_argument('output_dir', help='Directory to write the class files to')
+    parser.add_argument('--scale', type=float, default=1,
+                        help=f'Corpus size as a multiple of Classes/ today ({BASE_CLASS_COUNT} classes per unit, default: 1)')
+    parser.add_argument('--classes', type=int, help='Number of classes (overrides --scale)')
+    parser.add_argument('--members', type=int, default=BASE_MEMBERS_PER_CLASS,
+                        help=f'Typical number of members per class (default: {BASE_MEMBERS_PER_CLASS})')
+    parser.add_argument('--huge-classes', type=int,
+                        help='Number of classes with --huge-members members (default: one per 10x of scale)')
+    parser.add_argument('--huge-members', type=int, default=DEFAULT_HUGE_MEMBERS,
+                        help=f'Members in each huge class (default: {DEFAULT_HUGE_MEMBERS})')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Write class files in N worker processes (0 = one per CPU core, default: 1)'
+    )
+    args = parser.parse_args()
+
+    classes = args.classes if args.classes is not None else max(1, round(BASE_CLASS_COUNT * args.scale))
+    huge_classes = args.huge_classes if args.huge_classes is not None else int(args.scale // 10)
+    if classes < 1 or args.members < 1 or args.huge_members < 1 or huge_classes < 0 or args.jobs < 0:
+        parser.error('counts must be positive')
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    start = time.perf_counter()
+    qprint(f"Generating {classes} classes ({huge_classes} with {args.huge_members} members) in {args.output_dir}...")
+    files, members = generate_corpus(args.output_dir, classes, args.members, huge_classes,
+                                     args.huge_members, args.seed, jobs)
+    size = sum(os.path.getsize(path) for path in files)
+    qprint(f"Wrote {len(files)} class files with {members:,} members ({size / 1e6:.1f} MB) "
+           f"in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Print the documentation for a Broforce class member, a name prefix or a whole class.
+
+Reads the prebuilt documentation store (build it with docs_store.py build) and never
+parses XML. Names are normalized with MemberParser, so "Unit.Damage", "M:Unit.Damage"
+and the full XML member name all find the same member; an M:, P: or F: prefix limits
+the results to methods, properties or fields.
+
+The lookup code lives in docs_store so its bytecode is cached between runs; keep this
+script small, since Python recompiles the script it runs on every start. For the same
+reason the usual "NAME [--db PATH] [--limit N]" command line is parsed by hand and
+xml_utils is only loaded in test mode: argparse and xml_utils each take longer to
+import than the lookup itself (see LOOKUP_TARGET_MS in docs_store).
+
+Usage:
+    python3 Scripts/lookup-member.py Unit.Damage
+    python3 Scripts/lookup-member.py Unit.Dam
+    python3 Scripts/lookup-member.py Unit
+    python3 Scripts/lookup-member.py Unit.Dam --benchmark 20
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from docs_store import DEFAULT_DB_PATH, LOOKUP_TARGET_MS, DocsStore, benchmark_lookup, format_lookup_results
+
+if os.environ.get('BROFORCE_TEST_MODE') == '1':
+    from xml_utils import quiet_print as qprint
+else:
+    qprint = print
+
+
+class Args:
+    """Parsed command line, with the same attributes argparse would set."""
+
+    def __init__(self, name, db=None, limit=50, benchmark=None):
+        self.name = name
+        self.db = db
+        self.limit = limit
+        self.benchmark = benchmark
+
+
+def parse_lookup_args(argv):
+    """
+    Parse a plain "NAME [--db PATH] [--limit N]" command line without argparse.
+
+    Returns:
+        Args, or None for anything else (--help, --benchmark, errors), which is left
+        to parse_args()
+    """
+    name = None
+    options = {}
+    argv = iter(argv)
+    for arg in argv:
+        if arg in ('--db', '--limit'):
+            value = next(argv, None)
+            if value is None:
+                return None
+            options[arg[2:]] = value
+        elif arg.startswith(('--db=', '--limit=')):
+            key, value = arg[2:].split('=', 1)
+            options[key] = value
+        elif arg.startswith('-') or name is not None:
+            return None
+        else:
+            name = arg
+    if name is None:
+        return None
+    if 'limit' in options:
+        if not options['limit'].isdigit():
+            return None
+        options['limit'] = int(options['limit'])
+    return Args(name, **options)
+
+
+def parse_args():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Print the documentation for a class member, a name prefix or a class'
+    )
+    parser.add_argument('name', help='Member like Unit.Damage or M:Unit.Damage(...), a prefix like Unit.Dam, or a class name')
+    parser.add_argument('--db', help=f'Documentation store path (default: {DEFAULT_DB_PATH})')
+    parser.add_argument('--limit', type=int, default=50, metavar='N', help='Maximum number of members (default: 50)')
+    parser.add_argument('--benchmark', type=int, metavar='N',
+                        help=f'Time N cold-start lookups in fresh interpreters (target: {LOOKUP_TARGET_MS} ms)')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_lookup_args(sys.argv[1:]) or parse_args()
+
+    if args.benchmark:
+        times, startup_times = benchmark_lookup(args.name, args.db, args.benchmark)
+        median = times[len(times) // 2]
+        qprint(f"Cold-start lookup of {args.name!r} over {len(times)} runs: "
+               f"min {times[0]:.1f} ms, median {median:.1f} ms, max {times[-1]:.1f} ms")
+        qprint(f"Python startup alone: median {startup_times[len(startup_times) // 2]:.1f} ms")
+        qprint(f"{'Within' if median <= LOOKUP_TARGET_MS else 'Over'} the {LOOKUP_TARGET_MS} ms target")
+        return
+
+    db_path = args.db or DEFAULT_DB_PATH
+    store = DocsStore(db_path) if os.path.exists(db_path) else None
+    if store is None or store.is_empty():
+        print(f"Error: {db_path} has no documentation - run 'python3 Scripts/docs_store.py build' first",
+              file=sys.stderr)
+        sys.exit(1)
+
+    with store:
+        match, members = store.lookup(args.name, args.limit)
+
+    if match is None:
+        print(f"No members match {args.name!r}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        qprint('\n'.join(format_lookup_results(match, members)))
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader closed early (e.g. piped into head); point stdout at devnull so
+        # the flush at interpreter exit doesn't raise again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Splitting of XML documentation member names.
+
+Kept free of imports so that lookup-member.py can normalize names without loading
+xml_utils; MemberParser.extract_member_signature() uses the same function.
+"""
+
+
+def split_member_name(name_attr):
+    """
+    Extract type, class, and signature from member name attribute.
+
+    Args:
+        name_attr: Full member name like "M:ClassName.Method(params)"
+
+    Returns:
+        Tuple of (type_prefix, class_name, member_signature)
+    """
+    if not name_attr or len(name_attr) < 3:
+        return ('', '', '')
+
+    type_prefix = name_attr[0]  # M, P, or F
+    name_without_prefix = name_attr[2:]  # Remove "M:" etc
+
+    parts = name_without_prefix.split('.', 1)
+    if len(parts) == 2:
+        return (type_prefix, parts[0], parts[1])
+    return (type_prefix, parts[0] if parts else '', '')
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Cached type-name resolution for Broforce documentation scripts.
+
+Converts .NET type names as they appear in XML documentation member names
+(System.Single, System.Int32@, System.Collections.Generic.List{Unit}) and in C# source
+(ref float, List<Unit>) to readable C# names, and parses method member names into their
+class, method and parameter types. The same types and members are resolved many times
+per run, so every function is memoized with an LRU cache.
+"""
+
+import re
+from functools import lru_cache
+from typing import Tuple
+
+
+# .NET framework type names and their C# keywords
+TYPE_MAP = {
+    'System.Single': 'float',
+    'Single': 'float',
+    'System.Int32': 'int',
+    'Int32': 'int',
+    'System.Boolean': 'bool',
+    'Boolean': 'bool',
+    'System.String': 'string',
+    'String': 'string',
+    'System.Double': 'double',
+    'Double': 'double',
+    'System.Void': 'void',
+    'Void': 'void',
+    'System.Object': 'object',
+    'Object': 'object',
+    'System.Byte': 'byte',
+    'Byte': 'byte',
+    'System.Char': 'char',
+    'Char': 'char',
+    'System.Int64': 'long',
+    'Int64': 'long',
+    'System.Int16': 'short',
+    'Int16': 'short',
+    'System.UInt32': 'uint',
+    'UInt32': 'uint',
+    'System.UInt64': 'ulong',
+    'UInt64': 'ulong',
+    'System.UInt16': 'ushort',
+    'UInt16': 'ushort',
+    'System.SByte': 'sbyte',
+    'SByte': 'sbyte',
+    'System.Decimal': 'decimal',
+    'Decimal': 'decimal'
+}
+
+# Parameter modifiers in C# source and how they compare against XML names
+# (XML marks both ref and out parameters with an @ suffix)
+PARAMETER_MODIFIERS = {
+    'ref': 'ref',
+    'out': 'ref',
+    'in': 'ref',
+    'params': None,
+    'this': None
+}
+
+# Characters that open/close a nesting level or separate items in a type list
+_TYPE_LIST_TOKEN = re.compile(r'[(<{\[)>}\],]')
+
+# Generic arity markers like List`1
+_GENERIC_ARITY = re.compile(r'`\d+')
+
+
+@lru_cache(maxsize=8192)
+def split_type_list(text: str) -> Tuple[str, ...]:
+    """
+    Split a comma-separated list of types, ignoring commas nested inside
+    generic arguments, parentheses or array ranks.
+
+    Args:
+        text: Type list like "System.Int32,System.Collections.Generic.Dictionary{System.String,Unit}"
+
+    Returns:
+        Tuple of stripped type names
+    """
+    parts = []
+    depth = 0
+    start = 0
+
+    for match in _TYPE_LIST_TOKEN.finditer(text):
+        char = match.group()
+        if char in '(<{[':
+            depth += 1
+        elif char != ',':
+            depth -= 1
+        elif depth == 0:
+            parts.append(text[start:match.start()].strip())
+            start = match.end()
+
+    last = text[start:].strip()
+    if last:
+        parts.append(last)
+
+    return tuple(parts)
+
+
+def _resolve_simple_type(type_name: str) -> str:
+    """Resolve a type name without generic arguments, array ranks or ref markers."""
+    # Simplify generic notation (e.g., List`1 -> List)
+    if '`' in type_name:
+        type_name = _GENERIC_ARITY.sub('', type_name)
+
+    # Remove namespace prefixes, System ones included, since C# source names types
+    # without them (System.Collections.Generic.List -> List)
+    if '.' in type_name:
+        if type_name in TYPE_MAP:
+            return TYPE_MAP[type_name]
+        type_name = type_name.split('.')[-1]
+
+    return TYPE_MAP.get(type_name, type_name)
+
+
+@lru_cache(maxsize=8192)
+def _resolve_type(type_name: str, compact: bool) -> str:
+    """
+    Resolve a type name, recursing into ref markers, arrays and generic arguments.
+
+    compact selects the form used for comparisons, without spaces
+    between generic arguments.
+    """
+    type_name = type_name.strip()
+
+    # Handle ref/out parameters - in XML documentation, @ suffix can indicate either ref or out
+    # We can't distinguish between them from XML alone, so we assume ref (more common)
+    # The & suffix is an older, rarely used format for the same thing
+    if type_name.endswith('@') or type_name.endswith('&'):
+        return f"ref {_resolve_type(type_name[:-1], compact)}"
+
+    # Handle arrays
+    if type_name.endswith('[]'):
+        return f"{_resolve_type(type_name[:-2], compact)}[]"
+
+    # Handle generics, written List{Unit} in XML names and List<Unit> in source
+    if type_name and type_name[-1] in '}>':
+        generic_start = min((i for i in (type_name.find('{'), type_name.find('<')) if i != -1), default=-1)
+        if generic_start > 0:
+            outer = _resolve_simple_type(type_name[:generic_start])
+            arguments = [_resolve_type(argument, compact)
+                         for argument in split_type_list(type_name[generic_start + 1:-1])]
+            separator = ',' if compact else ', '
+            return f"{outer}<{separator.join(arguments)}>"
+
+    return _resolve_simple_type(type_name)
+
+
+def normalize_type_name(type_name: str) -> str:
+    """
+    Convert .NET type names to more readable C# equivalents.
+
+    Args:
+        type_name: Type like "System.Single", "UnityEngine.Vector3@" or
+                   "System.Collections.Generic.List{Unit}"
+
+    Returns:
+        C# type like "float", "ref Vector3" or "List<Unit>", named the way C# source
+        names it, so XML and source signatures render the same
+    """
+    return _resolve_type(type_name, False)
+
+
+@lru_cache(maxsize=8192)
+def canonical_type_name(type_name: str) -> str:
+    """
+    Reduce a parameter type from either XML or C# source to a comparable form.
+
+    Uses C# keywords for built-in types, drops namespaces at every nesting level,
+    removes whitespace between generic arguments and maps ref/out/in modifiers to
+    "ref " (dropping params/this), so XML and source parameter types compare equal.
+
+    Args:
+        type_name: Type like "System.Collections.Generic.List{UnityEngine.Transform}" or "out float"
+
+    Returns:
+        Canonical type like "List<Transform>" or "ref float"
+    """
+    words = type_name.strip().split(None, 1)
+    prefix = ''
+    while len(words) == 2 and words[0] in PARAMETER_MODIFIERS:
+        if PARAMETER_MODIFIERS[words[0]]:
+            prefix = 'ref '
+        words = words[1].split(None, 1)
+
+    resolved = _resolve_type(' '.join(words), True)
+    if prefix and not resolved.startswith('ref '):
+        resolved = prefix + resolved
+    return resolved
+
+
+@lru_cache(maxsize=16384)
+def parse_method_signature(member_name: str) -> Tuple[str, str, Tuple[str, ...]]:
+    """
+    Parse a method signature to extract class, method name, and parameters.
+
+    Args:
+        member_name: XML member name like "M:Unit.Damage(System.Int32,DamageType)",
+                     or a signature key like "Damage(int,DamageType)"
+
+    Returns:
+        Tuple of (class_name, method_name, parameter_types). class_name is empty if
+        the name has no class part.
+    """
+    # Remove the M: prefix
+    signature = member_name[2:] if member_name.startswith('M:') else member_name
+
+    # Extract parameters if present
+    parameters = ()
+    if signature.endswith(')') and '(' in signature:
+        params_start = signature.index('(')
+        parameters = split_type_list(signature[params_start + 1:-1])
+        signature = signature[:params_start]
+
+    parts = signature.split('.')
+
+    if len(parts) >= 2:
+        return parts[0], parts[-1], parameters
+    return "", parts[0], parameters
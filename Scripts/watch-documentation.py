@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Watch mode for the documentation build.
+
+Builds Assembly-CSharp.xml and the wiki pages once, then polls Classes/ for changes.
+When class files change, only those files are re-parsed: their blocks are spliced into
+the combined XML (see CombinedXML in build-documentation.py) and only their wiki pages
+are regenerated (through the same page manifest xml-to-wiki.py uses). A burst of saves
+is debounced into a single rebuild, and every rebuild reports how long it took.
+
+Class files are not reformatted while they are being edited; run format-xml.py on
+them before committing as usual.
+
+Paths default to the same locations as build-documentation.py and xml-to-wiki.py:
+Classes/ and Assembly-CSharp.xml in the repository, and GitHub.wiki next to it.
+
+Usage:
+    python3 Scripts/watch-documentation.py [--no-wiki] [--interval SECONDS] [--debounce SECONDS]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.append(str(SCRIPTS_DIR))
+from xml_utils import FileWatcher, XMLParseCache, get_class_name_from_path, load_script, quiet_print as qprint
+import csharp_parser
+
+
+build_documentation = load_script('build-documentation.py')
+xml_to_wiki = load_script('xml-to-wiki.py')
+
+
+class WikiPages:
+    """
+    The generated wiki pages, regenerated one class file at a time.
+
+    Pages whose inputs are unchanged according to the wiki manifest are left alone,
+    exactly as in a full xml-to-wiki.py run.
+    """
+
+    def __init__(self, output_dir):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest = xml_to_wiki.load_wiki_manifest(self.output_dir)
+        self.class_files = {}
+        self.file_classes = {}
+
+    def update(self, xml_file):
+        """
+        Regenerate the pages of a class file whose inputs changed.
+
+        Returns:
+            None on success, or the generator's messages if the file couldn't be parsed
+        """
+        messages = []
+        class_files = {}
+        entry = xml_to_wiki.process_single_xml_file(Path(xml_file), self.output_dir, class_files,
+                                                    log=messages.append,
+                                                    previous_entry=self.manifest['files'].get(xml_file))
+        if entry is None:
+            return messages
+
+        self.remove(xml_file)
+        self.manifest['files'][xml_file] = entry
+        self.class_files.update(class_files)
+        self.file_classes[xml_file] = list(class_files)
+        return None
+
+    def remove(self, xml_file):
+        """Forget a class file's pages (the page files themselves are kept, as in a full run)."""
+        self.manifest['files'].pop(xml_file, None)
+        for class_name in self.file_classes.pop(xml_file, []):
+            self.class_files.pop(class_name, None)
+
+    def save(self):
+        """Update the index page and the manifest."""
+        xml_to_wiki.create_index_page(self.class_files, self.output_dir)
+        xml_to_wiki.save_wiki_manifest(self.manifest)
+
+
+def rebuild(changed, removed, combined, wiki):
+    """
+    Splice changed class files into the combined XML and regenerate their wiki pages.
+
+    Files that fail to parse (for example while a save is still in progress) are
+    reported and keep their previous output.
+
+    Returns:
+        Tuple of (rebuilt class names, combined XML seconds, wiki seconds)
+    """
+    start = time.perf_counter()
+    rebuilt = []
+    failed = set()
+    for path in changed:
+        try:
+            class_name, _ = combined.update(path)
+            rebuilt.append(class_name)
+        except (OSError, ValueError) as e:
+            qprint(f"  Error in {os.path.basename(path)}: {e} (keeping the previous build)")
+            failed.add(path)
+    for path in removed:
+        combined.remove(path)
+        rebuilt.append(f"{get_class_name_from_path(path)} (removed)")
+    combined.write()
+    combined_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if wiki is not None:
+        for path in changed:
+            if path in failed:
+                continue
+            messages = wiki.update(path)
+            if messages is not None:
+                qprint(f"  Wiki page for {os.path.basename(path)} not updated:")
+                for message in messages:
+                    qprint(f"    {message}")
+        for path in removed:
+            wiki.remove(path)
+        wiki.save()
+    wiki_seconds = time.perf_counter() - start
+
+    return rebuilt, combined_seconds, wiki_seconds
+
+
+def watch(watcher, interval, debounce, on_change):
+    """
+    Poll for changes and call on_change(changed, removed) once the files have been
+    quiet for debounce seconds, so a burst of saves triggers a single rebuild.
+    """
+    changed = set()
+    removed = set()
+    last_change = None
+    while True:
+        time.sleep(interval)
+        new_changed, new_removed = watcher.poll()
+        now = time.monotonic()
+        if new_changed or new_removed:
+            changed.update(new_changed)
+            changed.difference_update(new_removed)
+            removed.update(new_removed)
+            removed.difference_update(new_changed)
+            last_change = now
+        elif last_change is not None and now - last_change >= debounce:
+            on_change(sorted(changed), sorted(removed))
+            changed.clear()
+            removed.clear()
+            last_change = None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Rebuild Assembly-CSharp.xml and the wiki pages incrementally as class files change'
+    )
+    parser.add_argument('--classes-dir', help='Directory with the class XML files (default: Classes/ in the repository)')
+    parser.add_argument('--output-dir', help='Directory to write Assembly-CSharp.xml to (default: the repository root)')
+    parser.add_argument('--wiki-dir', help='Wiki output directory (default: GitHub.wiki next to the repository)')
+    parser.add_argument('--no-wiki', action='store_true', help='Only rebuild Assembly-CSharp.xml')
+    parser.add_argument('--no-cache', action='store_true', help='Don\'t use the on-disk parse cache')
+    parser.add_argument('--interval', type=float, default=0.25, metavar='SECONDS',
+                        help='How often to check for changes (default: 0.25)')
+    parser.add_argument('--debounce', type=float, default=0.3, metavar='SECONDS',
+                        help='How long files must be unchanged before rebuilding (default: 0.3)')
+    parser.add_argument(
+        '--source-dir',
+        help=f'Decompiled Assembly-CSharp source directory to read declarations from '
+             f'(default: ${csharp_parser.SOURCE_DIR_ENV} or {csharp_parser.DEFAULT_SOURCE_DIR})'
+    )
+    args = parser.parse_args()
+
+    if args.source_dir:
+        csharp_parser.set_source_dir(os.path.abspath(args.source_dir))
+
+    # Work from the repository root like xml-to-wiki.py, so the wiki manifest entries
+    # for Classes/ are shared with full runs; paths given on the command line are
+    # relative to the current directory
+    paths = [os.path.abspath(path) if path else None for path in (args.classes_dir, args.output_dir, args.wiki_dir)]
+    os.chdir(SCRIPTS_DIR.parent)
+    classes_dir, output_dir, wiki_dir = (path or default for path, default
+                                         in zip(paths, ('Classes', '.', '../GitHub.wiki')))
+
+    start = time.perf_counter()
+    watcher = FileWatcher(classes_dir, '-Documentation.xml')
+    combined = build_documentation.CombinedXML(os.path.join(output_dir, 'Assembly-CSharp.xml'),
+                                               None if args.no_cache else XMLParseCache())
+    wiki = None if args.no_wiki else WikiPages(wiki_dir)
+
+    qprint(f"Building {len(watcher.snapshot)} class files...")
+    rebuilt, combined_seconds, wiki_seconds = rebuild(sorted(watcher.snapshot), [], combined, wiki)
+    qprint(f"Built {combined.output_file} ({combined.member_count} members)"
+           + ("" if wiki is None else f" and {len(wiki.class_files)} wiki pages in {wiki_dir}")
+           + f" in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    def on_change(changed, removed):
+        rebuilt, combined_seconds, wiki_seconds = rebuild(changed, removed, combined, wiki)
+        total = (combined_seconds + wiki_seconds) * 1000
+        timings = f"combined XML {combined_seconds * 1000:.0f} ms"
+        if wiki is not None:
+            timings += f", wiki {wiki_seconds * 1000:.0f} ms"
+        qprint(f"[{time.strftime('%H:%M:%S')}] Rebuilt {', '.join(rebuilt) or 'nothing'} in {total:.0f} ms ({timings})")
+
+    qprint(f"Watching {classes_dir} for changes (Ctrl+C to stop)...")
+    try:
+        watch(watcher, args.interval, args.debounce, on_change)
+    except KeyboardInterrupt:
+        qprint("\nStopped watching")
+
+
+if __name__ == "__main__":
+    main()
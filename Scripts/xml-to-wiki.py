@@ -1,26 +1,96 @@
 #!/usr/bin/env python3
 """
 Convert .NET XML documentation to GitHub wiki Markdown files with full member declarations.
+
+Pages are regenerated incrementally: a manifest in Scripts/.cache records the inputs of
+every page (class XML, source signatures and generator version), and only pages whose
+inputs changed are re-rendered. Pages are only written when their content changes.
+
+Member declarations are read from the decompiled game source by csharp_parser.py when it
+is available (see --source-dir).
+
+Usage: python3 Scripts/xml-to-wiki.py [--jobs N] [--force] [--source-dir DIR]
 """
 
-import xml.etree.ElementTree as ET
+import argparse
+import hashlib
+import json
 import re
 import os
 from pathlib import Path
 from collections import defaultdict, OrderedDict
 import html
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 sys.path.append(str(Path(__file__).parent))
+import csharp_parser
 from csharp_parser import parse_csharp_file, parse_method_parameters
-from xml_utils import XMLPatterns, SectionManager, MemberParser, XMLFormatter, XMLFileReader, quiet_print as qprint
+from type_resolver import normalize_type_name, canonical_type_name, parse_method_signature
+from xml_utils import XMLPatterns, SectionManager, MemberParser, XMLFormatter, XMLFileReader, XMLFileWriter, MemberIndex, XML_UTILS_VERSION, quiet_print as qprint
 
 # Global cache for source signatures
 SOURCE_SIGNATURES_CACHE = {}
 
-def find_matching_source_signature(source_signatures, member_name, member_type):
+# Version of the page renderer. Bump this whenever the generated markdown changes
+# so the manifest marks every page as stale.
+WIKI_GENERATOR_VERSION = 4
+
+# Manifest recording the inputs each generated page was built from
+WIKI_MANIFEST_PATH = Path(__file__).parent / '.cache' / 'wiki-manifest.json'
+
+# Persistent cache of signature tables, one JSON file per class
+SIGNATURE_CACHE_DIR = Path(__file__).parent / '.cache' / 'source-signatures'
+
+# Member categories shown on class pages, in page order
+PAGE_CATEGORIES = ('Methods', 'Properties', 'Fields')
+
+# Characters dropped from section names and member names when building anchors
+SECTION_ANCHOR_STRIP = re.compile(r'[^\w\s-]')
+MEMBER_ANCHOR_STRIP = re.compile(r'[^a-zA-Z0-9\s-]')
+
+# Markdown links, explicit anchors and headings in generated pages (for the link checker)
+MARKDOWN_LINK = re.compile(r'\]\(([^)\s]+)\)')
+ANCHOR_ID = re.compile(r'<a id="([^"]+)"></a>')
+MARKDOWN_HEADING = re.compile(r'^#{1,6}[ \t]+(.+?)[ \t]*$', re.M)
+HEADING_ANCHOR_STRIP = re.compile(r'[^\w\- ]')
+
+def build_signature_index(source_signatures):
+    """
+    Build an overload index over a class's source signatures.
+    
+    Returns a dict with:
+    - 'by_types': (method name, tuple of canonical parameter types) -> list of keys
+    - 'by_arity': (method name, parameter count) -> list of method keys
+    """
+    by_types = defaultdict(list)
+    by_arity = defaultdict(list)
+    
+    for key, sig_info in source_signatures.items():
+        if sig_info.get('type') != 'method':
+            continue
+        if '(' in key:
+            _, method_name, param_types = parse_method_signature(key)
+        else:
+            method_name, param_types = key, ()
+        canonical_types = tuple(canonical_type_name(t) for t in param_types)
+        by_types[(method_name, canonical_types)].append(key)
+        by_arity[(method_name, len(param_types))].append(key)
+    
+    return {
+        'by_types': dict(by_types),
+        'by_arity': dict(by_arity)
+    }
+
+def find_matching_source_signature(source_signatures, member_name, member_type, index=None, log=None):
     """
     Find a matching source signature for a given XML member name.
     Handles method overloads by matching parameter types.
+    
+    Overloads are resolved through the index from build_signature_index() (built
+    on the fly if not given): first by exact parameter types, then by parameter
+    count. If more than one overload matches, no signature is returned and the
+    ambiguity is reported through log.
     """
     if member_type == 'M':
         # For methods, we need to match including parameters
@@ -34,15 +104,7 @@ def find_matching_source_signature(source_signatures, member_name, member_type):
         # Build a key similar to what we store: MethodName(Type1,Type2)
         if param_types:
             # Normalize the parameter types from XML
-            normalized_params = []
-            for param_type in param_types:
-                # First normalize using our type map (System.Single -> float, etc.)
-                normalized = normalize_type_name(param_type)
-                # If it wasn't in the type map and has a namespace, remove it
-                if normalized == param_type and '.' in param_type:
-                    # Keep only the last part (e.g., UnityEngine.Transform -> Transform)
-                    normalized = param_type.split('.')[-1]
-                normalized_params.append(normalized)
+            normalized_params = [canonical_type_name(param_type) for param_type in param_types]
             
             # Try different key variations
             key_variations = [
@@ -54,20 +116,20 @@ def find_matching_source_signature(source_signatures, member_name, member_type):
                 if key in source_signatures:
                     return source_signatures[key]
             
-            # If still not found, try to find any method with matching name and param count
-            # But be careful - we need exact parameter count match to avoid mixing overloads
-            param_count = len(param_types)
-            for key, sig_info in source_signatures.items():
-                if key.startswith(f"{method_name}(") and sig_info['type'] == 'method':
-                    # Count parameters in the key
-                    key_params = key[len(method_name)+1:-1]  # Extract params from "MethodName(params)"
-                    if key_params:
-                        key_param_count = len(key_params.split(','))
-                        if key_param_count == param_count:
-                            return sig_info
-                    elif param_count == 0:
-                        # Empty params case - "MethodName()"
-                        return sig_info
+            if index is None:
+                index = build_signature_index(source_signatures)
+            
+            # Match on canonical parameter types, then fall back to parameter count.
+            # We need an exact parameter count match to avoid mixing overloads.
+            candidates = index['by_types'].get((method_name, tuple(normalized_params)))
+            if not candidates:
+                candidates = index['by_arity'].get((method_name, len(param_types)))
+            
+            if candidates:
+                if len(candidates) == 1:
+                    return source_signatures[candidates[0]]
+                if log is not None:
+                    log(f"Warning: Ambiguous overload for {member_name}: {', '.join(candidates)}")
         
         return None
     else:
@@ -75,19 +137,80 @@ def find_matching_source_signature(source_signatures, member_name, member_type):
         _, simple_name = format_member_name(member_name)
         return source_signatures.get(simple_name)
 
-def load_source_signatures(class_name):
+def get_source_file_info(class_name):
+    """
+    Locate the C# source file for a class and hash its content.
+    Returns (path, sha256) or (None, None) if there is no readable source file.
+    """
+    source_path = csharp_parser.find_source_file(class_name)
+    if not source_path:
+        return None, None
+    
+    try:
+        with open(source_path, 'rb') as f:
+            return str(source_path), hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None, None
+
+def get_signature_cache_key(source_hash):
+    """Cache key combining the source content hash and the C# parser version."""
+    if source_hash is None:
+        return None
+    return f"{csharp_parser.PARSER_VERSION}:{source_hash}"
+
+def load_cached_signatures(class_name, cache_key):
+    """Load a class's signature table from the on-disk cache if it was built from the same source."""
+    if cache_key is None:
+        return None
+    try:
+        with open(SIGNATURE_CACHE_DIR / f"{class_name}.json", 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get('key') != cache_key:
+        return None
+    return cached.get('signatures')
+
+def store_cached_signatures(class_name, cache_key, source_path, signatures):
+    """Write a class's signature table to the on-disk cache."""
+    if cache_key is None:
+        return
+    try:
+        SIGNATURE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file = SIGNATURE_CACHE_DIR / f"{class_name}.json"
+        temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({'key': cache_key, 'source': source_path, 'signatures': signatures}, f)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        # The cache is an optimization - failing to write it is not an error
+        pass
+
+def load_source_signatures(class_name, log=qprint):
     """
     Load member signatures from source code and cache them.
     Returns a dict mapping member names to their full signatures.
+    
+    Signature tables are cached in memory for the process and on disk across runs,
+    keyed by the hash of the class's source file and the C# parser version, so
+    unchanged source is not parsed again.
     """
     if class_name in SOURCE_SIGNATURES_CACHE:
         return SOURCE_SIGNATURES_CACHE[class_name]
     
+    source_path, source_hash = get_source_file_info(class_name)
+    cache_key = get_signature_cache_key(source_hash)
+    cached = load_cached_signatures(class_name, cache_key)
+    if cached is not None:
+        SOURCE_SIGNATURES_CACHE[class_name] = cached
+        return cached
+    
     signatures = {}
     members, nested_classes, error = parse_csharp_file(class_name)
     
     if error:
-        qprint(f"Warning: Could not parse source for {class_name}: {error}")
+        log(f"Warning: Could not parse source for {class_name}: {error}")
+        SOURCE_SIGNATURES_CACHE[class_name] = signatures
         return signatures
     
     if members:
@@ -112,13 +235,16 @@ def load_source_signatures(class_name):
                 if params_match:
                     params_str = params_match.group(1).strip()
                     if params_str:
-                        # Parse parameters to get just the types
+                        # Parse parameters to get the types, keeping ref/out so they match XML's @ suffix
                         param_types = []
                         params = parse_method_parameters(signature)
                         if params:
                             for param in params:
                                 if param['type'] is not None:
-                                    param_types.append(param['type'])
+                                    if param['modifier']:
+                                        param_types.append(f"{param['modifier']} {param['type']}")
+                                    else:
+                                        param_types.append(param['type'])
                         if param_types:
                             key = f"{member['name']}({','.join(param_types)})"
             
@@ -130,8 +256,51 @@ def load_source_signatures(class_name):
             }
     
     SOURCE_SIGNATURES_CACHE[class_name] = signatures
+    store_cached_signatures(class_name, cache_key, source_path, signatures)
     return signatures
 
+def _load_source_signatures_worker(class_name):
+    """
+    Process pool entry point for load_source_signatures().
+    
+    Returns the signature table and the warnings logged while loading it.
+    """
+    messages = []
+    signatures = load_source_signatures(class_name, log=messages.append)
+    return signatures, messages
+
+def preload_source_signatures(class_names, executor=None, jobs=1, log=qprint):
+    """
+    Fill SOURCE_SIGNATURES_CACHE for every class before any page is rendered.
+    
+    With an executor of jobs workers, the classes that aren't cached in memory yet are
+    loaded (from the on-disk cache or by parsing their source) in its worker processes,
+    so source files are read and parsed in parallel instead of one at a time
+    from the render loop.
+    """
+    pending = [name for name in dict.fromkeys(class_names) if name not in SOURCE_SIGNATURES_CACHE]
+    if not pending:
+        return
+    
+    if executor is None:
+        for class_name in pending:
+            load_source_signatures(class_name, log)
+        return
+    
+    chunksize = max(1, len(pending) // (jobs * 4))
+    results = executor.map(_load_source_signatures_worker, pending, chunksize=chunksize)
+    for class_name, (signatures, messages) in zip(pending, results):
+        for message in messages:
+            log(message)
+        SOURCE_SIGNATURES_CACHE[class_name] = signatures
+
+def escape_markdown_type(text):
+    """
+    Escape the angle brackets of generic types like List<Unit> for use outside code spans,
+    where GitHub would treat <Unit> as an HTML tag and drop it.
+    """
+    return str(text).replace('<', '&lt;').replace('>', '&gt;')
+
 def clean_xml_text(text):
     """Clean and format XML text content."""
     if not text:
@@ -174,8 +343,9 @@ def get_method_parameter_types_from_source(source_signature, param_names):
             # If we can't determine the type, return None to trigger fallback
             return None
             
-        # Build the full type string including modifier
-        param_type = param['type']
+        # Build the full type string including modifier, naming the type the same way
+        # as types from the XML member name
+        param_type = normalize_type_name(param['type'])
         if param['modifier']:
             param_type = f"{param['modifier']} {param_type}"
         
@@ -266,57 +436,6 @@ def get_return_type_from_signature(source_signature):
     
     return None
 
-def parse_method_signature(member_name):
-    """Parse a method signature to extract class, method name, and parameters."""
-    # Remove the M: prefix
-    signature = re.sub(r'^M:', '', member_name)
-    
-    # Extract parameters if present
-    param_match = re.search(r'\((.*)\)$', signature)
-    params_str = param_match.group(1) if param_match else ""
-    
-    # Get the part before parameters
-    name_part = re.sub(r'\([^)]*\)$', '', signature)
-    parts = name_part.split('.')
-    
-    if len(parts) >= 2:
-        class_name = parts[0]
-        method_name = parts[-1]
-    else:
-        class_name = ""
-        method_name = parts[0]
-    
-    # Parse parameters
-    parameters = []
-    if params_str:
-        # Split by comma but handle nested generics
-        param_parts = []
-        current_param = ""
-        paren_depth = 0
-        angle_depth = 0
-        
-        for char in params_str:
-            if char == ',' and paren_depth == 0 and angle_depth == 0:
-                param_parts.append(current_param.strip())
-                current_param = ""
-            else:
-                current_param += char
-                if char == '(':
-                    paren_depth += 1
-                elif char == ')':
-                    paren_depth -= 1
-                elif char == '<':
-                    angle_depth += 1
-                elif char == '>':
-                    angle_depth -= 1
-        
-        if current_param.strip():
-            param_parts.append(current_param.strip())
-        
-        parameters = param_parts
-    
-    return class_name, method_name, parameters
-
 def parse_property_signature(member_name):
     """Parse a property signature to extract class and property name."""
     # Remove the P: prefix
@@ -347,73 +466,6 @@ def parse_field_signature(member_name):
     
     return class_name, field_name
 
-def normalize_type_name(type_name):
-    """Convert .NET type names to more readable C# equivalents."""
-    type_map = {
-        'System.Single': 'float',
-        'Single': 'float',
-        'System.Int32': 'int',
-        'Int32': 'int',
-        'System.Boolean': 'bool',
-        'Boolean': 'bool',
-        'System.String': 'string',
-        'String': 'string',
-        'System.Double': 'double',
-        'Double': 'double',
-        'System.Void': 'void',
-        'Void': 'void',
-        'System.Object': 'object',
-        'Object': 'object',
-        'System.Byte': 'byte',
-        'Byte': 'byte',
-        'System.Char': 'char',
-        'Char': 'char',
-        'System.Int64': 'long',
-        'Int64': 'long',
-        'System.Int16': 'short',
-        'Int16': 'short',
-        'System.UInt32': 'uint',
-        'UInt32': 'uint',
-        'System.UInt64': 'ulong',
-        'UInt64': 'ulong',
-        'System.UInt16': 'ushort',
-        'UInt16': 'ushort',
-        'System.SByte': 'sbyte',
-        'SByte': 'sbyte',
-        'System.Decimal': 'decimal',
-        'Decimal': 'decimal'
-    }
-    
-    # Handle ref/out parameters - in XML documentation, @ suffix can indicate either ref or out
-    # We can't distinguish between them from XML alone, so we assume ref (more common)
-    if type_name.endswith('@'):
-        base_type = type_name[:-1]
-        normalized_base = normalize_type_name(base_type)
-        return f"ref {normalized_base}"
-    
-    # Handle ref parameters with & suffix (older format, rarely used)
-    if type_name.endswith('&'):
-        base_type = type_name[:-1]
-        normalized_base = normalize_type_name(base_type)
-        return f"ref {normalized_base}"
-    
-    # Handle arrays
-    if type_name.endswith('[]'):
-        base_type = type_name[:-2]
-        normalized_base = normalize_type_name(base_type)
-        return f"{normalized_base}[]"
-    
-    # Handle generics
-    if '`' in type_name:
-        # Simplify generic notation (e.g., List`1 -> List<T>)
-        type_name = re.sub(r'`\d+', '', type_name)
-    
-    # Remove namespace prefixes for non-System types
-    if '.' in type_name and not type_name.startswith('System.'):
-        type_name = type_name.split('.')[-1]
-    
-    return type_map.get(type_name, type_name)
-
 def format_method_declaration(method_name, param_descriptions, returns_info=None, source_signature=None):
     """Format a complete method declaration."""
     _, simple_name, param_types = parse_method_signature(method_name)
@@ -572,421 +624,424 @@ def extract_class_name(member_name):
     
     return name
 
-def parse_xml_comments_sections(xml_content):
-    """Parse XML content to extract section comments and their positions."""
-    import re
-    
-    sections = []
-    lines = xml_content.split('\n')
-    
-    for i, line in enumerate(lines):
-        # Look for section comment patterns
-        comment_match = re.search(r'<!--\s*([^-]+?)\s*-->', line)
-        if comment_match:
-            section_name = comment_match.group(1).strip()
-            # Only include meaningful section names, skip utility comments
-            if any(keyword in section_name.lower() for keyword in ['method', 'properties', 'field', 'lifecycle', 'audio', 'animation', 'combat', 'movement', 'system', 'effect', 'input', 'network']):
-                sections.append({
-                    'name': section_name,
-                    'line_number': i,
-                    'members': []
-                })
-    
-    return sections
+def documented_class_names(xml_file):
+    """
+    List the classes an XML file documents pages for, without parsing its content.
+    
+    Classes/<Class>-Documentation.xml documents <Class>. For other files (the combined
+    Assembly-CSharp.xml) the class names are taken from the member index.
+    """
+    filename = Path(xml_file).name
+    if filename.endswith('-Documentation.xml'):
+        return [filename[:-len('-Documentation.xml')]]
+    
+    with MemberIndex(str(xml_file)) as index:
+        names = [extract_class_name(name) for name in index.names() if not name.startswith('T:')]
+    return list(dict.fromkeys(names))
 
-def group_related_sections(sections):
-    """Group related sections (Methods/Properties/Fields) under common parent sections."""
-    grouped_sections = []
-    section_groups = OrderedDict()
-    
-    for section in sections:
-        # Extract the base name by removing type suffixes
-        base_name = section['name']
-        for suffix in [' Methods', ' Properties', ' Fields']:
-            if base_name.endswith(suffix):
-                base_name = base_name[:-len(suffix)]
-                break
-        
-        # Group sections by base name
-        if base_name not in section_groups:
-            section_groups[base_name] = {
-                'name': base_name,
-                'line_number': section['line_number'],  # Use first occurrence line number
+def load_member_sections(class_name):
+    """
+    Look up the section and position of each member of a class from its XML file.
+    Returns a dict mapping member names to (section, position) tuples.
+    """
+    # Try to find the individual class XML file
+    xml_file = Path(f"Classes/{class_name}-Documentation.xml")
+    if not xml_file.exists():
+        xml_file = Path("Assembly-CSharp.xml")
+    
+    member_sections = {}
+    if xml_file.exists():
+        for record in XMLFileReader.iter_member_records(str(xml_file)):
+            member_sections.setdefault(record.name, (record.section, record.position))
+    
+    return member_sections
+
+def group_members_by_section(members):
+    """
+    Group members by the section XMLFileReader recorded for them.
+    
+    Sections are ordered by the position of their first member in the XML file and
+    members keep their XML order within a section. Members without a section are
+    collected under 'Other Members' at the end. Returns an empty list if no member
+    has a section.
+    """
+    sections = OrderedDict()
+    other_members = []
+    
+    for member in sorted(members, key=lambda m: m.get('position', float('inf'))):
+        section_name = member.get('section')
+        if not section_name:
+            other_members.append(member)
+            continue
+        if section_name not in sections:
+            sections[section_name] = {
+                'name': section_name,
                 'members': []
             }
-        
-        # Add all members from this section type to the grouped section
-        section_groups[base_name]['members'].extend(section['members'])
+        sections[section_name]['members'].append(member)
+    
+    if not sections:
+        return []
     
-    # Convert back to list, preserving order by line number
-    grouped_sections = list(section_groups.values())
-    grouped_sections.sort(key=lambda s: s['line_number'])
+    grouped_sections = list(sections.values())
+    if other_members:
+        grouped_sections.append({
+            'name': 'Other Members',
+            'members': other_members
+        })
     
     return grouped_sections
 
-def assign_members_to_sections(sections, members, xml_content):
-    """Assign members to sections based on their position in the XML."""
-    lines = xml_content.split('\n')
+def get_generator_version():
+    """Version string covering both the page renderer and the XML reader."""
+    return f"{WIKI_GENERATOR_VERSION}.{XML_UTILS_VERSION}"
+
+def hash_file(filepath):
+    """Return the SHA-256 of a file's content, or None if it doesn't exist."""
+    try:
+        with open(filepath, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+def hash_signatures(source_signatures):
+    """Return a stable hash of a class's source signature table."""
+    encoded = json.dumps(source_signatures, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+def load_wiki_manifest(output_dir):
+    """
+    Load the page manifest for an output directory.
+    Returns an empty manifest if none exists or it was written by another generator version.
+    """
+    manifest = {
+        'generator': get_generator_version(),
+        'output_dir': str(Path(output_dir).resolve()),
+        'files': {}
+    }
+    try:
+        with open(WIKI_MANIFEST_PATH, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return manifest
+    
+    if (isinstance(saved, dict) and saved.get('generator') == manifest['generator']
+            and saved.get('output_dir') == manifest['output_dir']):
+        manifest['files'] = saved.get('files', {})
+    return manifest
+
+def save_wiki_manifest(manifest):
+    """Write the page manifest."""
+    WIKI_MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = WIKI_MANIFEST_PATH.with_suffix('.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(temp_path, WIKI_MANIFEST_PATH)
+
+def write_lines_if_changed(filepath, lines):
+    """
+    Write lines, joined with newlines, to a file unless it already has exactly that content.
     
-    # Find the line number for each member in the XML
-    for member in members:
-        member_name_attr = member['name']
-        # Look for the member definition in XML
-        for i, line in enumerate(lines):
-            if f'name="{member_name_attr}"' in line:
-                member['xml_line'] = i
-                break
-        else:
-            member['xml_line'] = float('inf')  # Put unmatched members at end
+    Lines may come from a generator: they are encoded and compared against the existing
+    file in chunks as they are produced, so a page is never held in memory as a whole.
+    Returns True if the file was written.
+    """
+    chunks = XMLFileWriter.iter_line_chunks(lines, '\n')
+    return XMLFileWriter.write_chunks(str(filepath), chunks, skip_unchanged=True)
+
+def is_page_fresh(page_entry, output_dir, source_signatures):
+    """
+    Check whether a page recorded in the manifest is still up to date.
+    The page must exist unmodified and have been built from the same source signatures.
+    """
+    return (page_entry.get('signatures_hash') == hash_signatures(source_signatures)
+            and page_entry.get('page_hash') is not None
+            and hash_file(output_dir / page_entry['page']) == page_entry['page_hash'])
+
+@lru_cache(maxsize=4096)
+def section_anchor_name(section_name):
+    """Anchor for a section heading, e.g. "Combat & Damage" -> "combat--damage"."""
+    return SECTION_ANCHOR_STRIP.sub('', section_name).strip().replace(' ', '-').lower()
+
+@lru_cache(maxsize=16384)
+def member_anchor_name(member_simple):
+    """Anchor suffix for a member, e.g. "Damage" -> "damage"."""
+    return MEMBER_ANCHOR_STRIP.sub('', member_simple).strip().replace(' ', '-').lower()
+
+class AnchorAllocator:
+    """
+    Hands out unique anchors within one page.
     
-    # Sort members by their XML line position
-    members.sort(key=lambda m: m.get('xml_line', float('inf')))
+    The first request for a slug gets the slug itself. Later requests for the same
+    slug (e.g. overloads of a method) get "-1", "-2", ... appended, following GitHub's
+    convention for repeated headings, skipping any anchor that is already taken.
+    Anchors are allocated in page order, so they are the same on every run.
+    """
     
-    # Assign members to sections
-    current_section_idx = 0
+    def __init__(self):
+        self.used = set()
+        self.suffixes = {}
     
-    for member in members:
-        member_line = member.get('xml_line', float('inf'))
-        
-        # Find which section this member belongs to
-        while (current_section_idx < len(sections) - 1 and 
-               member_line > sections[current_section_idx + 1]['line_number']):
-            current_section_idx += 1
+    def allocate(self, slug):
+        """Return a unique anchor for slug and reserve it."""
+        if slug not in self.used:
+            self.used.add(slug)
+            return slug
         
-        if current_section_idx < len(sections):
-            sections[current_section_idx]['members'].append(member)
-        else:
-            # Create a default section for members without clear section
-            if not any(s['name'] == 'Other Members' for s in sections):
-                sections.append({
-                    'name': 'Other Members',
-                    'line_number': float('inf'),
-                    'members': []
-                })
-            sections[-1]['members'].append(member)
+        suffix = self.suffixes.get(slug, 0)
+        while True:
+            suffix += 1
+            anchor = f"{slug}-{suffix}"
+            if anchor not in self.used:
+                break
+        self.suffixes[slug] = suffix
+        self.used.add(anchor)
+        return anchor
 
-def create_class_wiki_page(class_name, members, output_dir, xml_content=None):
-    """Create a wiki page for a single class."""
-    
-    # Load source signatures for this class
-    source_signatures = load_source_signatures(class_name)
-    
-    # If xml_content not provided, try to read individual class file
-    if xml_content is None:
-        # Try to find the individual class XML file
-        xml_file = Path(f"Classes/{class_name}-Documentation.xml")
-        if not xml_file.exists():
-            xml_file = Path("Assembly-CSharp.xml")
+def categorize_page_members(members, allocator, section_anchor=None):
+    """
+    Split members into page categories, sorted by simple name, with their anchors.
     
-        xml_content = ""
-        if xml_file.exists():
-            # Use XMLFileReader to read the XML file
-            xml_data = XMLFileReader.read_xml_file(str(xml_file))
-            # Reconstruct the content for section parsing
-            lines = []
-            lines.extend(xml_data['header_lines'])
-            for section_name, section_data in xml_data['sections'].items():
-                lines.extend(section_data['comments'])
-                # Handle subsections if they exist
-                if 'subsections' in section_data:
-                    for subsec_type, subsec_data in section_data['subsections'].items():
-                        if 'comment' in subsec_data:
-                            lines.append(subsec_data['comment'])
-                        for member_lines in subsec_data['members']:
-                            lines.extend(member_lines)
-            lines.extend(xml_data['footer_lines'])
-            xml_content = '\n'.join(lines)
-    
-    # Parse sections from XML comments
-    sections = parse_xml_comments_sections(xml_content)
+    Returns a list of {'name', 'anchor', 'members'} dicts in PAGE_CATEGORIES order,
+    where 'members' holds {'member', 'simple_name', 'anchor'} dicts. Anchors are
+    taken from the page's AnchorAllocator. Without a section_anchor (pages without
+    sections) members get no anchor.
+    """
+    categorized = defaultdict(list)
+    for member in members:
+        _, member_simple = format_member_name(member['name'])
+        categorized[categorize_member(member['name'])].append((member_simple.lower(), member_simple, member))
     
-    if sections:
-        # Assign members to sections based on XML position
-        assign_members_to_sections(sections, members, xml_content)
-        
-        # Group related sections under common parents
-        sections = group_related_sections(sections)
+    categories = []
+    for category in PAGE_CATEGORIES:
+        if category not in categorized:
+            continue
         
-        # Start building the markdown content
-        lines = []
-        lines.append(f"# {class_name}")
-        lines.append("")
+        if section_anchor is None:
+            category_anchor = allocator.allocate(category.lower())
+        else:
+            category_anchor = allocator.allocate(f"{section_anchor}-{category.lower()}")
         
-        # Add detailed table of contents
-        lines.append("## Table of Contents")
+        entries = []
+        for _, member_simple, member in sorted(categorized[category], key=lambda entry: entry[0]):
+            if section_anchor is not None:
+                member_anchor = allocator.allocate(f"{category_anchor}-{member_anchor_name(member_simple)}")
+            else:
+                member_anchor = None
+            entries.append({
+                'member': member,
+                'simple_name': member_simple,
+                'anchor': member_anchor
+            })
         
+        categories.append({
+            'name': category,
+            'anchor': category_anchor,
+            'members': entries
+        })
+    
+    return categories
+
+def build_class_page_model(class_name, members):
+    """
+    Build the page model for a class: everything about the page's layout, computed once.
+    
+    Members are grouped by the sections recorded for them in the XML. Each section's
+    members are split into categories and sorted, and the anchors of sections, categories
+    and members are computed up front so the table of contents and the body share them.
+    Anchors are unique within the page - repeated ones (overloads) get a numeric suffix.
+    If no member has a section, the page has a single unnamed section and the categories
+    become the top-level headings.
+    """
+    sections = group_members_by_section(members)
+    allocator = AnchorAllocator()
+    
+    if sections:
+        model_sections = []
         for section in sections:
             if not section['members']:  # Skip empty sections
                 continue
-                
-            section_anchor = re.sub(r'[^\w\s-]', '', section['name']).strip().replace(' ', '-').lower()
-            lines.append(f"- [{section['name']}](#{section_anchor})")
-            
-            # Group members within this section by type for TOC
-            section_categorized = defaultdict(list)
-            for member in section['members']:
-                category = categorize_member(member['name'])
-                section_categorized[category].append(member)
-            
-            # Sort members alphabetically within each subsection for TOC
-            for category in ['Methods', 'Properties', 'Fields']:
-                if category not in section_categorized:
-                    continue
-                    
-                # Sort members alphabetically by simple name
-                sorted_members = sorted(section_categorized[category], 
-                                      key=lambda m: format_member_name(m['name'])[1].lower())
-                
-                category_anchor = f"{section_anchor}-{category.lower()}"
-                lines.append(f"  - [{category}](#{category_anchor})")
-                
-                # Add individual member links
-                for member in sorted_members:
-                    _, member_simple = format_member_name(member['name'])
-                    # Clean up member anchor generation - remove special characters and normalize
-                    clean_member_name = re.sub(r'[^a-zA-Z0-9\s-]', '', member_simple).strip().replace(' ', '-').lower()
-                    member_anchor = f"{section_anchor}-{category.lower()}-{clean_member_name}"
-                    lines.append(f"    - [{member_simple}](#{member_anchor})")
-        
-        lines.append("")
+            anchor = allocator.allocate(section_anchor_name(section['name']))
+            model_sections.append({
+                'name': section['name'],
+                'anchor': anchor,
+                'categories': categorize_page_members(section['members'], allocator, anchor)
+            })
+        return {
+            'class_name': class_name,
+            'sectioned': True,
+            'show_toc': True,
+            'sections': model_sections
+        }
+    
+    # No sections - a table of contents is only worth it with more than one category
+    return {
+        'class_name': class_name,
+        'sectioned': False,
+        'show_toc': len({categorize_member(member['name']) for member in members}) > 1,
+        'sections': [{
+            'name': None,
+            'anchor': None,
+            'categories': categorize_page_members(members, allocator)
+        }]
+    }
+
+def render_member(lines, member, category, heading, source_signatures, signature_index, log=qprint):
+    """Append the markdown for a single member (declaration, summary, parameters, returns, value)."""
+    # Get source signature if available
+    member_type = extract_member_type(member['name'])
+    source_sig = find_matching_source_signature(source_signatures, member['name'], member_type, signature_index, log)
+    
+    # Format the declaration based on member type
+    if category == 'Methods':
+        declaration = format_method_declaration(member['name'], member['params'], member['returns'], source_sig)
         
-        # Add each section
-        for section in sections:
-            if not section['members']:  # Skip empty sections
-                continue
-                
-            section_anchor = re.sub(r'[^\w\s-]', '', section['name']).strip().replace(' ', '-').lower()
-            lines.append(f'<a id="{section_anchor}"></a>')
-            lines.append(f"## {section['name']}")
-            lines.append("")
+        # Check if source signature has the right number of parameters
+        if source_sig and source_sig.get('signature'):
+            # Parse parameters from source signature
+            source_params = parse_method_parameters(source_sig['signature'])
+            xml_param_count = len(member['params']) if member['params'] else 0
+            source_param_count = len(source_params) if source_params else 0
             
-            # Group members within this section by type
-            section_categorized = defaultdict(list)
-            for member in section['members']:
-                category = categorize_member(member['name'])
-                section_categorized[category].append(member)
-            
-            # Add subsections for Methods, Properties, Fields within each section
-            for category in ['Methods', 'Properties', 'Fields']:
-                if category not in section_categorized:
-                    continue
-                
-                # Sort members alphabetically within each subsection
-                sorted_members = sorted(section_categorized[category], 
-                                      key=lambda m: format_member_name(m['name'])[1].lower())
-                
-                category_anchor = f"{section_anchor}-{category.lower()}"
-                lines.append(f'<a id="{category_anchor}"></a>')
-                lines.append(f"### {category}")
-                lines.append("")
-                
-                for member in sorted_members:
-                    _, member_simple = format_member_name(member['name'])
-                    # Clean up member anchor generation - remove special characters and normalize
-                    clean_member_name = re.sub(r'[^a-zA-Z0-9\s-]', '', member_simple).strip().replace(' ', '-').lower()
-                    member_anchor = f"{section_anchor}-{category.lower()}-{clean_member_name}"
-                    
-                    # Create member heading with anchor and declaration
-                    lines.append(f'<a id="{member_anchor}"></a>')
-                    
-                    # Get source signature if available
-                    member_type = extract_member_type(member['name'])
-                    source_sig = find_matching_source_signature(source_signatures, member['name'], member_type)
-                    
-                    
-                    # Format the declaration based on member type
-                    if category == 'Methods':
-                        declaration = format_method_declaration(member['name'], member['params'], member['returns'], source_sig)
-                        
-                        # Check if source signature has the right number of parameters
-                        if source_sig and source_sig.get('signature'):
-                            # Parse parameters from source signature
-                            source_params = parse_method_parameters(source_sig['signature'])
-                            xml_param_count = len(member['params']) if member['params'] else 0
-                            source_param_count = len(source_params) if source_params else 0
-                            
-                            if source_param_count != xml_param_count:
-                                # Wrong overload - don't use this source signature
-                                source_sig = None
-                                declaration = format_method_declaration(member['name'], member['params'], member['returns'], None)
-                        
-                        lines.append(f"#### `{declaration}`")
-                    elif category == 'Properties':
-                        declaration = format_property_declaration(member['name'], member['value'], source_sig)
-                        lines.append(f"#### `{declaration}`")
-                    elif category == 'Fields':
-                        declaration = format_field_declaration(member['name'], source_sig)
-                        lines.append(f"#### `{declaration}`")
-                    else:
-                        lines.append(f"#### {member_simple}")
-                    
-                    lines.append("")
-                    
-                    # Add summary
-                    if member['summary']:
-                        lines.append(member['summary'])
-                        lines.append("")
-                    
-                    # Add parameters for methods (with better formatting)
-                    if category == 'Methods' and member['params']:
-                        param_types = get_method_parameter_types(member['name'], member['params'], source_sig)
-                        lines.append("**Parameters:**")
-                        for param_name, param_desc in member['params'].items():
-                            param_type_info = param_types.get(param_name, 'object')
-                            # Handle case where param_type_info is a dict with type and default
-                            if isinstance(param_type_info, dict):
-                                param_type = param_type_info['type']
-                                default_val = param_type_info.get('default')
-                                if default_val:
-                                    lines.append(f"- **{param_type} {param_name} = {default_val}**: {param_desc}")
-                                else:
-                                    lines.append(f"- **{param_type} {param_name}**: {param_desc}")
-                            else:
-                                lines.append(f"- **{param_type_info} {param_name}**: {param_desc}")
-                        lines.append("")
-                    
-                    # Add return value
-                    if member['returns']:
-                        lines.append("**Returns:**")
-                        # Extract return type from source signature if available
-                        return_type = None
-                        if source_sig:
-                            return_type = get_return_type_from_signature(source_sig)
-                        
-                        if return_type:
-                            lines.append(f"- `{return_type}`: {member['returns']}")
-                        else:
-                            lines.append(f"- {member['returns']}")
-                        lines.append("")
-                    
-                    # Add value for properties
-                    if category == 'Properties' and member['value']:
-                        lines.append(f"**Value:** {member['value']}")
-                        lines.append("")
-                    
-                    lines.append("---")
-                    lines.append("")
+            if source_param_count != xml_param_count:
+                # Wrong overload - don't use this source signature
+                source_sig = None
+                declaration = format_method_declaration(member['name'], member['params'], member['returns'], None)
+    elif category == 'Properties':
+        declaration = format_property_declaration(member['name'], member['value'], source_sig)
     else:
-        # Fallback to original categorization if no sections found
-        # Group members by category
-        categorized = defaultdict(list)
-        
-        for member in members:
-            category = categorize_member(member['name'])
-            categorized[category].append(member)
-        
-        # Start building the markdown content
-        lines = []
-        lines.append(f"# {class_name}")
+        declaration = format_field_declaration(member['name'], source_sig)
+    
+    lines.append(f"{heading} `{declaration}`")
+    lines.append("")
+    
+    # Add summary
+    if member['summary']:
+        lines.append(member['summary'])
+        lines.append("")
+    
+    # Add parameters for methods
+    if category == 'Methods' and member['params']:
+        param_types = get_method_parameter_types(member['name'], member['params'], source_sig)
+        lines.append("**Parameters:**")
+        for param_name, param_desc in member['params'].items():
+            param_type_info = param_types.get(param_name, 'object')
+            # Handle case where param_type_info is a dict with type and default
+            if isinstance(param_type_info, dict):
+                param_type = escape_markdown_type(param_type_info['type'])
+                default_val = param_type_info.get('default')
+                if default_val:
+                    lines.append(f"- **{param_type} {param_name} = {escape_markdown_type(default_val)}**: {param_desc}")
+                else:
+                    lines.append(f"- **{param_type} {param_name}**: {param_desc}")
+            else:
+                lines.append(f"- **{escape_markdown_type(param_type_info)} {param_name}**: {param_desc}")
         lines.append("")
+    
+    # Add return value
+    if member['returns']:
+        lines.append("**Returns:**")
+        # Extract return type from source signature if available
+        return_type = None
+        if source_sig:
+            return_type = get_return_type_from_signature(source_sig)
         
-        # Add table of contents
-        if len(categorized) > 1:
-            lines.append("## Table of Contents")
-            for category in ['Methods', 'Properties', 'Fields']:
-                if category in categorized:
-                    lines.append(f"- [{category}](#{category.lower()})")
-            lines.append("")
+        if return_type:
+            lines.append(f"- `{return_type}`: {member['returns']}")
+        else:
+            lines.append(f"- {member['returns']}")
+        lines.append("")
+    
+    # Add value for properties
+    if category == 'Properties' and member['value']:
+        lines.append(f"**Value:** {member['value']}")
+        lines.append("")
+    
+    lines.append("---")
+    lines.append("")
+
+def iter_toc_lines(model):
+    """Yield the table of contents lines for a page model."""
+    sectioned = model['sectioned']
+    
+    for section in model['sections']:
+        if sectioned:
+            yield f"- [{section['name']}](#{section['anchor']})"
         
-        # Add each category
-        for category in ['Methods', 'Properties', 'Fields']:
-            if category not in categorized:
-                continue
-                
-            lines.append(f"## {category}")
-            lines.append("")
+        for category in section['categories']:
+            if sectioned:
+                yield f"  - [{category['name']}](#{category['anchor']})"
+            else:
+                yield f"- [{category['name']}](#{category['anchor']})"
             
-            # Sort members alphabetically within category
-            sorted_members = sorted(categorized[category], 
-                                  key=lambda m: format_member_name(m['name'])[1].lower())
+            for entry in category['members']:
+                if entry['anchor']:
+                    yield f"    - [{entry['simple_name']}](#{entry['anchor']})"
+
+def iter_class_page_lines(model, source_signatures, signature_index, log=qprint):
+    """
+    Yield the markdown lines of a page model, one member at a time.
+    
+    The table of contents only needs the names and anchors precomputed in the model,
+    so it is produced first without rendering anything. Each member is then rendered
+    and yielded before the next one, so only a single member's lines are held at once.
+    """
+    sectioned = model['sectioned']
+    member_heading = "####" if sectioned else "###"
+    
+    yield f"# {model['class_name']}"
+    yield ""
+    if model['show_toc']:
+        yield "## Table of Contents"
+        yield from iter_toc_lines(model)
+        yield ""
+    
+    for section in model['sections']:
+        if sectioned:
+            yield f'<a id="{section["anchor"]}"></a>'
+            yield f"## {section['name']}"
+            yield ""
+        
+        for category in section['categories']:
+            if sectioned:
+                yield f'<a id="{category["anchor"]}"></a>'
+                yield f"### {category['name']}"
+            else:
+                yield f"## {category['name']}"
+            yield ""
             
-            for member in sorted_members:
-                _, member_simple = format_member_name(member['name'])
-                
-                # Get source signature if available
-                member_type = extract_member_type(member['name'])
-                source_sig = find_matching_source_signature(source_signatures, member['name'], member_type)
-                
-                # Format the declaration based on member type
-                if category == 'Methods':
-                    declaration = format_method_declaration(member['name'], member['params'], member['returns'], source_sig)
-                    
-                    # Check if source signature has the right number of parameters
-                    if source_sig and source_sig.get('signature'):
-                        # Parse parameters from source signature
-                        source_params = parse_method_parameters(source_sig['signature'])
-                        xml_param_count = len(member['params']) if member['params'] else 0
-                        source_param_count = len(source_params) if source_params else 0
-                        
-                        if source_param_count != xml_param_count:
-                            # Wrong overload - don't use this source signature
-                            source_sig = None
-                            declaration = format_method_declaration(member['name'], member['params'], member['returns'], None)
-                    
-                    lines.append(f"### `{declaration}`")
-                elif category == 'Properties':
-                    declaration = format_property_declaration(member['name'], member['value'], source_sig)
-                    lines.append(f"### `{declaration}`")
-                elif category == 'Fields':
-                    declaration = format_field_declaration(member['name'], source_sig)
-                    lines.append(f"### `{declaration}`")
-                else:
-                    lines.append(f"### {member_simple}")
-                
-                lines.append("")
-                
-                # Add summary
-                if member['summary']:
-                    lines.append(member['summary'])
-                    lines.append("")
-                
-                # Add parameters for methods
-                if category == 'Methods' and member['params']:
-                    param_types = get_method_parameter_types(member['name'], member['params'], source_sig)
-                    lines.append("**Parameters:**")
-                    for param_name, param_desc in member['params'].items():
-                        param_type_info = param_types.get(param_name, 'object')
-                        # Handle case where param_type_info is a dict with type and default
-                        if isinstance(param_type_info, dict):
-                            param_type = param_type_info['type']
-                            default_val = param_type_info.get('default')
-                            if default_val:
-                                lines.append(f"- **{param_type} {param_name} = {default_val}**: {param_desc}")
-                            else:
-                                lines.append(f"- **{param_type} {param_name}**: {param_desc}")
-                        else:
-                            lines.append(f"- **{param_type_info} {param_name}**: {param_desc}")
-                    lines.append("")
-                
-                # Add return value
-                if member['returns']:
-                    lines.append("**Returns:**")
-                    # Extract return type from source signature if available
-                    return_type = None
-                    if source_sig:
-                        return_type = get_return_type_from_signature(source_sig)
-                    
-                    if return_type:
-                        lines.append(f"- `{return_type}`: {member['returns']}")
-                    else:
-                        lines.append(f"- {member['returns']}")
-                    lines.append("")
-                
-                # Add value for properties
-                if category == 'Properties' and member['value']:
-                    lines.append(f"**Value:** {member['value']}")
-                    lines.append("")
-                
-                lines.append("---")
-                lines.append("")
+            for entry in category['members']:
+                member_lines = []
+                if entry['anchor']:
+                    member_lines.append(f'<a id="{entry["anchor"]}"></a>')
+                render_member(member_lines, entry['member'], category['name'], member_heading,
+                              source_signatures, signature_index, log)
+                yield from member_lines
+
+def create_class_wiki_page(class_name, members, output_dir, log=qprint):
+    """Create a wiki page for a single class."""
+    
+    # Load source signatures for this class and index its overloads once
+    source_signatures = load_source_signatures(class_name, log)
+    signature_index = build_signature_index(source_signatures)
+    
+    # Members from process_single_xml_file() already carry their section and position;
+    # look them up in the class XML file for any that don't
+    if any('section' not in member for member in members):
+        member_sections = load_member_sections(class_name)
+        for member in members:
+            if 'section' not in member:
+                member['section'], member['position'] = member_sections.get(member['name'], (None, float('inf')))
+    
+    model = build_class_page_model(class_name, members)
+    lines = iter_class_page_lines(model, source_signatures, signature_index, log)
     
     # Write to file
     safe_class_name = re.sub(r'[<>:"/\\|?*]', '-', class_name)
     filename = f"{safe_class_name}.md"
     filepath = output_dir / filename
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
+    write_lines_if_changed(filepath, lines)
     
     return filename
 
@@ -1013,97 +1068,252 @@ def create_index_page(class_files, output_dir):
     lines.append("*Generated from Assembly-CSharp.xml documentation*")
     
     # Write index file
-    with open(output_dir / "Home.md", 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
+    write_lines_if_changed(output_dir / "Home.md", lines)
+
+def heading_anchor_name(heading):
+    """Anchor GitHub generates for a markdown heading, e.g. "`void Awake()`" -> "void-awake"."""
+    return HEADING_ANCHOR_STRIP.sub('', heading.lower()).replace(' ', '-')
 
-def process_single_xml_file(xml_file, output_dir, class_files):
-    """Process a single XML file and generate wiki pages."""
-    qprint(f"Parsing {xml_file}...")
+def collect_page_anchors(text):
+    """
+    Collect the anchors a page defines: explicit <a id> anchors and heading anchors.
     
-    try:
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
-    except ET.ParseError as e:
-        qprint(f"Error parsing XML: {e}")
-        return
+    Returns:
+        Tuple of (set of anchors, list of <a id> anchors defined more than once)
+    """
+    anchors = set()
+    duplicates = []
+    for anchor in ANCHOR_ID.findall(text):
+        if anchor in anchors:
+            duplicates.append(anchor)
+        anchors.add(anchor)
+    
+    heading_anchors = AnchorAllocator()
+    for heading in MARKDOWN_HEADING.findall(text):
+        anchors.add(heading_anchors.allocate(heading_anchor_name(heading)))
+    return anchors, duplicates
+
+def check_wiki_links(output_dir):
+    """
+    Check that every link between generated pages resolves.
     
-    # Read XML content for section parsing using XMLFileReader
-    xml_data = XMLFileReader.read_xml_file(str(xml_file))
-    # Reconstruct the content for section parsing
-    lines = []
-    lines.extend(xml_data['header_lines'])
-    for section_name, section_data in xml_data['sections'].items():
-        lines.extend(section_data['comments'])
-        # Handle subsections if they exist
-        if 'subsections' in section_data:
-            for subsec_type, subsec_data in section_data['subsections'].items():
-                if 'comment' in subsec_data:
-                    lines.append(subsec_data['comment'])
-                for member_lines in subsec_data['members']:
-                    lines.extend(member_lines)
-    lines.extend(xml_data['footer_lines'])
-    xml_content = '\n'.join(lines)
-    
-    # Group members by class
+    Links are either "#anchor" on the same page or "Page" / "Page#anchor" to another
+    page in output_dir. The anchors of every page are collected once, so each link is
+    a pair of set lookups. Anchors defined twice on a page are reported as well, since
+    links to them can land on the wrong entry.
+    
+    Returns:
+        Tuple of (number of links checked, list of (page filename, broken link target),
+        list of (page filename, duplicated anchor))
+    """
+    page_texts = {}
+    page_anchors = {}
+    duplicates = []
+    for page_path in sorted(Path(output_dir).glob('*.md')):
+        text = page_path.read_text(encoding='utf-8')
+        page_texts[page_path.stem] = text
+        page_anchors[page_path.stem], page_duplicates = collect_page_anchors(text)
+        duplicates.extend((page_path.name, anchor) for anchor in page_duplicates)
+    
+    checked = 0
+    broken = []
+    for page_name, text in page_texts.items():
+        for target in MARKDOWN_LINK.findall(text):
+            if '://' in target or target.startswith('mailto:'):
+                continue
+            checked += 1
+            target_page, _, anchor = target.partition('#')
+            if target_page.endswith('.md'):
+                target_page = target_page[:-3]
+            anchors = page_anchors.get(target_page or page_name)
+            if anchors is None or (anchor and anchor not in anchors):
+                broken.append((f"{page_name}.md", target))
+    
+    return checked, broken, duplicates
+
+def member_info_from_record(record):
+    """Build the wiki member info dict from a parsed MemberRecord."""
+    # Extract parameters
+    params = OrderedDict()
+    for param_name, param_desc in record.params:
+        if param_name:
+            params[param_name] = clean_xml_text(param_desc)
+    
+    return {
+        'name': record.name,
+        'summary': clean_xml_text(record.summary),
+        'returns': clean_xml_text(record.returns),
+        'value': clean_xml_text(record.value),
+        'params': params,
+        'section': record.section,
+        'position': record.position
+    }
+
+def process_single_xml_file(xml_file, output_dir, class_files, log=qprint, previous_entry=None):
+    """
+    Process a single XML file and generate wiki pages.
+    
+    previous_entry is this file's entry from the wiki manifest, if any. Pages whose
+    inputs are unchanged since then are not re-rendered. Returns the new manifest
+    entry for the file, or None if it could not be parsed.
+    """
+    log(f"Parsing {xml_file}...")
+    
+    xml_hash = hash_file(xml_file)
+    previous_pages = {}
+    if previous_entry and previous_entry.get('xml_hash') == xml_hash:
+        previous_pages = previous_entry.get('classes', {})
+    
+    # If the XML is unchanged and every page is still fresh, skip parsing entirely
+    if previous_pages and all(
+            is_page_fresh(page_entry, output_dir, load_source_signatures(class_name, log))
+            for class_name, page_entry in previous_pages.items()):
+        log(f"Up to date: {len(previous_pages)} page(s) from {xml_file}")
+        for class_name, page_entry in previous_pages.items():
+            class_files[class_name] = page_entry['page']
+        return previous_entry
+    
+    # Group members by class. A single streaming pass over the file yields each
+    # member's content together with its section and position.
     classes = defaultdict(list)
     
-    # Process each member
-    members_node = root.find('members')
-    if members_node is None:
-        qprint(f"No members found in {xml_file}!")
-        return
+    try:
+        for record in XMLFileReader.iter_member_records(str(xml_file)):
+            member_name = record.name
+            
+            if not member_name:
+                continue
+            
+            # Skip if it's a type definition itself
+            if member_name.startswith('T:'):
+                continue
+            
+            # Extract class name
+            class_name = extract_class_name(member_name)
+            
+            classes[class_name].append(member_info_from_record(record))
+    except ValueError as e:
+        log(f"Error parsing XML: {e}")
+        return None
     
-    for member_node in members_node.findall('member'):
-        member_name = member_node.get('name', '')
-        
-        if not member_name:
-            continue
-        
-        # Extract class name
-        class_name = extract_class_name(member_name)
-        
-        # Skip if it's a type definition itself
-        if member_name.startswith('T:'):
-            continue
-        
-        # Extract member information
-        summary_node = member_node.find('summary')
-        summary = clean_xml_text(summary_node.text) if summary_node is not None else ""
-        
-        returns_node = member_node.find('returns')
-        returns = clean_xml_text(returns_node.text) if returns_node is not None else ""
-        
-        value_node = member_node.find('value')
-        value = clean_xml_text(value_node.text) if value_node is not None else ""
-        
-        # Extract parameters
-        params = OrderedDict()
-        for param_node in member_node.findall('param'):
-            param_name = param_node.get('name', '')
-            param_desc = clean_xml_text(param_node.text) if param_node.text else ""
-            if param_name:
-                params[param_name] = param_desc
-        
-        member_info = {
-            'name': member_name,
-            'summary': summary,
-            'returns': returns,
-            'value': value,
-            'params': params
-        }
-        
-        classes[class_name].append(member_info)
+    entry = {
+        'xml_hash': xml_hash,
+        'classes': {}
+    }
     
-    # Generate wiki pages for each class
+    # Generate wiki pages for each class whose inputs changed
     for class_name, members in classes.items():
         if not members:  # Skip empty classes
             continue
+        
+        source_signatures = load_source_signatures(class_name, log)
+        page_entry = previous_pages.get(class_name)
+        if page_entry and is_page_fresh(page_entry, output_dir, source_signatures):
+            log(f"Up to date: {class_name}")
+        else:
+            log(f"Generating page for {class_name} ({len(members)} members)...")
+            filename = create_class_wiki_page(class_name, members, output_dir, log)
+            page_entry = {
+                'page': filename,
+                'signatures_hash': hash_signatures(source_signatures),
+                'page_hash': hash_file(output_dir / filename)
+            }
+        
+        entry['classes'][class_name] = page_entry
+        class_files[class_name] = page_entry['page']
+    
+    return entry
+
+def _process_xml_file_worker(xml_file, output_dir, previous_entry, source_signatures):
+    """
+    Process pool entry point for process_single_xml_file().
+    
+    source_signatures holds the preloaded signature tables of the file's classes.
+    Returns the class_files entries generated for the file, its new manifest entry
+    and the progress messages, so the parent can merge them and report them in file order.
+    """
+    SOURCE_SIGNATURES_CACHE.update(source_signatures)
+    class_files = {}
+    messages = []
+    entry = process_single_xml_file(xml_file, output_dir, class_files, log=messages.append,
+                                    previous_entry=previous_entry)
+    return class_files, entry, messages
+
+def process_xml_files(xml_files, output_dir, class_files, jobs=1, manifest=None):
+    """
+    Generate wiki pages for several XML files, optionally across a process pool.
+    
+    Source signatures for every documented class are loaded in a pre-pass (across
+    the pool when jobs > 1) before rendering starts. Each worker then renders and
+    writes the pages for one file. The class_files map, manifest entries and progress
+    messages are collected from the workers in the order of xml_files. If a manifest
+    is given, its 'files' entries are replaced with the entries for xml_files.
+    """
+    previous_files = manifest['files'] if manifest is not None else {}
+    previous_entries = [previous_files.get(str(xml_file)) for xml_file in xml_files]
+    class_names = [documented_class_names(xml_file) for xml_file in xml_files]
+    all_class_names = [name for names in class_names for name in names]
+    entries = {}
+    
+    qprint(f"Loading source signatures for {len(all_class_names)} classes...")
+    
+    if jobs <= 1:
+        preload_source_signatures(all_class_names)
+        for xml_file, previous_entry in zip(xml_files, previous_entries):
+            entries[str(xml_file)] = process_single_xml_file(xml_file, output_dir, class_files,
+                                                             previous_entry=previous_entry)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            preload_source_signatures(all_class_names, executor, jobs)
             
-        qprint(f"Generating page for {class_name} ({len(members)} members)...")
-        filename = create_class_wiki_page(class_name, members, output_dir, xml_content)
-        class_files[class_name] = filename
+            if len(xml_files) <= 1:
+                for xml_file, previous_entry in zip(xml_files, previous_entries):
+                    entries[str(xml_file)] = process_single_xml_file(xml_file, output_dir, class_files,
+                                                                     previous_entry=previous_entry)
+            else:
+                file_signatures = [
+                    {name: SOURCE_SIGNATURES_CACHE[name] for name in names if name in SOURCE_SIGNATURES_CACHE}
+                    for names in class_names
+                ]
+                results = executor.map(_process_xml_file_worker, xml_files, [output_dir] * len(xml_files),
+                                       previous_entries, file_signatures)
+                for xml_file, (file_class_files, entry, messages) in zip(xml_files, results):
+                    for message in messages:
+                        qprint(message)
+                    class_files.update(file_class_files)
+                    entries[str(xml_file)] = entry
+    
+    if manifest is not None:
+        manifest['files'] = {path: entry for path, entry in entries.items() if entry is not None}
 
 def main():
+    parser = argparse.ArgumentParser(
+        description='Generate GitHub wiki pages from the XML documentation'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Render class pages in N worker processes (0 = one per CPU core, default: 1)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Regenerate every page, ignoring the manifest of previously generated pages'
+    )
+    parser.add_argument(
+        '--source-dir',
+        help=f'Decompiled Assembly-CSharp source directory to read declarations from '
+             f'(default: ${csharp_parser.SOURCE_DIR_ENV} or {csharp_parser.DEFAULT_SOURCE_DIR})'
+    )
+    args = parser.parse_args()
+    
+    if args.source_dir:
+        csharp_parser.set_source_dir(args.source_dir)
+    
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    
     # Set output directory to ../GitHub.wiki
     output_dir = Path("../GitHub.wiki")
     
@@ -1112,19 +1322,23 @@ def main():
     
     class_files = {}
     
+    # Load the record of what each existing page was generated from
+    manifest = load_wiki_manifest(output_dir)
+    if args.force:
+        manifest['files'] = {}
+    
     # Process all XML files in Classes directory
     classes_dir = Path("Classes")
     if classes_dir.exists():
-        xml_files = list(classes_dir.glob("*-Documentation.xml"))
+        xml_files = sorted(classes_dir.glob("*-Documentation.xml"))
         qprint(f"Found {len(xml_files)} XML documentation files in Classes directory")
         
-        for xml_file in xml_files:
-            process_single_xml_file(xml_file, output_dir, class_files)
+        process_xml_files(xml_files, output_dir, class_files, jobs, manifest)
     else:
         # Fallback to Assembly-CSharp.xml if Classes directory doesn't exist
         xml_file = Path("Assembly-CSharp.xml")
         if xml_file.exists():
-            process_single_xml_file(xml_file, output_dir, class_files)
+            process_xml_files([xml_file], output_dir, class_files, manifest=manifest)
         else:
             qprint("Error: No XML documentation files found!")
             return
@@ -1135,6 +1349,21 @@ def main():
     qprint("Creating index page...")
     create_index_page(class_files, output_dir)
     
+    save_wiki_manifest(manifest)
+    
+    # Verify every link and anchor in the generated pages
+    checked_links, broken_links, duplicate_anchors = check_wiki_links(output_dir)
+    if broken_links:
+        qprint(f"\nError: {len(broken_links)} of {checked_links} links are broken:")
+        for page, target in broken_links:
+            qprint(f"  {page}: {target}")
+    if duplicate_anchors:
+        qprint(f"\nError: {len(duplicate_anchors)} anchors are defined more than once:")
+        for page, anchor in duplicate_anchors:
+            qprint(f"  {page}: #{anchor}")
+    if not broken_links and not duplicate_anchors:
+        qprint(f"\nChecked {checked_links} links: all targets exist")
+    
     qprint(f"\nGenerated {len(class_files)} wiki pages in {output_dir}/")
     qprint("Files created:")
     qprint(f"- Home.md (index page)")
@@ -1144,6 +1373,9 @@ def main():
     qprint(f"\nTo use with GitHub wiki:")
     qprint(f"1. Copy all .md files from {output_dir}/ to your GitHub wiki repository")
     qprint(f"2. The Home.md file will serve as your wiki's main page")
+    
+    if broken_links or duplicate_anchors:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
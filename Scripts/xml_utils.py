@@ -8,8 +8,18 @@ import re
 import html
 import os
 import sys
-from typing import List, Dict, Tuple, Optional, Union
-from functools import wraps
+import mmap
+import stat
+import itertools
+from typing import List, Dict, Tuple, Optional, Union, Iterator, Iterable, NamedTuple, Callable
+from functools import wraps, lru_cache
+
+from member_names import split_member_name
+
+
+# Version of the parsed data structures produced by this module.
+# Bump this whenever read_xml_file() output changes so on-disk caches are invalidated.
+XML_UTILS_VERSION = 3
 
 
 def is_test_mode():
@@ -106,6 +116,7 @@ class XMLPatterns:
     PARAM = re.compile(r'<param\s+name="([^"]*)">(.*?)</param>', re.DOTALL)
     RETURNS = re.compile(r'<returns>(.*?)</returns>', re.DOTALL)
     REMARKS = re.compile(r'<remarks>(.*?)</remarks>', re.DOTALL)
+    VALUE = re.compile(r'<value>(.*?)</value>', re.DOTALL)
     
     # Section parsing pattern from tracking files
     TRACKING_SECTION = re.compile(r'^\d+\.\s+\*\*([^*]+)\*\*\s+-\s+[^\n]+', re.MULTILINE)
@@ -210,16 +221,21 @@ class MemberParser:
     """Parses and extracts information from member elements"""
     
     @staticmethod
-    def get_member_name(member_lines: Union[List[str], Dict]) -> str:
+    def get_member_name(member_lines: Union[List[str], Dict, 'MemberRecord']) -> str:
         """
         Extract member name from XML member element for sorting.
         
         Args:
-            member_lines: Either a list of lines or a dict with 'lines' key
+            member_lines: A MemberRecord, a list of lines or a dict with 'lines' key
             
         Returns:
             Member name for sorting
         """
+        # Parsed records already carry the name attribute
+        if isinstance(member_lines, MemberRecord):
+            match = re.match(r'[MFP]:[^.]+\.([^"(]+)', member_lines.name or '')
+            return match.group(1) if match else member_lines.lines[0] if member_lines.lines else ""
+        
         # Handle both list and dict inputs
         if isinstance(member_lines, dict):
             lines = member_lines.get('lines', [])
@@ -233,16 +249,18 @@ class MemberParser:
         return match.group(1) if match else lines[0] if lines else ""
     
     @staticmethod
-    def get_member_type(member_lines: Union[List[str], str]) -> str:
+    def get_member_type(member_lines: Union[List[str], str, 'MemberRecord']) -> str:
         """
         Determine member type from XML member element.
         
         Args:
-            member_lines: Either a list of lines or full text
+            member_lines: A MemberRecord, a list of lines or full text
             
         Returns:
             'method', 'property', 'field', or 'unknown'
         """
+        if isinstance(member_lines, MemberRecord):
+            return member_lines.kind
         if isinstance(member_lines, list):
             full_text = ' '.join(member_lines)
         else:
@@ -366,16 +384,7 @@ class MemberParser:
         Returns:
             Tuple of (type_prefix, class_name, member_signature)
         """
-        if not name_attr or len(name_attr) < 3:
-            return ('', '', '')
-            
-        type_prefix = name_attr[0]  # M, P, or F
-        name_without_prefix = name_attr[2:]  # Remove "M:" etc
-        
-        parts = name_without_prefix.split('.', 1)
-        if len(parts) == 2:
-            return (type_prefix, parts[0], parts[1])
-        return (type_prefix, parts[0] if parts else '', '')
+        return split_member_name(name_attr)
 
 
 class XMLFormatter:
@@ -479,122 +488,429 @@ class XMLFormatter:
         return lines if lines else [indent + line.strip()]
 
 
-class XMLFileReader:
-    """Reads and parses XML documentation files"""
+class MemberRecord:
+    """
+    A single member element, parsed once from its XML lines.
     
-    @staticmethod
-    def read_xml_file(xml_path: str) -> Dict:
+    Text fields hold the raw inner XML of the corresponding tag (entities are not
+    decoded and whitespace is not normalized), or None if the tag is absent.
+    params is a list of (name, description) tuples in document order.
+    section and subsection record where the reader found the member, and position
+    is its 0-based index among the members of the file in document order.
+    
+    For compatibility with code that treats members as lists of lines, iterating,
+    indexing and len() operate on the original lines.
+    """
+    
+    __slots__ = ('name', 'kind', 'summary', 'params', 'returns', 'remarks', 'value', 'lines',
+                 'section', 'subsection', 'position')
+    
+    KIND_BY_PREFIX = {'M:': 'method', 'P:': 'property', 'F:': 'field'}
+    
+    def __init__(self, name: Optional[str], kind: str = 'unknown', summary: Optional[str] = None,
+                 params: Optional[List[Tuple[str, str]]] = None, returns: Optional[str] = None,
+                 remarks: Optional[str] = None, value: Optional[str] = None,
+                 lines: Optional[List[str]] = None, section: Optional[str] = None,
+                 subsection: Optional[str] = None, position: int = -1):
+        self.name = name
+        self.kind = kind
+        self.summary = summary
+        self.params = params if params is not None else []
+        self.returns = returns
+        self.remarks = remarks
+        self.value = value
+        self.lines = lines if lines is not None else []
+        self.section = section
+        self.subsection = subsection
+        self.position = position
+    
+    @classmethod
+    def from_lines(cls, member_lines: List[str]) -> 'MemberRecord':
         """
-        Read and parse XML file into structured sections and members.
+        Parse a member element from its XML lines.
         
         Args:
-            xml_path: Path to XML file
+            member_lines: List of XML lines for a member element
             
         Returns:
-            dict with 'header_lines', 'footer_lines', and 'sections'
-            Each section now includes a 'subsections' dict organizing members by type
+            MemberRecord; name is None if the lines have no name attribute
         """
-        with open(xml_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        member_text = '\n'.join(member_lines)
         
-        lines = content.split('\n')
+        name_match = XMLPatterns.MEMBER_NAME.search(member_text)
+        name = name_match.group(1) if name_match else None
+        kind = cls.KIND_BY_PREFIX.get(name[:2], 'unknown') if name else 'unknown'
         
-        # Find where members section starts and ends
-        members_start = -1
-        members_end = -1
+        summary_match = XMLPatterns.SUMMARY.search(member_text)
+        returns_match = XMLPatterns.RETURNS.search(member_text)
+        remarks_match = XMLPatterns.REMARKS.search(member_text)
+        value_match = XMLPatterns.VALUE.search(member_text)
+        
+        return cls(
+            name=name,
+            kind=kind,
+            summary=summary_match.group(1) if summary_match else None,
+            params=XMLPatterns.PARAM.findall(member_text),
+            returns=returns_match.group(1) if returns_match else None,
+            remarks=remarks_match.group(1) if remarks_match else None,
+            value=value_match.group(1) if value_match else None,
+            lines=member_lines
+        )
+    
+    @classmethod
+    def from_event(cls, event: 'XMLEvent', position: int) -> 'MemberRecord':
+        """
+        Parse a 'member' event from XMLFileReader.iter_xml_events().
         
-        for i, line in enumerate(lines):
-            if '<members>' in line:
-                members_start = i
-            elif '</members>' in line:
-                members_end = i
-                break
+        Args:
+            event: Member event carrying the lines, section and subsection
+            position: 0-based index of the member in the file
+            
+        Returns:
+            MemberRecord with its section, subsection and position filled in
+        """
+        record = cls.from_lines(event.lines)
+        record.section = event.section
+        record.subsection = event.subsection
+        record.position = position
+        return record
+    
+    def __iter__(self):
+        return iter(self.lines)
+    
+    def __len__(self) -> int:
+        return len(self.lines)
+    
+    def __getitem__(self, index):
+        return self.lines[index]
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, MemberRecord):
+            return self.lines == other.lines
+        if isinstance(other, list):
+            return self.lines == other
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"MemberRecord({self.name!r}, kind={self.kind!r})"
+
+
+class XMLEvent(NamedTuple):
+    """
+    A single structural event produced by XMLFileReader.iter_xml_events().
+
+    kind is one of 'header', 'section', 'subsection', 'member' or 'footer'.
+    section/subsection name the section and Methods/Properties/Fields subsection
+    the event belongs to, and line_number is the 0-based line the event starts on.
+    """
+    kind: str
+    lines: List[str]
+    section: Optional[str] = None
+    subsection: Optional[str] = None
+    line_number: int = 0
+
+
+class XMLFileReader:
+    """Reads and parses XML documentation files"""
+    
+    @staticmethod
+    def _iter_lines(f) -> Iterator[str]:
+        """
+        Yield lines from an open text file without their line endings.
         
-        if members_start == -1 or members_end == -1:
-            raise ValueError("Could not find members section")
+        Matches content.split('\n'), including the trailing empty line
+        produced when the file ends with a newline.
+        """
+        line = None
+        for line in f:
+            yield line[:-1] if line.endswith('\n') else line
+        if line is None or line.endswith('\n'):
+            yield ''
+    
+    @staticmethod
+    def iter_xml_events(xml_path: str) -> Iterator[XMLEvent]:
+        """
+        Stream an XML documentation file as a sequence of structural events.
         
-        # Extract header and footer
-        header_lines = lines[:members_start + 1]
-        footer_lines = lines[members_end:]
+        The file is read line by line, so memory use is bounded by the largest
+        single member element rather than the size of the file.
         
-        # Parse members section - Phase 1: Collect all data
-        sections = {}
-        current_section = None
-        current_subsection_type = None
-        
-        i = members_start + 1
-        while i < members_end:
-            line = lines[i]
-            
-            # Check for section comment
-            if '<!--' in line and '-->' in line:
-                match = re.search(r'<!--\s*(.+?)\s*-->', line)
-                if match:
-                    comment_text = match.group(1).strip()
-                    
-                    # Check if this is a subsection comment (ends with Methods/Properties/Fields)
-                    subsection_match = re.match(r'^(.+?)\s+(Methods|Properties|Fields)$', comment_text)
-                    
-                    if subsection_match:
-                        # This is a subsection comment
-                        section_name = subsection_match.group(1).strip()
-                        subsection_type = subsection_match.group(2)
-                        
-                        if section_name not in sections:
-                            sections[section_name] = {
-                                'comments': [],
-                                'subsections': {}
-                            }
-                        
-                        sections[section_name]['comments'].append(line)
-                        current_section = section_name
-                        current_subsection_type = subsection_type
-                        
-                        # Initialize subsection
-                        if subsection_type not in sections[section_name]['subsections']:
-                            sections[section_name]['subsections'][subsection_type] = {
-                                'comment': line.rstrip('\n'),  # Keep indentation, just remove newline
-                                'members': []
-                            }
-                    else:
-                        # This is a regular section comment (no type suffix)
-                        section_name = comment_text
+        Args:
+            xml_path: Path to XML file
+            
+        Yields:
+            XMLEvent tuples in file order: one 'header' event (all lines up to and
+            including <members>), 'section'/'subsection' events for section comments,
+            a 'member' event per member element, and one 'footer' event
+            (</members> to end of file)
+            
+        Raises:
+            ValueError: If the members section is missing or a member appears
+                        outside of a Methods/Properties/Fields subsection
+        """
+        with open(xml_path, 'r', encoding='utf-8') as f:
+            lines = XMLFileReader._iter_lines(f)
+            
+            # Header: everything up to and including the <members> line
+            header_lines = []
+            members_start = -1
+            for i, line in enumerate(lines):
+                header_lines.append(line)
+                if '<members>' in line:
+                    members_start = i
+                    break
+                elif '</members>' in line:
+                    break
+            
+            if members_start == -1:
+                raise ValueError("Could not find members section")
+            
+            yield XMLEvent('header', header_lines)
+            
+            current_section = None
+            current_subsection_type = None
+            member_lines = None
+            member_start = 0
+            footer_lines = None
+            
+            for i, line in enumerate(lines, members_start + 1):
+                if footer_lines is not None:
+                    footer_lines.append(line)
+                    continue
+                
+                if member_lines is not None:
+                    # Collecting lines for the current member element
+                    if '</members>' not in line:
+                        member_lines.append(line)
+                        if '</member>' not in line:
+                            continue
+                    member_event = XMLFileReader._member_event(
+                        member_lines, current_section, current_subsection_type,
+                        member_start, members_start
+                    )
+                    member_lines = None
+                    if member_event:
+                        yield member_event
+                    if '</members>' not in line:
+                        continue
+                
+                if '</members>' in line:
+                    footer_lines = [line]
+                
+                # Check for section comment
+                elif '<!--' in line and '-->' in line:
+                    match = re.search(r'<!--\s*(.+?)\s*-->', line)
+                    if match:
+                        comment_text = match.group(1).strip()
                         
-                        if section_name not in sections:
-                            sections[section_name] = {
-                                'comments': [],
-                                'subsections': {}
-                            }
+                        # Check if this is a subsection comment (ends with Methods/Properties/Fields)
+                        subsection_match = re.match(r'^(.+?)\s+(Methods|Properties|Fields)$', comment_text)
                         
-                        sections[section_name]['comments'].append(line)
-                        current_section = section_name
-                        current_subsection_type = None
-            
-            # Check for member element
-            elif '<member' in line:
-                member_lines = [line]
-                j = i + 1
-                
-                # Collect all lines for this member
-                while j < members_end and '</member>' not in lines[j - 1]:
-                    if j < len(lines):
-                        member_lines.append(lines[j])
-                    j += 1
+                        if subsection_match:
+                            current_section = subsection_match.group(1).strip()
+                            current_subsection_type = subsection_match.group(2)
+                            yield XMLEvent('subsection', [line], current_section, current_subsection_type, i)
+                        else:
+                            # This is a regular section comment (no type suffix)
+                            current_section = comment_text
+                            current_subsection_type = None
+                            yield XMLEvent('section', [line], current_section, None, i)
                 
-                if current_section:
-                    # Only add to subsection - members must be in subsections
-                    if current_subsection_type and current_subsection_type in sections[current_section]['subsections']:
-                        sections[current_section]['subsections'][current_subsection_type]['members'].append(member_lines)
-                    else:
-                        # Members outside of subsections are invalid
-                        raise ValueError(
-                            f"Invalid XML format: Found member outside of a subsection. All members must be within "
-                            f"Methods/Properties/Fields subsections. Member found after line {i + members_start + 1}"
+                # Check for member element
+                elif '<member' in line:
+                    member_lines = [line]
+                    member_start = i
+                    if '</member>' in line:
+                        member_event = XMLFileReader._member_event(
+                            member_lines, current_section, current_subsection_type,
+                            member_start, members_start
                         )
+                        member_lines = None
+                        if member_event:
+                            yield member_event
+            
+            if footer_lines is None:
+                raise ValueError("Could not find members section")
+            
+            yield XMLEvent('footer', footer_lines)
+    
+    @staticmethod
+    def iter_member_records(xml_path: str) -> Iterator[MemberRecord]:
+        """
+        Stream the members of an XML file as parsed records, in document order.
+        
+        Only one member is held in memory at a time; section comments are applied
+        to the records instead of being returned.
+        
+        Args:
+            xml_path: Path to XML file
+            
+        Yields:
+            MemberRecord for each member, with section, subsection and position set
+        """
+        position = 0
+        for event in XMLFileReader.iter_xml_events(xml_path):
+            if event.kind == 'member':
+                yield MemberRecord.from_event(event, position)
+                position += 1
+    
+    @staticmethod
+    def iter_sections(xml_path: str, frame: Optional[Dict] = None) -> Iterator[Tuple[str, Dict]]:
+        """
+        Stream the sections of an XML file, one section in memory at a time.
+        
+        Yields the same (section_name, section_data) pairs as read_xml_file()['sections'].items(),
+        so memory use is bounded by the largest section rather than the whole file.
+        read_xml_file() merges a section that comes back after another one into its first
+        appearance; files like that are detected up front and read with read_xml_file().
+        
+        Args:
+            xml_path: Path to XML file
+            frame: Optional dict that gets the file's 'header_lines' before the first
+                   section is yielded and its 'footer_lines' after the last one
+        
+        Yields:
+            (section_name, section_data) tuples in file order
+        """
+        if frame is None:
+            frame = {}
+        
+        if XMLFileReader._has_split_sections(xml_path):
+            xml_data = XMLFileReader.read_xml_file(xml_path)
+            frame['header_lines'] = xml_data['header_lines']
+            yield from xml_data['sections'].items()
+            frame['footer_lines'] = xml_data['footer_lines']
+            return
+        
+        section_name = None
+        section_data = None
+        position = 0
+        
+        for event in XMLFileReader.iter_xml_events(xml_path):
+            if event.kind == 'member':
+                record = MemberRecord.from_event(event, position)
+                position += 1
+                section_data['subsections'][event.subsection]['members'].append(record)
+            elif event.kind in ('section', 'subsection'):
+                if event.section != section_name:
+                    if section_data is not None:
+                        yield section_name, section_data
+                    section_name = event.section
+                    section_data = {
+                        'comments': [],
+                        'subsections': {}
+                    }
+                line = event.lines[0]
+                section_data['comments'].append(line)
                 
-                i = j - 1
+                if event.kind == 'subsection' and event.subsection not in section_data['subsections']:
+                    section_data['subsections'][event.subsection] = {
+                        'comment': line.rstrip('\n'),
+                        'members': []
+                    }
+            elif event.kind == 'header':
+                frame['header_lines'] = event.lines
+            elif event.kind == 'footer':
+                if section_data is not None:
+                    yield section_name, section_data
+                    section_data = None
+                frame['footer_lines'] = event.lines
+    
+    @staticmethod
+    def _has_split_sections(xml_path: str, chunk_size: int = 1 << 20) -> bool:
+        """
+        Quick check for a section comment that comes back after a different section.
+        
+        Scans every comment in the file, including any inside member text, so it can
+        report a split section where iter_xml_events() would see none, but never misses one.
+        """
+        pattern = re.compile(rb'<!--\s*(.+?)\s*-->')
+        seen = set()
+        current = None
+        remainder = b''
+        with open(xml_path, 'rb') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                data = remainder + chunk
+                if chunk:
+                    # Only scan complete lines; the rest is carried over to the next chunk
+                    cut = data.rfind(b'\n') + 1
+                    data, remainder = data[:cut], data[cut:]
+                for match in pattern.finditer(data):
+                    comment_text = match.group(1).decode('utf-8', 'replace').strip()
+                    subsection_match = re.match(r'^(.+?)\s+(Methods|Properties|Fields)$', comment_text)
+                    section = subsection_match.group(1).strip() if subsection_match else comment_text
+                    if section != current:
+                        if section in seen:
+                            return True
+                        seen.add(section)
+                        current = section
+                if not chunk:
+                    return False
+    
+    @staticmethod
+    def _member_event(member_lines: List[str], section: Optional[str], subsection_type: Optional[str],
+                      line_number: int, members_start: int) -> Optional[XMLEvent]:
+        """
+        Build the event for a completed member element, validating its placement.
+        
+        Members that appear before any section comment are dropped.
+        """
+        if not section:
+            return None
+        if not subsection_type:
+            # Members outside of subsections are invalid
+            raise ValueError(
+                f"Invalid XML format: Found member outside of a subsection. All members must be within "
+                f"Methods/Properties/Fields subsections. Member found after line {line_number + members_start + 1}"
+            )
+        return XMLEvent('member', member_lines, section, subsection_type, line_number)
+    
+    @staticmethod
+    def read_xml_file(xml_path: str) -> Dict:
+        """
+        Read and parse XML file into structured sections and members.
+        
+        Args:
+            xml_path: Path to XML file
             
-            i += 1
+        Returns:
+            dict with 'header_lines', 'footer_lines', and 'sections'
+            Each section now includes a 'subsections' dict organizing members by type,
+            with each member parsed into a MemberRecord
+        """
+        header_lines = []
+        footer_lines = []
+        sections = {}
+        position = 0
+        
+        for event in XMLFileReader.iter_xml_events(xml_path):
+            if event.kind == 'member':
+                record = MemberRecord.from_event(event, position)
+                position += 1
+                sections[event.section]['subsections'][event.subsection]['members'].append(record)
+            elif event.kind in ('section', 'subsection'):
+                if event.section not in sections:
+                    sections[event.section] = {
+                        'comments': [],
+                        'subsections': {}
+                    }
+                section_data = sections[event.section]
+                line = event.lines[0]
+                section_data['comments'].append(line)
+                
+                # Initialize subsection
+                if event.kind == 'subsection' and event.subsection not in section_data['subsections']:
+                    section_data['subsections'][event.subsection] = {
+                        'comment': line.rstrip('\n'),  # Keep indentation, just remove newline
+                        'members': []
+                    }
+            elif event.kind == 'header':
+                header_lines = event.lines
+            elif event.kind == 'footer':
+                footer_lines = event.lines
         
         return {
             'header_lines': header_lines,
@@ -624,6 +940,145 @@ class XMLFileReader:
         return members
 
 
+class XMLParseCache:
+    """
+    On-disk cache of XMLFileReader.read_xml_file() results.
+    
+    Entries are keyed by file path, size, mtime and a SHA-256 of the content, and are
+    ignored when XML_UTILS_VERSION changes. A file whose size and mtime are unchanged
+    is served from the cache without being read; if only the mtime changed (e.g. after
+    a checkout), the content hash decides whether the entry is still valid.
+    """
+    
+    DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'xml-parse')
+    
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Args:
+            cache_dir: Directory for cache entries (defaults to Scripts/.cache/xml-parse)
+        """
+        self.cache_dir = cache_dir or XMLParseCache.DEFAULT_CACHE_DIR
+        self.hits = 0
+        self.misses = 0
+    
+    def _entry_path(self, xml_path: str) -> str:
+        """Get the cache entry path for an XML file"""
+        import hashlib
+        key = hashlib.sha1(os.path.abspath(xml_path).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.pickle")
+    
+    def _load_entry(self, entry_path: str, xml_path: str) -> Optional[Dict]:
+        """Load a cache entry, returning None if it is missing, unreadable or from another version"""
+        import pickle
+        try:
+            with open(entry_path, 'rb') as f:
+                entry = pickle.load(f)
+        except Exception:
+            return None
+        if (not isinstance(entry, dict) or entry.get('version') != XML_UTILS_VERSION
+                or entry.get('path') != os.path.abspath(xml_path)):
+            return None
+        return entry
+    
+    def _store_entry(self, entry_path: str, entry: Dict):
+        """Atomically write a cache entry so concurrent readers never see a partial file"""
+        import pickle
+        import tempfile
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, entry_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError:
+            # The cache is an optimization - failing to write it is not an error
+            pass
+    
+    def read_xml_file(self, xml_path: str) -> Dict:
+        """
+        Read and parse an XML file, using the cached structure when it is still valid.
+        
+        Args:
+            xml_path: Path to XML file
+            
+        Returns:
+            Same structure as XMLFileReader.read_xml_file()
+        """
+        file_stat = os.stat(xml_path)
+        entry_path = self._entry_path(xml_path)
+        entry = self._load_entry(entry_path, xml_path)
+        
+        if entry and entry['size'] == file_stat.st_size and entry['mtime_ns'] == file_stat.st_mtime_ns:
+            self.hits += 1
+            return entry['data']
+        
+        import hashlib
+        with open(xml_path, 'rb') as f:
+            content_hash = hashlib.sha256(f.read()).hexdigest()
+        
+        if entry and entry['size'] == file_stat.st_size and entry['sha256'] == content_hash:
+            # Content is unchanged, only the mtime moved - refresh the key
+            self.hits += 1
+            entry['mtime_ns'] = file_stat.st_mtime_ns
+            self._store_entry(entry_path, entry)
+            return entry['data']
+        
+        self.misses += 1
+        data = XMLFileReader.read_xml_file(xml_path)
+        self._store_entry(entry_path, {
+            'version': XML_UTILS_VERSION,
+            'path': os.path.abspath(xml_path),
+            'size': file_stat.st_size,
+            'mtime_ns': file_stat.st_mtime_ns,
+            'sha256': content_hash,
+            'data': data
+        })
+        return data
+    
+    def clear(self):
+        """Remove all cache entries"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith('.pickle') or filename.endswith('.tmp'):
+                os.unlink(os.path.join(self.cache_dir, filename))
+
+
+@lru_cache(maxsize=4096)
+def _wrap_normalized_text(text: str, available_width: int) -> Tuple[str, ...]:
+    """
+    Greedy word wrap of whitespace-normalized text, tracking the running line width.
+    
+    A word that does not fit is moved to the next line; a single word longer than
+    the available width gets a line of its own.
+    """
+    lines = []
+    current_line = []
+    current_width = 0
+    
+    for word in text.split(' '):
+        if not word:
+            continue
+        if current_line and current_width + 1 + len(word) > available_width:
+            # Finish current line
+            lines.append(' '.join(current_line))
+            current_line = [word]
+            current_width = len(word)
+        else:
+            current_width += len(word) + 1 if current_line else len(word)
+            current_line.append(word)
+    
+    # Add remaining words
+    if current_line:
+        lines.append(' '.join(current_line))
+    
+    return tuple(lines)
+
+
 class XMLFileWriter:
     """Writes XML documentation files"""
     
@@ -692,57 +1147,280 @@ class XMLFileWriter:
         return 4
     
     @staticmethod
-    def write_xml_file(xml_path: str, data: Dict, format_content: bool = True):
+    def iter_xml_lines(data: Dict, format_content: bool = True) -> Iterator[str]:
         """
-        Write structured data back to XML file with automatic indentation and formatting.
+        Generate the output lines for structured XML data one at a time.
         
         Args:
-            xml_path: Path to output file
             data: Dict with 'header_lines', 'footer_lines', and 'sections'
                   Each section may have 'subsections' dict organizing members by type
             format_content: If True (default), apply text wrapping and whitespace normalization
+            
+        Yields:
+            Output lines without line endings
         """
-        lines = []
-        
         # Process header with proper indentation
         for line in data['header_lines']:
             indent_level = XMLFileWriter._get_indent_level_for_line(line)
-            lines.append(XMLFileWriter._apply_indentation(line, indent_level))
+            yield XMLFileWriter._apply_indentation(line, indent_level)
         
         # Process sections with formatting
-        for section_name, section_data in data['sections'].items():
-            if not section_data.get('subsections'):
-                # Sections without subsections are invalid
-                raise ValueError(
-                    f"Invalid XML format: Section '{section_name}' has no subsections. "
-                    f"All sections must have Methods/Properties/Fields subsections."
-                )
-            
-            # Handle subsections in order: Methods, Properties, Fields
-            subsec_order = {'Methods': 0, 'Properties': 1, 'Fields': 2}
-            sorted_subsections = sorted(
-                section_data['subsections'].items(),
-                key=lambda x: subsec_order.get(x[0], 3)
-            )
-            
-            for subsec_type, subsec_data in sorted_subsections:
-                # Add subsection comment with proper indentation
-                comment = subsec_data['comment']
-                lines.append(XMLFileWriter._apply_indentation(comment, 2))
-                
-                # Process and format members
-                for member_lines in subsec_data['members']:
-                    formatted_lines = XMLFileWriter._format_member_lines(member_lines, format_content)
-                    lines.extend(formatted_lines)
+        for section_data in data['sections'].values():
+            yield from XMLFileWriter.iter_section_lines(section_data, format_content)
         
         # Process footer
         for line in data['footer_lines']:
             indent_level = XMLFileWriter._get_indent_level_for_line(line)
-            lines.append(XMLFileWriter._apply_indentation(line, indent_level))
+            yield XMLFileWriter._apply_indentation(line, indent_level)
+    
+    @staticmethod
+    def iter_section_lines(section_data: Dict, format_content: bool = True) -> Iterator[str]:
+        """
+        Generate the output lines for one section.
+        
+        Args:
+            section_data: Section dict with a 'subsections' dict organizing members by type
+            format_content: If True (default), apply text wrapping and whitespace normalization
+            
+        Yields:
+            Output lines without line endings
+        """
+        # Handle subsections in order: Methods, Properties, Fields
+        subsec_order = {'Methods': 0, 'Properties': 1, 'Fields': 2}
+        sorted_subsections = sorted(
+            section_data['subsections'].items(),
+            key=lambda x: subsec_order.get(x[0], 3)
+        )
+        
+        for subsec_type, subsec_data in sorted_subsections:
+            # Add subsection comment with proper indentation
+            comment = subsec_data['comment']
+            yield XMLFileWriter._apply_indentation(comment, 2)
+            
+            # Process and format members
+            for member_lines in subsec_data['members']:
+                yield from XMLFileWriter._format_member_lines(member_lines, format_content)
+    
+    @staticmethod
+    def check_section(section_name: str, section_data: Dict):
+        """
+        Reject a section that has no Methods/Properties/Fields subsections.
         
-        # Write file
-        with open(xml_path, 'w', encoding='utf-8', newline='\r\n') as f:
-            f.write('\n'.join(lines))
+        Raises:
+            ValueError: If the section has no subsections
+        """
+        if not section_data.get('subsections'):
+            # Sections without subsections are invalid
+            raise ValueError(
+                f"Invalid XML format: Section '{section_name}' has no subsections. "
+                f"All sections must have Methods/Properties/Fields subsections."
+            )
+    
+    @staticmethod
+    def iter_xml_bytes(data: Dict, format_content: bool = True, chunk_size: int = 65536) -> Iterator[bytes]:
+        """
+        Generate the encoded file content in chunks of roughly chunk_size bytes.
+        
+        Lines are joined with CRLF line endings and the last line has no line ending,
+        matching what write_xml_file() puts on disk.
+        
+        Args:
+            data: Dict with 'header_lines', 'footer_lines', and 'sections'
+            format_content: If True (default), apply text wrapping and whitespace normalization
+            chunk_size: Approximate size of each yielded chunk
+            
+        Yields:
+            UTF-8 encoded chunks of the rendered file
+        """
+        return XMLFileWriter.iter_line_chunks(XMLFileWriter.iter_xml_lines(data, format_content),
+                                              '\r\n', chunk_size)
+    
+    @staticmethod
+    def iter_line_chunks(lines: Iterable[str], line_ending: str = '\r\n',
+                         chunk_size: int = 65536) -> Iterator[bytes]:
+        """
+        Join lines with line_ending and encode them as UTF-8 in chunks of roughly chunk_size bytes.
+        
+        The last line has no line ending. Lines are consumed as chunks are requested, so
+        the joined text is never held in memory as a whole.
+        
+        Args:
+            lines: Lines without line endings
+            line_ending: Line ending to join the lines with
+            chunk_size: Approximate size of each yielded chunk
+            
+        Yields:
+            UTF-8 encoded chunks
+        """
+        parts = []
+        size = 0
+        separator = ''
+        for line in lines:
+            part = separator + line
+            parts.append(part)
+            size += len(part)
+            separator = '\n'
+            if size >= chunk_size:
+                text = ''.join(parts)
+                if line_ending != '\n':
+                    text = text.replace('\n', line_ending)
+                yield text.encode('utf-8')
+                parts = []
+                size = 0
+        if parts:
+            text = ''.join(parts)
+            if line_ending != '\n':
+                text = text.replace('\n', line_ending)
+            yield text.encode('utf-8')
+    
+    @staticmethod
+    def _open_temp_file(xml_path: str):
+        """Create a temporary file next to xml_path so it can be renamed over it atomically"""
+        import tempfile
+        directory = os.path.dirname(os.path.abspath(xml_path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(xml_path) + '.',
+                                         suffix='.tmp')
+        return os.fdopen(fd, 'wb'), temp_path
+    
+    @staticmethod
+    def write_xml_file(xml_path: str, data: Dict, format_content: bool = True,
+                       skip_unchanged: bool = False) -> bool:
+        """
+        Write structured data back to XML file with automatic indentation and formatting.
+        
+        The content is written to a temporary file in the same directory which is then
+        renamed over xml_path, so readers never see a partially written file.
+        
+        Args:
+            xml_path: Path to output file
+            data: Dict with 'header_lines', 'footer_lines', and 'sections'
+                  Each section may have 'subsections' dict organizing members by type
+            format_content: If True (default), apply text wrapping and whitespace normalization
+            skip_unchanged: If True, compare the rendered bytes against the existing file
+                            as they are generated and leave the file untouched (including
+                            its mtime) when they are identical
+            
+        Returns:
+            True if the file was written, False if it was skipped as unchanged
+        """
+        # Validate before writing anything so an invalid structure never touches the file
+        for section_name, section_data in data['sections'].items():
+            XMLFileWriter.check_section(section_name, section_data)
+        
+        return XMLFileWriter.write_chunks(xml_path, XMLFileWriter.iter_xml_bytes(data, format_content),
+                                          skip_unchanged)
+    
+    @staticmethod
+    def write_xml_sections(xml_path: str, sections: Iterable[Tuple[str, Dict]], frame: Dict,
+                           format_content: bool = True, skip_unchanged: bool = False) -> bool:
+        """
+        Write sections streamed by XMLFileReader.iter_sections() as they arrive.
+        
+        Produces the same file as write_xml_file() would for the whole structure, while
+        only one section is in memory at a time. A section without subsections aborts
+        the write and leaves xml_path untouched.
+        
+        Args:
+            xml_path: Path to output file
+            sections: (section_name, section_data) pairs, e.g. from XMLFileReader.iter_sections()
+            frame: Dict that receives 'header_lines' and 'footer_lines' while the
+                   sections are read (the frame argument of iter_sections())
+            format_content: If True (default), apply text wrapping and whitespace normalization
+            skip_unchanged: If True, leave the file untouched when the output is identical
+            
+        Returns:
+            True if the file was written, False if it was skipped as unchanged
+        """
+        def iter_lines():
+            section_iter = iter(sections)
+            # The header is only known once reading has started
+            first = next(section_iter, None)
+            for line in frame['header_lines']:
+                yield XMLFileWriter._apply_indentation(line, XMLFileWriter._get_indent_level_for_line(line))
+            
+            if first is not None:
+                for section_name, section_data in itertools.chain([first], section_iter):
+                    XMLFileWriter.check_section(section_name, section_data)
+                    yield from XMLFileWriter.iter_section_lines(section_data, format_content)
+            
+            for line in frame['footer_lines']:
+                yield XMLFileWriter._apply_indentation(line, XMLFileWriter._get_indent_level_for_line(line))
+        
+        return XMLFileWriter.write_chunks(xml_path, XMLFileWriter.iter_line_chunks(iter_lines()), skip_unchanged)
+    
+    @staticmethod
+    def write_chunks(path: str, chunks: Iterable[bytes], skip_unchanged: bool = False) -> bool:
+        """
+        Write a stream of byte chunks to a file atomically.
+        
+        The chunks are written to a temporary file in the same directory which is then
+        renamed over path, keeping the permissions of the file it replaces.
+        
+        Args:
+            path: Path to output file
+            chunks: Byte chunks making up the new content, consumed one at a time
+            skip_unchanged: If True, compare the chunks against the existing file as they
+                            arrive and leave the file untouched (including its mtime) when
+                            they are identical
+            
+        Returns:
+            True if the file was written, False if it was skipped as unchanged
+        """
+        existing = None
+        if skip_unchanged:
+            try:
+                existing = open(path, 'rb')
+            except FileNotFoundError:
+                existing = None
+        
+        temp_file = None
+        temp_path = None
+        matched = 0
+        
+        def start_temp_file():
+            # Output diverged from the existing file: copy the identical prefix, then continue
+            nonlocal temp_file, temp_path
+            temp_file, temp_path = XMLFileWriter._open_temp_file(path)
+            if matched:
+                existing.seek(0)
+                temp_file.write(existing.read(matched))
+        
+        try:
+            for chunk in chunks:
+                if temp_file is None:
+                    if existing is not None and existing.read(len(chunk)) == chunk:
+                        matched += len(chunk)
+                        continue
+                    start_temp_file()
+                temp_file.write(chunk)
+            
+            if temp_file is None:
+                if existing is not None and not existing.read(1):
+                    # Every byte matched and the existing file has nothing extra
+                    return False
+                start_temp_file()
+            
+            temp_file.close()
+            
+            # Keep the permissions of the file being replaced
+            try:
+                mode = stat.S_IMODE(os.stat(path).st_mode)
+            except FileNotFoundError:
+                umask = os.umask(0)
+                os.umask(umask)
+                mode = 0o666 & ~umask
+            os.chmod(temp_path, mode)
+            
+            os.replace(temp_path, path)
+            temp_path = None
+            return True
+        finally:
+            if existing is not None:
+                existing.close()
+            if temp_file is not None and not temp_file.closed:
+                temp_file.close()
+            if temp_path is not None:
+                os.unlink(temp_path)
     
     @staticmethod
     def _normalize_whitespace(text: str) -> str:
@@ -763,6 +1441,9 @@ class XMLFileWriter:
         """
         Wrap text to fit within target line length.
         
+        Results are memoized per (normalized text, indent, target length), so repeated
+        boilerplate text is only wrapped once per run.
+        
         Args:
             text: Text to wrap
             indent_length: Length of indentation (in characters)
@@ -773,42 +1454,17 @@ class XMLFileWriter:
         """
         if not text:
             return []
-            
-        words = text.split()
-        lines = []
-        current_line = []
-        
-        # Calculate available width for text
-        available_width = target_line_length - indent_length
-        
-        for word in words:
-            # Calculate current line length if we add this word
-            if current_line:
-                test_length = len(' '.join(current_line + [word]))
-            else:
-                test_length = len(word)
-            
-            # Check if adding this word would exceed the limit
-            if test_length > available_width and current_line:
-                # Finish current line
-                lines.append(' '.join(current_line))
-                current_line = [word]
-            else:
-                current_line.append(word)
         
-        # Add remaining words
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        return lines
+        normalized = ' '.join(text.split())
+        return list(_wrap_normalized_text(normalized, target_line_length - indent_length))
     
     @staticmethod
-    def _format_member_lines(member_lines: List[str], format_content: bool) -> List[str]:
+    def _format_member_lines(member_lines: Union[List[str], 'MemberRecord'], format_content: bool) -> List[str]:
         """
         Format member element lines with proper indentation and content formatting.
         
         Args:
-            member_lines: List of lines for a member element
+            member_lines: MemberRecord or list of lines for a member element
             format_content: If True, apply text wrapping and normalization
             
         Returns:
@@ -845,23 +1501,23 @@ class XMLFileWriter:
                     
             return formatted
         
-        # Parse member to extract components
-        member_text = '\n'.join(member_lines)
-        name_match = XMLPatterns.MEMBER_NAME.search(member_text)
-        if not name_match:
-            return member_lines  # Can't parse, return as-is
+        # Use the parsed member components, parsing raw lines only if needed
+        if isinstance(member_lines, MemberRecord):
+            record = member_lines
+        else:
+            record = MemberRecord.from_lines(member_lines)
+        if record.name is None:
+            return list(record.lines)  # Can't parse, return as-is
             
-        member_name = name_match.group(1)
         formatted = []
         
         # Member opening tag
-        formatted.append(f'        <member name="{member_name}">')
+        formatted.append(f'        <member name="{record.name}">')
         
-        # Extract and format each component in order
+        # Format each component in order
         # 1. Summary
-        summary_match = XMLPatterns.SUMMARY.search(member_text)
-        if summary_match:
-            summary_text = XMLFileWriter._normalize_whitespace(summary_match.group(1))
+        if record.summary is not None:
+            summary_text = XMLFileWriter._normalize_whitespace(record.summary)
             if summary_text:  # Only output non-empty summaries
                 formatted.append('            <summary>')
                 wrapped = XMLFileWriter._wrap_text(summary_text, 16)  # 4 levels * 4 spaces
@@ -870,22 +1526,19 @@ class XMLFileWriter:
                 formatted.append('            </summary>')
         
         # 2. Parameters (one line each)
-        params = XMLPatterns.PARAM.findall(member_text)
-        for param_name, param_desc in params:
+        for param_name, param_desc in record.params:
             param_desc = XMLFileWriter._normalize_whitespace(param_desc)
             formatted.append(f'            <param name="{param_name}">{param_desc}</param>')
         
         # 3. Returns (one line)
-        returns_match = XMLPatterns.RETURNS.search(member_text)
-        if returns_match:
-            returns_text = XMLFileWriter._normalize_whitespace(returns_match.group(1))
+        if record.returns is not None:
+            returns_text = XMLFileWriter._normalize_whitespace(record.returns)
             if returns_text:
                 formatted.append(f'            <returns>{returns_text}</returns>')
         
         # 4. Remarks (multi-line like summary)
-        remarks_match = XMLPatterns.REMARKS.search(member_text)
-        if remarks_match:
-            remarks_text = XMLFileWriter._normalize_whitespace(remarks_match.group(1))
+        if record.remarks is not None:
+            remarks_text = XMLFileWriter._normalize_whitespace(record.remarks)
             if remarks_text:  # Only output non-empty remarks
                 formatted.append('            <remarks>')
                 wrapped = XMLFileWriter._wrap_text(remarks_text, 16)  # 4 levels * 4 spaces
@@ -1030,6 +1683,387 @@ class XMLSectionExtractor:
         return extracted_data
 
 
+class MemberIndex:
+    """
+    Byte-offset index of the member elements in a combined XML file.
+    
+    build-documentation.py writes the index as a JSON sidecar next to Assembly-CSharp.xml.
+    Lookups memory-map the XML file and decode only the requested <member> block.
+    
+    Usage:
+        with MemberIndex('Assembly-CSharp.xml') as index:
+            print(index.get('F:Rambro.bulletShell'))
+    """
+    
+    INDEX_VERSION = 2
+    MEMBER_START = re.compile(rb'<member\s+name="([^"]*)"')
+    MEMBER_END = b'</member>'
+    
+    def __init__(self, xml_path: str, index_path: Optional[str] = None):
+        """
+        Open an XML file and its sidecar index for member lookups.
+        
+        If the sidecar is missing or was built for a different version of the
+        XML file (its size or modification time differs), the index is rebuilt in
+        memory from the XML file instead.
+        
+        Args:
+            xml_path: Path to the combined XML file
+            index_path: Path to the sidecar index (defaults to index_path_for(xml_path))
+        """
+        self.xml_path = xml_path
+        self.index_path = index_path or MemberIndex.index_path_for(xml_path)
+        self._file = open(xml_path, 'rb')
+        file_stat = os.fstat(self._file.fileno())
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if file_stat.st_size else b''
+        
+        index = MemberIndex._load_index(self.index_path)
+        if not MemberIndex._matches(index, file_stat):
+            index = MemberIndex.build_index(xml_path)
+        self.members = index['members']
+    
+    @staticmethod
+    def index_path_for(xml_path: str) -> str:
+        """
+        Get the sidecar index path for an XML file.
+        
+        Args:
+            xml_path: Path like "Assembly-CSharp.xml"
+            
+        Returns:
+            Path like "Assembly-CSharp.index.json"
+        """
+        return os.path.splitext(xml_path)[0] + '.index.json'
+    
+    @staticmethod
+    def build_index(xml_path: str) -> Dict:
+        """
+        Scan an XML file for member elements and record their byte ranges.
+        
+        Args:
+            xml_path: Path to XML file
+            
+        Returns:
+            dict with 'version', 'size', 'mtime_ns' (of the XML file), and 'members'
+            mapping each member name to an [offset, length] pair covering
+            <member ...> through </member>
+        """
+        members = {}
+        with open(xml_path, 'rb') as f:
+            file_stat = os.fstat(f.fileno())
+            size = file_stat.st_size
+            if size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    members = MemberIndex._scan_members(mm)
+        
+        return {
+            'version': MemberIndex.INDEX_VERSION,
+            'size': size,
+            'mtime_ns': file_stat.st_mtime_ns,
+            'members': members
+        }
+    
+    @staticmethod
+    def _scan_members(data) -> Dict[str, List[int]]:
+        """Map each member name in data (bytes or mmap) to its [offset, length]"""
+        members = {}
+        for match in MemberIndex.MEMBER_START.finditer(data):
+            start = match.start()
+            end = data.find(MemberIndex.MEMBER_END, match.end())
+            if end == -1:
+                break
+            name = match.group(1).decode('utf-8')
+            # Keep the first occurrence if a name is duplicated
+            if name not in members:
+                members[name] = [start, end + len(MemberIndex.MEMBER_END) - start]
+        return members
+    
+    @staticmethod
+    def iter_indexed_lines(lines: Iterable[str], add: Callable[[str, int, int], None],
+                           line_ending: str = '\r\n') -> Iterator[str]:
+        """
+        Pass lines through unchanged, recording the member elements they contain.
+        
+        Offsets are the ones the members get in the file the lines are joined into
+        with line_ending (as XMLFileWriter.iter_line_chunks() does), so the index of a
+        file can be collected while it is written instead of scanning it afterwards.
+        add is called for the same member elements _scan_members() would find in
+        that file, in file order, including repeated names.
+        
+        Args:
+            lines: Lines without line endings
+            add: Called with (name, offset, length) for each member element, e.g.
+                 MemberIndexBuilder.add
+            line_ending: Line ending the lines are joined with
+            
+        Yields:
+            The lines, unchanged
+        """
+        end_tag = MemberIndex.MEMBER_END.decode('ascii')
+        ending_size = len(line_ending.encode('utf-8'))
+        offset = 0
+        pending = []  # (name, offset) of member elements whose end tag hasn't been seen yet
+        
+        for line in lines:
+            yield line
+            is_ascii = line.isascii()
+            if '<member' in line or (pending and end_tag in line):
+                tags = [(match.start(), match.group(1)) for match in XMLPatterns.MEMBER_START.finditer(line)]
+                end = line.find(end_tag)
+                while end != -1:
+                    tags.append((end, None))
+                    end = line.find(end_tag, end + 1)
+                for position, name in sorted(tags, key=lambda tag: tag[0]):
+                    tag_offset = offset + (position if is_ascii else len(line[:position].encode('utf-8')))
+                    if name is not None:
+                        pending.append((name, tag_offset))
+                        continue
+                    for name, start in pending:
+                        add(name, start, tag_offset + len(end_tag) - start)
+                    pending = []
+            offset += (len(line) if is_ascii else len(line.encode('utf-8'))) + ending_size
+    
+    @staticmethod
+    def write_index(xml_path: str, index_path: Optional[str] = None) -> str:
+        """
+        Build the index for an XML file and write it as a JSON sidecar.
+        
+        Args:
+            xml_path: Path to XML file
+            index_path: Output path (defaults to index_path_for(xml_path))
+            
+        Returns:
+            Path of the written index file
+        """
+        import json
+        index_path = index_path or MemberIndex.index_path_for(xml_path)
+        index = MemberIndex.build_index(xml_path)
+        with open(index_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, separators=(',', ':'))
+        return index_path
+    
+    @staticmethod
+    def is_current(xml_path: str, index_path: Optional[str] = None) -> bool:
+        """
+        Check whether the sidecar index was built for the current version of an XML file.
+        
+        Args:
+            xml_path: Path to XML file
+            index_path: Path to the sidecar index (defaults to index_path_for(xml_path))
+            
+        Returns:
+            True if the sidecar exists and matches the file's size and modification time
+        """
+        try:
+            file_stat = os.stat(xml_path)
+        except OSError:
+            return False
+        return MemberIndex._matches(MemberIndex._load_index(index_path or MemberIndex.index_path_for(xml_path)),
+                                    file_stat)
+    
+    @staticmethod
+    def _matches(index: Optional[Dict], file_stat: os.stat_result) -> bool:
+        """Check a loaded index against the stat of the XML file it should describe"""
+        return (index is not None and index.get('size') == file_stat.st_size
+                and index.get('mtime_ns') == file_stat.st_mtime_ns)
+    
+    @staticmethod
+    def _load_index(index_path: str) -> Optional[Dict]:
+        """Load a sidecar index, returning None if it is missing, unreadable or outdated"""
+        import json
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(index, dict) or index.get('version') != MemberIndex.INDEX_VERSION:
+            return None
+        return index
+    
+    def get(self, member_name: str) -> Optional[str]:
+        """
+        Get the raw XML for a single member.
+        
+        Args:
+            member_name: Full member name like "M:Unit.Damage(System.Int32,...)"
+            
+        Returns:
+            The <member> element text, or None if the member is not in the index
+        """
+        entry = self.members.get(member_name)
+        if entry is None:
+            return None
+        data = self._slice(entry)
+        match = MemberIndex.MEMBER_START.match(data)
+        if not match or match.group(1).decode('utf-8', 'replace') != member_name:
+            # The index doesn't match the file after all (e.g. the file was rewritten
+            # within the timestamp resolution) - rescan the mapped file and retry
+            self.members = MemberIndex._scan_members(self._mmap)
+            entry = self.members.get(member_name)
+            if entry is None:
+                return None
+            data = self._slice(entry)
+        return data.decode('utf-8')
+    
+    def _slice(self, entry: List[int]) -> bytes:
+        offset, length = entry
+        return self._mmap[offset:offset + length]
+    
+    def names(self) -> List[str]:
+        """Get all indexed member names in file order"""
+        return list(self.members)
+    
+    def __contains__(self, member_name: str) -> bool:
+        return member_name in self.members
+    
+    def __len__(self) -> int:
+        return len(self.members)
+    
+    def close(self):
+        """Release the memory map and file handle"""
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class MemberIndexBuilder:
+    """
+    Collects the member offsets of an XML file while it is written and saves them as
+    the sidecar index MemberIndex reads.
+    
+    The entries are kept in a temporary SQLite database rather than a dict, so the
+    index of a very large combined file is built without holding every member name
+    in memory.
+    
+    Usage:
+        with MemberIndexBuilder() as builder:
+            lines = MemberIndex.iter_indexed_lines(lines, builder.add)
+            XMLFileWriter.write_chunks(xml_path, XMLFileWriter.iter_line_chunks(lines))
+            builder.write(xml_path)
+    """
+    
+    BATCH_SIZE = 1000
+    
+    def __init__(self):
+        import sqlite3
+        # An empty filename gives a private temporary database that spills to disk
+        self._db = sqlite3.connect('')
+        self._db.execute('CREATE TABLE members (name TEXT PRIMARY KEY, start INTEGER, length INTEGER)')
+        self._pending = []
+    
+    def add(self, name: str, offset: int, length: int):
+        """Record a member element; a name that was already added keeps its first entry"""
+        self._pending.append((name, offset, length))
+        if len(self._pending) >= MemberIndexBuilder.BATCH_SIZE:
+            self._flush()
+    
+    def _flush(self):
+        self._db.executemany('INSERT OR IGNORE INTO members VALUES (?, ?, ?)', self._pending)
+        self._pending = []
+    
+    def write(self, xml_path: str, index_path: Optional[str] = None) -> str:
+        """
+        Write the collected entries as the sidecar index of xml_path.
+        
+        Call this once xml_path has been written, since the index records its size
+        and modification time. The file has the same content as MemberIndex.write_index()
+        would write.
+        
+        Args:
+            xml_path: Path to the XML file the entries were collected for
+            index_path: Output path (defaults to MemberIndex.index_path_for(xml_path))
+            
+        Returns:
+            Path of the written index file
+        """
+        import json
+        self._flush()
+        index_path = index_path or MemberIndex.index_path_for(xml_path)
+        file_stat = os.stat(xml_path)
+        header = json.dumps({
+            'version': MemberIndex.INDEX_VERSION,
+            'size': file_stat.st_size,
+            'mtime_ns': file_stat.st_mtime_ns
+        }, separators=(',', ':'))
+        with open(index_path, 'w', encoding='utf-8') as f:
+            f.write(header[:-1] + ',"members":{')
+            separator = ''
+            for name, start, length in self._db.execute('SELECT name, start, length FROM members ORDER BY rowid'):
+                f.write(f'{separator}{json.dumps(name)}:[{start},{length}]')
+                separator = ','
+            f.write('}}')
+        return index_path
+    
+    def close(self):
+        """Drop the temporary database"""
+        self._db.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class FileWatcher:
+    """
+    Polls a directory for added, changed and removed files.
+    
+    Each poll compares the size and modification time of every matching file with
+    the previous poll, so it works the same on every platform without a
+    file-notification library. Polling a directory of a few dozen files takes well
+    under a millisecond.
+    
+    Usage:
+        watcher = FileWatcher('Classes', '-Documentation.xml')
+        while True:
+            changed, removed = watcher.poll()
+            ...
+    """
+    
+    def __init__(self, directory: str, suffix: str = ''):
+        """
+        Args:
+            directory: Directory to watch (not recursive)
+            suffix: Only watch files whose name ends with this suffix
+        """
+        self.directory = directory
+        self.suffix = suffix
+        self.snapshot = self._scan()
+    
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """Get the (size, mtime_ns) of every watched file, keyed by path"""
+        snapshot = {}
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(self.suffix) and entry.is_file():
+                        entry_stat = entry.stat()
+                        snapshot[entry.path] = (entry_stat.st_size, entry_stat.st_mtime_ns)
+        except FileNotFoundError:
+            pass
+        return snapshot
+    
+    def poll(self) -> Tuple[List[str], List[str]]:
+        """
+        Check for changes since the last poll (or since the watcher was created).
+        
+        Returns:
+            Tuple of (changed, removed) sorted path lists; changed includes new files
+        """
+        snapshot = self._scan()
+        changed = sorted(path for path, signature in snapshot.items() if self.snapshot.get(path) != signature)
+        removed = sorted(path for path in self.snapshot if path not in snapshot)
+        self.snapshot = snapshot
+        return changed, removed
+
+
 # Utility functions that don't fit into classes
 def get_class_name_from_path(xml_path: str) -> str:
     """
@@ -1047,6 +2081,24 @@ def get_class_name_from_path(xml_path: str) -> str:
     return filename.replace('.xml', '')
 
 
+def load_script(filename: str):
+    """
+    Import one of the hyphen-named scripts in Scripts/ as a module.
+    
+    Args:
+        filename: Script file name like "xml-to-wiki.py"
+        
+    Returns:
+        The imported module (named like "xml_to_wiki")
+    """
+    import importlib.util
+    spec = importlib.util.spec_from_file_location(filename[:-3].replace('-', '_'),
+                                                  os.path.join(os.path.dirname(os.path.abspath(__file__)), filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 def sort_members_by_type(members: List[Dict]) -> List[Dict]:
     """
     Sort members by type (Methods, Properties, Fields) and then alphabetically.